@@ -11,29 +11,72 @@
 # SPDX-License-Identifier: Apache-2.0
 # *******************************************************************************
 import importlib
-import os
 import pkgutil
-from collections.abc import Callable
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
 from pathlib import Path
+from typing import overload
 
 from sphinx.application import Sphinx
+from sphinx.config import Config
 from sphinx_needs import logging
 from sphinx_needs.data import NeedsView, SphinxNeedsData
 from sphinx_needs.need_item import NeedItem
 
-from src.extensions.score_metamodel.external_needs import connect_external_needs
-from src.extensions.score_metamodel.log import CheckLogger
+from src.extensions.score_metamodel.check_cache import run_local_checks_cached
+from src.extensions.score_metamodel.check_stats import STATS_FILE, CheckStatistics
+from src.extensions.score_metamodel.compiled_graph_checks import (
+    GraphCheck as GraphCheck,
+    compile_cycle_checks as compile_cycle_checks,
+    compile_orphan_checks as compile_orphan_checks,
+    get_graph_checks as get_graph_checks,
+)
+from src.extensions.score_metamodel.compiled_metamodel import (
+    CompiledNeedType as CompiledNeedType,
+    get_compiled_metamodel as get_compiled_metamodel,
+)
+from src.extensions.score_metamodel.derived import (
+    NeedView as NeedView,
+    need_view as need_view,
+)
+from src.extensions.score_metamodel.external_needs import (
+    connect_external_needs,
+    prefetch_external_needs,
+)
+from src.extensions.score_metamodel.graph_check_cache import (
+    IncrementalGraphChecks as IncrementalGraphChecks,
+    NeedResult as NeedResult,
+)
+from src.extensions.score_metamodel.log import (
+    CheckLogger,
+    FindingsLogger as FindingsLogger,
+)
 
 # Import and re-export some types and functions for easier access
 from src.extensions.score_metamodel.metamodel_types import (
     ProhibitedWordCheck as ProhibitedWordCheck,
     ScoreNeedType as ScoreNeedType,
 )
+from src.extensions.score_metamodel.need_graph import (
+    NeedGraph as NeedGraph,
+    forget_need_graph,
+    get_need_graph as get_need_graph,
+)
+from src.extensions.score_metamodel.prohibited_words import (
+    get_prohibited_words as get_prohibited_words,
+)
+from src.extensions.score_metamodel.report import write_reports
+from src.extensions.score_metamodel.validators import (
+    get_validators as get_validators,
+)
 from src.extensions.score_metamodel.yaml_parser import (
+    METAMODEL_VERSION,
     default_options as default_options,
     load_metamodel_data as load_metamodel_data,
 )
-from src.helper_lib import config_setdefault
+from src.helper_lib import config_setdefault, get_env_context
+from src.helper_lib.prefetch import reset_prefetches
 
 logger = logging.get_logger(__name__)
 
@@ -80,11 +123,57 @@ def discover_checks():
         importlib.import_module(f"{package_name}.{module_name}", __package__)
 
 
-def local_check(func: local_check_function):
-    """Use this decorator to mark a function as a local check."""
-    logger.debug(f"new local_check: {func}")
-    local_checks.append(func)
-    return func
+@dataclass(frozen=True)
+class CheckScope:
+    """Need types a local check applies to. Empty means: no restriction."""
+
+    types: frozenset[str] = frozenset()
+    tags: frozenset[str] = frozenset()
+
+    def applies_to(self, need_type: CompiledNeedType | None) -> bool:
+        if not self.types and not self.tags:
+            return True
+        if need_type is None:
+            return False
+        return need_type.directive in self.types or not self.tags.isdisjoint(
+            need_type.tags
+        )
+
+
+# Checks registered without a scope run for every need
+local_check_scopes: dict[local_check_function, CheckScope] = {}
+
+
+@overload
+def local_check(func: local_check_function) -> local_check_function: ...
+
+
+@overload
+def local_check(
+    *, types: Iterable[str] = (), tags: Iterable[str] = ()
+) -> Callable[[local_check_function], local_check_function]: ...
+
+
+def local_check(
+    func: local_check_function | None = None,
+    *,
+    types: Iterable[str] = (),
+    tags: Iterable[str] = (),
+) -> local_check_function | Callable[[local_check_function], local_check_function]:
+    """
+    Use this decorator to mark a function as a local check.
+
+    Use `@local_check(types=[...], tags=[...])` to run the check only for needs
+    of these directives, or of need types with any of these tags.
+    """
+
+    def register(func: local_check_function) -> local_check_function:
+        logger.debug(f"new local_check: {func}")
+        local_checks.append(func)
+        local_check_scopes[func] = CheckScope(frozenset(types), frozenset(tags))
+        return func
+
+    return register(func) if func is not None else register
 
 
 def graph_check(func: graph_check_function):
@@ -94,26 +183,44 @@ def graph_check(func: graph_check_function):
     return func
 
 
+def _local_checks_by_type(
+    app: Sphinx, checks: list[local_check_function], needs: Iterable[NeedItem]
+) -> dict[str, list[local_check_function]]:
+    """
+    Decide once per need type which of the local checks apply to it.
+    Needs are then only passed to these checks, in registration order.
+    """
+    metamodel = get_compiled_metamodel(app.config.needs_types)
+    checks_by_type: dict[str, list[local_check_function]] = {}
+    for need in needs:
+        need_type = need["type"]
+        if need_type not in checks_by_type:
+            scope_type = metamodel.types.get(need_type)
+            checks_by_type[need_type] = [
+                c
+                for c in checks
+                if local_check_scopes.get(c, CheckScope()).applies_to(scope_type)
+            ]
+            logger.debug(
+                f"Local checks for {need_type}: "
+                + ", ".join(c.__name__ for c in checks_by_type[need_type])
+            )
+    return checks_by_type
+
+
 def _run_checks(app: Sphinx, exception: Exception | None) -> None:
     # Do not run checks if an exception occurred during build
     if exception:
         return
 
-    # First of all postprocess the need links to convert
-    # type names into actual need types.
-    # This must be done before any checks are run.
-    # And it must be done after config was hashed, otherwise
-    # the config hash would include recusive linking between types.
-    postprocess_need_links(app.config.needs_types)
-
     # Filter out external needs, as checks are only intended to be run
     # on internal needs.
     needs_all_needs = SphinxNeedsData(app.env).get_needs_view()
 
     logger.debug(f"Running checks for {len(needs_all_needs)} needs")
 
-    ws_root = os.environ.get("BUILD_WORKSPACE_DIRECTORY", None)
-    cwd_or_ws_root = Path(ws_root) if ws_root else Path.cwd()
+    ws_root = get_env_context().ws_root
+    cwd_or_ws_root = ws_root if ws_root else Path.cwd()
     prefix = str(Path(app.srcdir).relative_to(cwd_or_ws_root))
 
     log = CheckLogger(logger, prefix)
@@ -130,10 +237,20 @@ def _run_checks(app: Sphinx, exception: Exception | None) -> None:
     )
     # Need-Local checks: checks which can be checked file-local, without a
     # graph of other needs.
-    for need in needs_local_needs.values():
-        for check in enabled_local_checks:
-            logger.debug(f"Running local check {check} for need {need['id']}")
-            check(app, need, log)
+    checks_by_type = _local_checks_by_type(
+        app, enabled_local_checks, needs_local_needs.values()
+    )
+    stats = CheckStatistics()
+    findings = run_local_checks_cached(
+        app,
+        list(needs_local_needs.values()),
+        checks_by_type,
+        log.prefix,
+        jobs=app.config.score_metamodel_check_jobs or app.parallel,
+        stats=stats,
+    )
+    for need_findings in findings:
+        log.add_findings(need_findings)
 
     # External needs: run a focused, info-only check on optional_links patterns
     # so that optional link issues from imported needs are visible but do not
@@ -145,7 +262,25 @@ def _run_checks(app: Sphinx, exception: Exception | None) -> None:
 
     for check in [c for c in graph_checks if is_check_enabled(c)]:
         logger.debug(f"Running graph check {check} for all needs")
+        log.check = check.__name__
+        found = log.warnings + log.infos
+        checked = log.needs_checked
+        start = time.perf_counter()
         check(app, needs_all_needs, log)
+        stats.record(
+            "graph",
+            check.__name__,
+            time.perf_counter() - start,
+            # As reported by the check, see CheckLogger.checked
+            log.needs_checked - checked,
+            log.warnings + log.infos - found,
+        )
+
+    logger.info(stats.summary())
+    if app.config.score_metamodel_check_stats:
+        stats.write_json(Path(app.outdir) / STATS_FILE)
+    if app.config.score_metamodel_report:
+        write_reports(Path(app.outdir), log.records)
 
     if log.warnings:
         logger.warning(
@@ -168,62 +303,17 @@ def _remove_prefix(word: str, prefixes: list[str]) -> str:
     return word
 
 
-def _get_need_type_for_need(app: Sphinx, need: NeedItem) -> ScoreNeedType:
-    for nt in app.config.needs_types:
-        if nt["directive"] == need["type"]:
-            return nt
-    raise ValueError(f"Need type {need['type']} not found in needs_types")
-
-
-def _resolve_linkable_types(
-    link_name: str,
-    link_value: str,
-    current_need_type: ScoreNeedType,
-    needs_types: list[ScoreNeedType],
-) -> list[ScoreNeedType | str]:
-    needs_types_dict = {nt["directive"]: nt for nt in needs_types}
-    link_values = [v.strip() for v in link_value.split(",")]
-    linkable_types: list[ScoreNeedType | str] = []
-    for v in link_values:
-        if v.startswith("^"):
-            linkable_types.append(v)  # keep regex as-is
-        else:
-            target_need_type = needs_types_dict.get(v)
-            if target_need_type is None:
-                logger.error(
-                    f"In metamodel.yaml: {current_need_type['directive']}, "
-                    f"link '{link_name}' references unknown type '{v}'."
-                )
-            else:
-                linkable_types.append(target_need_type)
-    return linkable_types
-
-
-def postprocess_need_links(needs_types_list: list[ScoreNeedType]):
-    """Convert link option strings into lists of target need types.
-
-    If a link value starts with '^' it is treated as a regex and left
-    unchanged. Otherwise it is a comma-separated list of type names which
-    are resolved to the corresponding ScoreNeedTypes.
+def compile_metamodel_rules(app: Sphinx, config: Config):
     """
-    for need_type in needs_types_list:
-        try:
-            link_dicts = (
-                need_type["mandatory_links"],
-                need_type["optional_links"],
-            )
-        except KeyError:
-            # TODO: remove the Sphinx-Needs defaults from our metamodel
-            # Example: {'directive': 'issue', 'title': 'Issue', 'prefix': 'IS_'}
-            continue
-
-        for link_dict in link_dicts:
-            for link_name, link_value in link_dict.items():
-                assert isinstance(link_value, str)  # so far all of them are strings
-
-                link_dict[link_name] = _resolve_linkable_types(  # pyright: ignore[reportArgumentType]
-                    link_name, link_value, need_type, needs_types_list
-                )
+    Compile the metamodel once all need types are known, so that errors in
+    metamodel.yaml (e.g. invalid regexes) show up right at the start.
+    """
+    _ = get_compiled_metamodel(config.needs_types)
+    _ = get_validators(config.needs_types, cache_dir=Path(app.doctreedir))
+    _ = get_prohibited_words(config.prohibited_words_checks)
+    _ = get_graph_checks(config.graph_checks)
+    _ = compile_cycle_checks(config.cycle_checks)
+    _ = compile_orphan_checks(config.orphan_checks)
 
 
 def setup(app: Sphinx) -> dict[str, str | bool]:
@@ -231,14 +321,16 @@ def setup(app: Sphinx) -> dict[str, str | bool]:
     config_setdefault(app.config, "needs_id_required", True)
     config_setdefault(app.config, "needs_id_regex", "^[A-Za-z0-9_-]{6,}")
 
-    # load metamodel.yaml via ruamel.yaml
-    metamodel = load_metamodel_data()
+    # load metamodel.yaml via ruamel.yaml, or its cached parsed form
+    metamodel = load_metamodel_data(cache_dir=Path(app.doctreedir))
 
     # Extend sphinx-needs config rather than overwriting
     app.config.needs_types += metamodel.needs_types
     app.config.needs_links.update(metamodel.needs_links)
     app.config.needs_fields.update(metamodel.needs_fields)
     app.config.graph_checks = metamodel.needs_graph_check
+    app.config.cycle_checks = metamodel.cycle_checks
+    app.config.orphan_checks = metamodel.orphan_checks
     app.config.prohibited_words_checks = metamodel.prohibited_words_checks
 
     # app.config.stop_words = metamodel["stop_words"]
@@ -248,10 +340,16 @@ def setup(app: Sphinx) -> dict[str, str | bool]:
     config_setdefault(app.config, "needs_reproducible_json", True)
     config_setdefault(app.config, "needs_json_remove_defaults", True)
 
+    # Kick off the (slow) lookup of external needs first thing after config-inited,
+    # so it runs concurrently with everything else happening at startup.
+    # Nothing prefetched for an earlier build (e.g. in esbonio) is reused.
+    _ = app.connect("config-inited", reset_prefetches, priority=50)
+    _ = app.connect("config-inited", prefetch_external_needs, priority=100)
     # sphinx-collections runs on default prio 500.
     # We need to populate the sphinx-collections config before that happens.
     # --> 499
     _ = app.connect("config-inited", connect_external_needs, priority=499)
+    _ = app.connect("config-inited", compile_metamodel_rules, priority=900)
 
     discover_checks()
 
@@ -264,10 +362,53 @@ def setup(app: Sphinx) -> dict[str, str | bool]:
         ),
     )
 
+    app.add_config_value(
+        "score_metamodel_check_jobs",
+        0,
+        rebuild="",
+        types=(int,),
+        description=(
+            "Number of processes running the local checks. "
+            "0 uses as many as the build itself (sphinx -j)."
+        ),
+    )
+
+    app.add_config_value(
+        "score_metamodel_check_cache",
+        True,
+        rebuild="",
+        types=(bool,),
+        description=(
+            "Only run checks for needs that changed since the last build (and for "
+            "graph checks the needs linked to them), reuse the findings of all others."
+        ),
+    )
+
+    app.add_config_value(
+        "score_metamodel_check_stats",
+        False,
+        rebuild="",
+        types=(bool,),
+        description=(
+            f"Write time & findings per check to {STATS_FILE} in the output directory"
+        ),
+    )
+
+    app.add_config_value(
+        "score_metamodel_report",
+        True,
+        rebuild="",
+        types=(bool,),
+        description=(
+            "Write all findings of the checks as JSON and SARIF to the output directory"
+        ),
+    )
+
+    _ = app.connect("env-updated", forget_need_graph)
     _ = app.connect("build-finished", _run_checks)
 
     return {
-        "version": "0.1",
+        "version": METAMODEL_VERSION,
         "parallel_read_safe": True,
         "parallel_write_safe": True,
     }
@@ -0,0 +1,157 @@
+# *******************************************************************************
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0
+#
+# SPDX-License-Identifier: Apache-2.0
+# *******************************************************************************
+"""
+Remember the findings of local checks between builds.
+
+Findings are stored per need, together with a digest of the need's content.
+Only needs with a different digest are checked again, the findings of all
+others are taken from the cache. The whole cache is dropped when the
+fingerprint changes: the metamodel, the check code or the enabled checks.
+
+Graph checks depend on other needs, see graph_check_cache.py for them.
+"""
+
+import hashlib
+import json
+import os
+import pickle
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from sphinx.application import Sphinx
+from sphinx_needs import logging
+from sphinx_needs.need_item import NeedItem
+
+from src.extensions.score_metamodel.check_stats import CheckStatistics
+from src.extensions.score_metamodel.log import Finding
+from src.extensions.score_metamodel.parallel_checks import (
+    LocalCheck,
+    run_local_checks,
+)
+
+logger = logging.get_logger(__name__)
+
+# Next to Sphinx' own environment.pickle
+CACHE_FILE = "score_metamodel_checks.pickle"
+# Bump when the format of the cache file changes
+_CACHE_VERSION = 2
+
+
+@dataclass
+class CheckCache:
+    fingerprint: str
+    # need id -> (digest of the need, findings)
+    needs: dict[str, tuple[str, list[Finding]]] = field(default_factory=dict)
+
+
+def content_digest(data: object) -> str:
+    # repr for anything json does not know, e.g. NeedItem parts or dataclasses
+    text = json.dumps(data, sort_keys=True, default=repr)
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+def need_digest(need: NeedItem) -> str:
+    return content_digest(dict(need))
+
+
+def code_digest() -> str:
+    """Source of this extension, including all checks."""
+    sha = hashlib.sha256()
+    root = Path(__file__).parent
+    for path in sorted(root.rglob("*.py")):
+        if "tests" not in path.relative_to(root).parts:
+            sha.update(path.read_bytes())
+    return sha.hexdigest()
+
+
+def fingerprint(
+    app: Sphinx, checks_by_type: dict[str, list[LocalCheck]], prefix: str
+) -> str:
+    """Everything besides the need itself that the findings depend on."""
+    checks = sorted({c.__qualname__ for cs in checks_by_type.values() for c in cs})
+    return content_digest(
+        {
+            "version": _CACHE_VERSION,
+            "code": code_digest(),
+            "checks": checks,
+            "needs_types": app.config.needs_types,
+            "prohibited_words_checks": app.config.prohibited_words_checks,
+            # Part of the location of findings, see CheckLogger._location
+            "prefix": prefix,
+            "runfiles": "RUNFILES_DIR" in os.environ
+            or "RUNFILES_MANIFEST_FILE" in os.environ,
+        }
+    )
+
+
+def load_cache(path: Path, fingerprint: str) -> CheckCache:
+    try:
+        with path.open("rb") as f:
+            cache = pickle.load(f)
+    except FileNotFoundError:
+        return CheckCache(fingerprint)
+    except Exception as e:
+        logger.debug(f"Ignoring unreadable check cache {path}: {e}")
+        return CheckCache(fingerprint)
+    if not isinstance(cache, CheckCache) or cache.fingerprint != fingerprint:
+        return CheckCache(fingerprint)
+    return cache
+
+
+def save_cache(path: Path, cache: object) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".tmp")
+    with tmp.open("wb") as f:
+        pickle.dump(cache, f, pickle.HIGHEST_PROTOCOL)
+    _ = tmp.replace(path)
+
+
+def run_local_checks_cached(
+    app: Sphinx,
+    needs: list[NeedItem],
+    checks_by_type: dict[str, list[LocalCheck]],
+    prefix: str,
+    jobs: int,
+    stats: CheckStatistics | None = None,
+) -> list[list[Finding]]:
+    """
+    Like run_local_checks, but only checks needs that changed since the last
+    build (or all of them, if 'score_metamodel_check_cache' is disabled).
+    """
+    if not app.config.score_metamodel_check_cache:
+        return run_local_checks(app, needs, checks_by_type, prefix, jobs, stats)
+
+    path = Path(app.doctreedir) / CACHE_FILE
+    old = load_cache(path, fingerprint(app, checks_by_type, prefix))
+    new = CheckCache(old.fingerprint)
+
+    changed: list[NeedItem] = []
+    for need in needs:
+        digest = need_digest(need)
+        cached = old.needs.get(need["id"])
+        if cached is not None and cached[0] == digest:
+            new.needs[need["id"]] = cached
+        else:
+            new.needs[need["id"]] = (digest, [])
+            changed.append(need)
+
+    logger.debug(f"Running local checks for {len(changed)} of {len(needs)} needs")
+    for need, findings in zip(
+        changed,
+        run_local_checks(app, changed, checks_by_type, prefix, jobs, stats),
+        strict=True,
+    ):
+        new.needs[need["id"]] = (new.needs[need["id"]][0], findings)
+
+    save_cache(path, new)
+    return [new.needs[need["id"]][1] for need in needs]
@@ -0,0 +1,73 @@
+# *******************************************************************************
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0
+#
+# SPDX-License-Identifier: Apache-2.0
+# *******************************************************************************
+"""
+How long each check took, how many needs it looked at and what it found.
+So that slow checks stand out, locally and in CI.
+"""
+
+import json
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+# Written to the output directory, if 'score_metamodel_check_stats' is enabled
+STATS_FILE = "score_metamodel_check_stats.json"
+
+
+@dataclass
+class CheckStats:
+    kind: str  # "local" or "graph"
+    seconds: float = 0.0
+    needs: int = 0
+    findings: int = 0
+
+
+class CheckStatistics:
+    def __init__(self):
+        self.checks: dict[str, CheckStats] = {}
+
+    def record(
+        self, kind: str, name: str, seconds: float, needs: int, findings: int
+    ) -> None:
+        stats = self.checks.get(name)
+        if stats is None:
+            stats = self.checks[name] = CheckStats(kind)
+        stats.seconds += seconds
+        stats.needs += needs
+        stats.findings += findings
+
+    def merge(self, other: "CheckStatistics") -> None:
+        """Add up the statistics of e.g. another worker."""
+        for name, s in other.checks.items():
+            self.record(s.kind, name, s.seconds, s.needs, s.findings)
+
+    def slowest_first(self) -> list[tuple[str, CheckStats]]:
+        return sorted(self.checks.items(), key=lambda c: (-c[1].seconds, c[0]))
+
+    def summary(self) -> str:
+        """A table of all checks, slowest first."""
+        width = max((len(name) for name in self.checks), default=5)
+        lines = [
+            "Metamodel checks (slowest first):",
+            f"  {'check':<{width}}  kind   time [s]    needs  findings",
+        ]
+        for name, s in self.slowest_first():
+            lines.append(
+                f"  {name:<{width}}  {s.kind:<5}  {s.seconds:8.3f}  "
+                f"{s.needs:7d}  {s.findings:8d}"
+            )
+        return "\n".join(lines)
+
+    def write_json(self, path: Path) -> None:
+        data = {name: asdict(s) for name, s in self.slowest_first()}
+        path.parent.mkdir(parents=True, exist_ok=True)
+        _ = path.write_text(json.dumps(data, indent=2), encoding="utf-8")
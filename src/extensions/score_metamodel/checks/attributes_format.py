@@ -11,22 +11,16 @@
 # SPDX-License-Identifier: Apache-2.0
 # *******************************************************************************
 
-import string
-from typing import cast
-
-from score_metamodel import CheckLogger, ProhibitedWordCheck, ScoreNeedType, local_check
+from score_metamodel import (
+    CheckLogger,
+    get_prohibited_words,
+    local_check,
+    need_view,
+)
 from sphinx.application import Sphinx
 from sphinx_needs.need_item import NeedItem
 
 
-def get_need_type(needs_types: list[ScoreNeedType], directive: str) -> ScoreNeedType:
-    for need_type in needs_types:
-        assert isinstance(need_type, dict), need_type
-        if need_type["directive"] == directive:
-            return need_type
-    raise ValueError(f"Need type {directive} not found in needs_types")
-
-
 # req-Id: tool_req__docs_common_attr_id_scheme
 @local_check
 def check_id_format(app: Sphinx, need: NeedItem, log: CheckLogger):
@@ -35,9 +29,9 @@ def check_id_format(app: Sphinx, need: NeedItem, log: CheckLogger):
     the requirement id or not.
     ---
     """
-    need_options = get_need_type(app.config.needs_types, need["type"])
-    expected_parts = need_options.get("parts", 3)
-    id_parts = need["id"].split("__")
+    view = need_view(need)
+    expected_parts = view.need_type(app.config.needs_types).parts
+    id_parts = view.id_parts
     id_parts_len = len(id_parts)
 
     if id_parts_len != expected_parts:
@@ -69,7 +63,7 @@ def check_id_length(app: Sphinx, need: NeedItem, log: CheckLogger):
     ---
     """
     max_length = 45
-    parts = need["id"].split("__")
+    parts = need_view(need).id_parts
     if parts[1] == "example_feature":
         max_length += 17  # _example_feature_
     if len(need["id"]) > max_length:
@@ -84,41 +78,15 @@ def check_id_length(app: Sphinx, need: NeedItem, log: CheckLogger):
         log.warning_for_option(need, "id", msg)
 
 
-def _check_options_for_prohibited_words(
-    prohibited_word_checks: ProhibitedWordCheck, need: NeedItem, log: CheckLogger
-):
-    options: list[str] = [
-        x for x in prohibited_word_checks.option_check if x != "types"
-    ]
-    for option in options:
-        forbidden_words = prohibited_word_checks.option_check[option]
-        option_value = need.get(option)
-        if not isinstance(option_value, str):
-            continue
-        option_text = cast(str, option_value)
-        for word in option_text.split():
-            normalized = word.strip(string.punctuation).lower()
-            if normalized in forbidden_words:
-                msg = (
-                    f"contains a weak word: `{normalized}` in option: `{option}`. "
-                    "Please revise the wording."
-                )
-                log.warning_for_need(need, msg)
-
-
 # req-Id: tool_req__docs_common_attr_desc_wording
 # req-Id: tool_req__docs_common_attr_title
 @local_check
 def check_for_prohibited_words(app: Sphinx, need: NeedItem, log: CheckLogger):
-    need_options = get_need_type(app.config.needs_types, need["type"])
-    prohibited_word_checks: list[ProhibitedWordCheck] = (
-        app.config.prohibited_words_checks
-    )
-    for check in prohibited_word_checks:
-        # Check if there are any type restrictions for this check
-        types_to_check = check.types
-        if types_to_check:
-            if any(tag in need_options.get("tags", []) for tag in types_to_check):
-                _check_options_for_prohibited_words(check, need, log)
-        else:
-            _check_options_for_prohibited_words(check, need, log)
+    need_type = need_view(need).need_type(app.config.needs_types)
+    prohibited_words = get_prohibited_words(app.config.prohibited_words_checks)
+    for option, word in prohibited_words.find(need, need_type.tags):
+        msg = (
+            f"contains a weak word: `{word}` in option: `{option}`. "
+            "Please revise the wording."
+        )
+        log.warning_for_need(need, msg)
@@ -10,12 +10,10 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 # *******************************************************************************
-import os
-import re
-
 from score_metamodel import (
     CheckLogger,
     local_check,
+    need_view,
 )
 from sphinx.application import Sphinx
 from sphinx_needs.need_item import NeedItem
@@ -29,7 +27,8 @@ def id_contains_feature(app: Sphinx, need: NeedItem, log: CheckLogger):
     However the feature part is checked here.
     """
 
-    parts = need["id"].split("__")
+    view = need_view(need)
+    parts = view.id_parts
 
     if len(parts) != 3 or need["id"].startswith("stkh_req__"):
         # No warning needed here, as this is already checked in the metamodel.
@@ -43,14 +42,11 @@ def id_contains_feature(app: Sphinx, need: NeedItem, log: CheckLogger):
     feature = parts[1]
     if feature == "example_feature":
         return
-    featureparts = re.split(r"[_-]", feature)
-
-    dir_docname = os.path.dirname(str(need.get("docname", "")))
+    featureparts = view.feature_parts
 
-    # If the 'rst' file is not in a directory, the above expression will be "".
-    # Even if the need itself has a docname. That's why we have this logic here.
+    # The directory of the 'rst' file, or its docname if it is not in a directory.
     # NOTE: This does not match the process requirements
-    docname = dir_docname if dir_docname else need.get("docname", "")
+    docname = view.docname_dir
 
     # allow if any feature part is contained in UID
     foundfeatpart = any(
@@ -0,0 +1,66 @@
+# *******************************************************************************
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0
+#
+# SPDX-License-Identifier: Apache-2.0
+# *******************************************************************************
+from score_metamodel import (
+    CheckLogger,
+    compile_cycle_checks,
+    compile_orphan_checks,
+    get_need_graph,
+    graph_check,
+)
+from sphinx.application import Sphinx
+from sphinx_needs.data import NeedsView
+
+# Both are reported as non-fatal for now, until existing documentation is cleaned up
+
+
+@graph_check
+def check_link_cycles(app: Sphinx, all_needs: NeedsView, log: CheckLogger):
+    """
+    Needs linking to each other in circles, e.g. requirements satisfying each
+    other. Reported once per cycle, at the first local need in it.
+    """
+    graph = get_need_graph(app, all_needs)
+    for check in compile_cycle_checks(app.config.cycle_checks):
+        log.checked(len(graph.by_id))
+        for cycle in graph.cycles(check.links):
+            local = [i for i in cycle if not graph.by_id[i]["is_external"]]
+            if not local:
+                continue
+            members = ", ".join(f"`{i}`" for i in cycle)
+            msg = (
+                f"Circular `{', '.join(check.links)}` links between {members}. "
+                f"Explanation: {check.explanation}"
+            )
+            log.warning_for_need(graph.by_id[local[0]], msg, is_new_check=True)
+
+
+@graph_check
+def check_orphans(app: Sphinx, all_needs: NeedsView, log: CheckLogger):
+    """Needs which can not be reached from any root need."""
+    graph = get_need_graph(app, all_needs)
+    for check in compile_orphan_checks(app.config.orphan_checks):
+        roots = [
+            need_id
+            for need_id, need in graph.by_id.items()
+            if need["type"] in check.roots
+        ]
+        reachable = graph.reachable_from(roots, check.links)
+        candidates = graph.local_needs(check.types)
+        log.checked(len(candidates))
+        for need in candidates:
+            if need["id"] not in reachable:
+                msg = (
+                    f"Not reachable from any `{', '.join(check.roots)}` over "
+                    f"`{', '.join(check.links)}`. Explanation: {check.explanation}"
+                )
+                log.warning_for_need(need, msg, is_new_check=True)
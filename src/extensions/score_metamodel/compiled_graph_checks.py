@@ -0,0 +1,301 @@
+# *******************************************************************************
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0
+#
+# SPDX-License-Identifier: Apache-2.0
+# *******************************************************************************
+"""
+The 'graph_checks' of metamodel.yaml, prepared once for checking.
+
+Conditions like "safety == QM" or {"and": [...]} are parsed once into
+predicates, i.e. plain functions of (need, log). So an invalid condition fails
+the build right at the start, and checking a need is a direct function call.
+
+Besides the direct parents ('check'), a graph check may require a 'trace': a
+path over one or more link types to some need matching a selection, e.g. from
+every ASIL component requirement via satisfies to an ASIL stakeholder
+requirement.
+
+'cycle_checks' and 'orphan_checks' only depend on the structure of the links.
+"""
+
+import operator
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from functools import reduce
+from typing import Any, cast
+
+from sphinx_needs.need_item import NeedItem
+
+from src.extensions.score_metamodel.log import CheckLogger
+
+Condition = str | dict[str, list[Any]]
+Predicate = Callable[[NeedItem, CheckLogger], bool]
+
+_COMPARISONS: dict[str, Callable[[Any, Any], bool]] = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    ">": operator.gt,
+    "<": operator.lt,
+    ">=": operator.ge,
+    "<=": operator.le,
+}
+
+_COMBINATIONS: dict[str, Callable[[bool, bool], bool]] = {
+    "and": operator.and_,
+    "or": operator.or_,
+    "xor": operator.xor,
+}
+
+
+def compile_check(check: str) -> Predicate:
+    """
+    A single check like "status == valid": attribute, operator and value,
+    separated by single spaces.
+    """
+    parts = check.split(" ")
+    if len(parts) != 3:
+        raise ValueError(f"Invalid check defined: {check}")
+    attribute, op, value = parts
+    if op not in _COMPARISONS:
+        raise ValueError(f"Binary Operator not defined: {op}")
+    compare = _COMPARISONS[op]
+    missing = f"Attribute not defined: {attribute}"
+
+    def predicate(need: NeedItem, log: CheckLogger) -> bool:
+        if attribute not in need:
+            log.warning_for_need(need, missing)
+            return False
+        return compare(need[attribute], value)
+
+    return predicate
+
+
+def _compile_not(operands: object) -> Predicate:
+    if not isinstance(operands, list) or len(cast(list[Any], operands)) != 1:
+        raise ValueError("Operator 'not' requires exactly one operand.")
+    operand = compile_condition(cast(list[Condition], operands)[0])
+    return lambda need, log: not operand(need, log)
+
+
+def _compile_combination(name: str, operands: object) -> Predicate:
+    if not isinstance(operands, list) or not operands:
+        raise ValueError(f"Operator '{name}' requires at least one operand.")
+    compiled = tuple(compile_condition(c) for c in cast(list[Condition], operands))
+    combine = _COMBINATIONS[name]
+
+    def predicate(need: NeedItem, log: CheckLogger) -> bool:
+        # All operands are evaluated, so each reports its missing attributes
+        return reduce(combine, [operand(need, log) for operand in compiled])
+
+    return predicate
+
+
+def compile_condition(condition: Condition) -> Predicate:
+    """
+    A check, or a combination of conditions: {"and"|"or"|"xor": [...]} or
+    {"not": [condition]}.
+    """
+    if not isinstance(condition, dict):
+        if not isinstance(condition, str):
+            raise ValueError(
+                f"Invalid condition type: condition ({type(condition)}),"
+                " expected str or dict."
+            )
+        return compile_check(condition)
+
+    if not condition:
+        raise ValueError("Empty condition.")
+    name, operands = next(iter(condition.items()))
+    if name == "not":
+        return _compile_not(operands)
+    if name in _COMBINATIONS:
+        return _compile_combination(name, operands)
+    raise ValueError(f"Unsupported condition operator: {name}")
+
+
+@dataclass(frozen=True)
+class NeedSelection:
+    # Whether 'types' are the selected need types, or the excluded ones
+    include: bool
+    types: tuple[str, ...]
+    condition: Predicate
+
+    def selects(self, need: NeedItem, log: CheckLogger) -> bool:
+        if (need["type"] in self.types) != self.include:
+            return False
+        return self.condition(need, log)
+
+
+@dataclass(frozen=True)
+class ParentCheck:
+    # Link attribute of the selected need, e.g. 'satisfies'
+    link: str
+    # As written in metamodel.yaml, for messages
+    condition: Condition
+    predicate: Predicate
+
+
+@dataclass(frozen=True)
+class TraceCheck:
+    """Some need selected by 'to' must be reachable over 'links', in any hops."""
+
+    links: tuple[str, ...]
+    to: NeedSelection
+    # The finding if there is no such need
+    message: str
+
+
+@dataclass(frozen=True)
+class GraphCheck:
+    name: str
+    needs: NeedSelection
+    parents: tuple[ParentCheck, ...]
+    traces: tuple[TraceCheck, ...]
+    explanation: str
+
+
+def _compile_selection(selection: dict[str, Any]) -> NeedSelection:
+    mode = next(iter(selection), None)
+    if mode not in ("include", "exclude"):
+        raise ValueError(f"Invalid need selection: {selection}")
+    types = tuple(t.lstrip() for t in str(selection[mode]).split(","))
+    if "condition" not in selection:
+        raise ValueError(f"Invalid selection: {selection}")
+    return NeedSelection(
+        mode == "include", types, compile_condition(selection["condition"])
+    )
+
+
+def _names(value: object) -> tuple[str, ...]:
+    """'satisfies, fulfils' -> ('satisfies', 'fulfils'), empty if any is empty."""
+    names = tuple(n.strip() for n in str(value or "").split(","))
+    return names if all(names) else ()
+
+
+def _explanation(name: str, config: dict[str, Any]) -> str:
+    explanation = config.get("explanation", "")
+    assert explanation != "", (
+        f"Explanation for graph check {name} is missing. "
+        "Explanations are mandatory for graph checks."
+    )
+    return explanation
+
+
+def _compile_trace(trace: dict[str, Any]) -> TraceCheck:
+    links = _names(trace.get("links"))
+    to = trace.get("to")
+    if not links or not isinstance(to, dict):
+        raise ValueError(f"Invalid trace, `links` and `to` are required: {trace}")
+    to = cast(dict[str, Any], to)
+    target = _compile_selection(to)
+    types = ", ".join(target.types)
+    return TraceCheck(
+        links,
+        target,
+        f"No trace over `{', '.join(links)}` to a need of type "
+        f"`{types if target.include else 'not ' + types}` "
+        f"with condition `{to['condition']}`.",
+    )
+
+
+def compile_graph_check(name: str, config: dict[str, Any]) -> GraphCheck:
+    explanation = _explanation(name, config)
+    needs = _compile_selection(cast(dict[str, Any], config.get("needs") or {}))
+    if "check" not in config and "trace" not in config:
+        raise ValueError(f"Graph check {name} needs a `check` or a `trace`.")
+    checks = cast(dict[str, Condition], config.get("check") or {})
+    # One trace, or a list of them
+    traces = cast(dict[str, Any] | list[dict[str, Any]], config.get("trace") or [])
+    if isinstance(traces, dict):
+        traces = [traces]
+    return GraphCheck(
+        name=name,
+        needs=needs,
+        parents=tuple(
+            ParentCheck(link, condition, compile_condition(condition))
+            for link, condition in checks.items()
+        ),
+        traces=tuple(_compile_trace(t) for t in traces),
+        explanation=explanation,
+    )
+
+
+def compile_graph_checks(
+    graph_checks: Mapping[str, dict[str, Any]],
+) -> tuple[GraphCheck, ...]:
+    return tuple(
+        compile_graph_check(name, config) for name, config in graph_checks.items()
+    )
+
+
+@dataclass(frozen=True)
+class CycleCheck:
+    """Needs must not link to each other in circles over 'links'."""
+
+    name: str
+    links: tuple[str, ...]
+    explanation: str
+
+
+@dataclass(frozen=True)
+class OrphanCheck:
+    """Needs of 'types' must be reachable from a need of 'roots' over 'links'."""
+
+    name: str
+    types: tuple[str, ...]
+    roots: tuple[str, ...]
+    links: tuple[str, ...]
+    explanation: str
+
+
+def compile_cycle_checks(
+    cycle_checks: Mapping[str, dict[str, Any]],
+) -> tuple[CycleCheck, ...]:
+    compiled: list[CycleCheck] = []
+    for name, config in cycle_checks.items():
+        links = _names(config.get("links"))
+        if not links:
+            raise ValueError(f"Cycle check {name} needs `links`.")
+        compiled.append(CycleCheck(name, links, _explanation(name, config)))
+    return tuple(compiled)
+
+
+def compile_orphan_checks(
+    orphan_checks: Mapping[str, dict[str, Any]],
+) -> tuple[OrphanCheck, ...]:
+    compiled: list[OrphanCheck] = []
+    for name, config in orphan_checks.items():
+        types, roots, links = (
+            _names(config.get(key)) for key in ("include", "roots", "links")
+        )
+        if not types or not roots or not links:
+            raise ValueError(
+                f"Orphan check {name} needs `include`, `roots` and `links`."
+            )
+        compiled.append(
+            OrphanCheck(name, types, roots, links, _explanation(name, config))
+        )
+    return tuple(compiled)
+
+
+_compiled: tuple[Mapping[str, Any], tuple[GraphCheck, ...]] | None = None
+
+
+def get_graph_checks(
+    graph_checks: Mapping[str, dict[str, Any]],
+) -> tuple[GraphCheck, ...]:
+    """
+    Return the compiled form of 'graph_checks' (usually app.config.graph_checks),
+    compiled only once per dict.
+    """
+    global _compiled
+    if _compiled is None or _compiled[0] is not graph_checks:
+        _compiled = (graph_checks, compile_graph_checks(graph_checks))
+    return _compiled[1]
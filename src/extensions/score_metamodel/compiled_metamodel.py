@@ -0,0 +1,210 @@
+# *******************************************************************************
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0
+#
+# SPDX-License-Identifier: Apache-2.0
+# *******************************************************************************
+"""
+The metamodel, prepared once for checking.
+
+The ScoreNeedType dicts (as sphinx-needs wants them) contain raw regex strings
+and reference link targets by type name. As checks run for every single need,
+everything that only depends on the metamodel is done here exactly once:
+patterns are compiled, link targets resolved and allowed options collected.
+"""
+
+import re
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from types import MappingProxyType
+
+from sphinx_needs import logging
+
+from src.extensions.score_metamodel.metamodel_types import ScoreNeedType
+from src.extensions.score_metamodel.yaml_parser import default_options
+
+logger = logging.get_logger(__name__)
+
+# Links to imported needs may carry a namespace prefix, e.g. 'EXT_'
+NAMESPACE_PREFIX = re.compile(r"^[A-Z]+_")
+
+
+# Longer values (e.g. content) are practically unique, remembering them is useless
+_MAX_REMEMBERED_LENGTH = 200
+# Distinct values remembered per rule. Rules live as long as the process (e.g.
+# esbonio), so the memo starts over once it is full.
+_MAX_REMEMBERED_VALUES = 4096
+
+
+@dataclass(frozen=True)
+class OptionRule:
+    name: str
+    pattern: re.Pattern[str]
+    # Most values (status, safety, link targets, ...) repeat across thousands of
+    # needs, so each distinct value is only matched once per build.
+    _results: dict[str, bool] = field(
+        default_factory=dict, kw_only=True, compare=False, repr=False
+    )
+
+    def matches(self, value: str) -> bool:
+        result = self._results.get(value)
+        if result is None:
+            result = self.pattern.match(value) is not None
+            if len(value) <= _MAX_REMEMBERED_LENGTH:
+                if len(self._results) >= _MAX_REMEMBERED_VALUES:
+                    self._results.clear()
+                self._results[value] = result
+        return result
+
+
+@dataclass(frozen=True)
+class LinkRule(OptionRule):
+    # What may be linked, for warnings. E.g. "Feature Requirement (feat_req)"
+    allowed: tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class CompiledNeedType:
+    directive: str
+    title: str
+    tags: frozenset[str]
+    parts: int
+    mandatory_options: tuple[OptionRule, ...]
+    optional_options: tuple[OptionRule, ...]
+    mandatory_links: tuple[LinkRule, ...]
+    optional_links: tuple[LinkRule, ...]
+    # Including the default options of sphinx & sphinx-needs
+    allowed_options: frozenset[str]
+
+
+@dataclass(frozen=True)
+class CompiledMetamodel:
+    types: Mapping[str, CompiledNeedType]
+
+    def need_type(self, directive: str) -> CompiledNeedType:
+        try:
+            return self.types[directive]
+        except KeyError:
+            raise ValueError(
+                f"Need type {directive} not found in needs_types"
+            ) from None
+
+
+def _compile_pattern(directive: str, field: str, pattern: str) -> re.Pattern[str]:
+    try:
+        return re.compile(pattern)
+    except Exception as e:
+        raise TypeError(
+            f"Error in metamodel.yaml at {directive}->{field}: "
+            f"pattern `{pattern}` is not a valid regex pattern."
+        ) from e
+
+
+def _compile_options(directive: str, options: dict[str, str]) -> tuple[OptionRule, ...]:
+    return tuple(
+        OptionRule(name, _compile_pattern(directive, name, pattern))
+        for name, pattern in options.items()
+    )
+
+
+def _compile_link(
+    need_type: ScoreNeedType,
+    link_name: str,
+    link_value: str,
+    types_by_directive: dict[str, ScoreNeedType],
+) -> LinkRule:
+    """
+    A link value is a comma-separated list of type names, or regexes starting
+    with '^'. Types are resolved to the pattern of their ids.
+    """
+    patterns: list[str] = []
+    allowed: list[str] = []
+    for v in (v.strip() for v in link_value.split(",")):
+        if v.startswith("^"):
+            patterns.append(v)
+            allowed.append(v)
+        elif (target := types_by_directive.get(v)) is not None:
+            patterns.append(target["mandatory_options"]["id"])
+            allowed.append(f"{target['title']} ({target['directive']})")
+        else:
+            logger.error(
+                f"In metamodel.yaml: {need_type['directive']}, "
+                f"link '{link_name}' references unknown type '{v}'."
+            )
+    pattern = "|".join(patterns)
+    return LinkRule(
+        link_name,
+        _compile_pattern(need_type["directive"], link_name, pattern),
+        tuple(allowed),
+    )
+
+
+def _compile_need_type(
+    need_type: ScoreNeedType, types_by_directive: dict[str, ScoreNeedType]
+) -> CompiledNeedType:
+    directive = need_type["directive"]
+    # Types not defined in metamodel.yaml (e.g. sphinx-needs defaults) have no rules
+    options = {
+        o: need_type.get(o, {})
+        for o in (
+            "mandatory_options",
+            "optional_options",
+            "mandatory_links",
+            "optional_links",
+        )
+    }
+    links = {
+        o: tuple(
+            _compile_link(need_type, name, value, types_by_directive)
+            for name, value in options[o].items()
+        )
+        for o in ("mandatory_links", "optional_links")
+    }
+    return CompiledNeedType(
+        directive=directive,
+        title=need_type.get("title", ""),
+        tags=frozenset(need_type.get("tags", [])),
+        parts=need_type.get("parts", 3),
+        mandatory_options=_compile_options(directive, options["mandatory_options"]),
+        optional_options=_compile_options(directive, options["optional_options"]),
+        mandatory_links=links["mandatory_links"],
+        optional_links=links["optional_links"],
+        allowed_options=frozenset(
+            default_options().union(*(o.keys() for o in options.values()))
+        ),
+    )
+
+
+def compile_metamodel(needs_types: list[ScoreNeedType]) -> CompiledMetamodel:
+    # Link targets are looked up by name, a later definition of a type wins
+    types_by_directive = {nt["directive"]: nt for nt in needs_types}
+    # Checked types: the first definition wins
+    compiled: dict[str, CompiledNeedType] = {}
+    for nt in needs_types:
+        if nt["directive"] not in compiled:
+            compiled[nt["directive"]] = _compile_need_type(nt, types_by_directive)
+    return CompiledMetamodel(MappingProxyType(compiled))
+
+
+_compiled: tuple[list[ScoreNeedType], int, CompiledMetamodel] | None = None
+
+
+def get_compiled_metamodel(needs_types: list[ScoreNeedType]) -> CompiledMetamodel:
+    """
+    Return the compiled form of 'needs_types' (usually app.config.needs_types).
+    It is only compiled again when a different or extended list is passed.
+    """
+    global _compiled
+    if (
+        _compiled is None
+        or _compiled[0] is not needs_types
+        or _compiled[1] != len(needs_types)
+    ):
+        _compiled = (needs_types, len(needs_types), compile_metamodel(needs_types))
+    return _compiled[2]
@@ -0,0 +1,143 @@
+# *******************************************************************************
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0
+#
+# SPDX-License-Identifier: Apache-2.0
+# *******************************************************************************
+"""
+Values derived from a need, shared by all checks of that need.
+
+Several checks split the id, look up the need type etc. With
+`need_view(need)` that is done once per need, on first use:
+
+    parts = need_view(need).id_parts
+
+Views are only shared within a check run, see need_views().
+"""
+
+import os
+import re
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from functools import cached_property
+from typing import cast
+
+from sphinx_needs.need_item import NeedItem
+
+from src.extensions.score_metamodel.compiled_metamodel import (
+    NAMESPACE_PREFIX,
+    CompiledNeedType,
+    get_compiled_metamodel,
+)
+from src.extensions.score_metamodel.metamodel_types import ScoreNeedType
+
+
+def normalized_values(
+    need: NeedItem, key: str, remove_prefix: bool = False
+) -> list[str]:
+    """Normalize a raw value into a list of strings."""
+    raw_value = need.get(key, None)
+    if not raw_value:
+        return []
+    if isinstance(raw_value, str):
+        if remove_prefix:
+            return [NAMESPACE_PREFIX.sub("", raw_value)]
+        return [raw_value]
+    if isinstance(raw_value, list):
+        # Verify all elements are strings
+        raw_list = cast(list[object], raw_value)
+        for item in raw_list:
+            if not isinstance(item, str):
+                raise ValueError
+        str_list = cast(list[str], raw_value)
+        if remove_prefix:
+            # If a value starts with uppercase letters followed by an underscore,
+            # remove them.
+            return [NAMESPACE_PREFIX.sub("", v) for v in str_list]
+        return str_list
+    raise ValueError
+
+
+class NeedView:
+    def __init__(self, need: NeedItem):
+        self.need = need
+        self._values: dict[tuple[str, bool], list[str]] = {}
+        self._need_type: CompiledNeedType | None = None
+
+    @cached_property
+    def id_parts(self) -> list[str]:
+        return self.need["id"].split("__")
+
+    @cached_property
+    def feature_parts(self) -> list[str]:
+        """The words of the feature, e.g. 'feat_req__some_feature__x' -> some, feature"""
+        if len(self.id_parts) < 2:
+            return []
+        return re.split(r"[_-]", self.id_parts[1])
+
+    @cached_property
+    def docname_dir(self) -> str:
+        """Directory of the document, or the docname for documents at the root."""
+        docname = str(self.need.get("docname", "") or "")
+        return os.path.dirname(docname) or docname
+
+    def values(self, key: str, remove_prefix: bool = False) -> list[str]:
+        """Option or link 'key' as list of strings, see normalized_values."""
+        values = self._values.get((key, remove_prefix))
+        if values is None:
+            values = self._values[(key, remove_prefix)] = normalized_values(
+                self.need, key, remove_prefix
+            )
+        return values
+
+    def need_type(self, needs_types: list[ScoreNeedType]) -> CompiledNeedType:
+        if self._need_type is None:
+            metamodel = get_compiled_metamodel(needs_types)
+            self._need_type = metamodel.need_type(self.need["type"])
+        return self._need_type
+
+
+# Views of the current check run, per thread. By id() of the need: the view
+# references the need, so the id stays unique while the run lasts.
+_runs = threading.local()
+
+
+@contextmanager
+def need_views() -> Iterator[None]:
+    """
+    Share the views of needs between all checks within this block. Afterwards
+    they are dropped, so neither needs nor derived values outlive a check run.
+    """
+    views: dict[int, NeedView] = {}
+    previous: dict[int, NeedView] | None = getattr(_runs, "views", None)
+    _runs.views = views
+    try:
+        yield
+    finally:
+        views.clear()
+        _runs.views = previous
+
+
+def need_view(need: NeedItem) -> NeedView:
+    """The view of 'need', shared within need_views(). Outside a fresh one."""
+    views: dict[int, NeedView] | None = getattr(_runs, "views", None)
+    if views is None:
+        return NeedView(need)
+    view = views.get(id(need))
+    if view is None:
+        view = views[id(need)] = NeedView(need)
+    return view
+
+
+def release_need_view(need: NeedItem) -> None:
+    """Drop the view of a need, once all checks are done with it."""
+    views: dict[int, NeedView] | None = getattr(_runs, "views", None)
+    if views is not None:
+        _ = views.pop(id(need), None)
@@ -14,14 +14,17 @@
 import json
 import subprocess
 from dataclasses import dataclass
+from functools import partial
 from pathlib import Path
+from typing import Any
 
 from sphinx.application import Sphinx
 from sphinx.config import Config
 from sphinx.util import logging
 from sphinx_needs.needsfile import NeedsList
 
-from src.helper_lib import get_runfiles_dir
+from src.helper_lib import get_env_context
+from src.helper_lib.prefetch import await_prefetched, prefetch
 
 logger = logging.getLogger(__name__)
 
@@ -149,14 +152,25 @@ def get_external_needs_source(external_needs_source: str) -> list[ExternalNeedsS
     return external_needs
 
 
-def add_external_needs_json(e: ExternalNeedsSource, config: Config):
+def _needs_json_path(e: ExternalNeedsSource) -> Path:
     json_file_raw = f"{e.bazel_module}+/{e.target}/_build/needs/needs.json"
-    r = get_runfiles_dir()
-    json_file = r / json_file_raw
-    logger.debug(f"External needs.json: {json_file}")
+    return get_env_context().runfiles_dir / json_file_raw
+
+
+def _read_needs_json(json_file: Path) -> dict[str, Any] | None:
     try:
-        needs_json_data = json.loads(Path(json_file).read_text(encoding="utf-8"))  # pyright: ignore[reportAny]
+        return json.loads(Path(json_file).read_text(encoding="utf-8"))  # pyright: ignore[reportAny]
     except FileNotFoundError:
+        return None
+
+
+def add_external_needs_json(e: ExternalNeedsSource, config: Config):
+    json_file = _needs_json_path(e)
+    logger.debug(f"External needs.json: {json_file}")
+    needs_json_data = await_prefetched(
+        f"needs_json:{json_file}", partial(_read_needs_json, json_file)
+    )
+    if needs_json_data is None:
         logger.error(
             f"Could not find external needs JSON file at {json_file}. "
             + "Something went terribly wrong. "
@@ -177,7 +191,7 @@ def add_external_needs_json(e: ExternalNeedsSource, config: Config):
 def add_external_docs_sources(e: ExternalNeedsSource, config: Config):
     # Note that bazel does NOT write the files under e.target!
     # {e.bazel_module}+ matches the original git layout!
-    r = get_runfiles_dir()
+    r = get_env_context().runfiles_dir
     if "ide_support.runfiles" in str(r):
         logger.error("Combo builds are currently only supported with Bazel.")
         return
@@ -194,10 +208,37 @@ def add_external_docs_sources(e: ExternalNeedsSource, config: Config):
     logger.info(f"Added external docs source: {docs_source_path} -> {e.bazel_module}")
 
 
+def _fetch_external_needs(external_needs_source: str) -> list[ExternalNeedsSource]:
+    """
+    Runs in the background: find the external needs sources (possibly via a
+    slow 'bazel query') and start loading all their needs.json files at once.
+    """
+    external_needs = get_external_needs_source(external_needs_source)
+    for e in external_needs:
+        if e.target == "needs_json":
+            json_file = _needs_json_path(e)
+            prefetch(f"needs_json:{json_file}", partial(_read_needs_json, json_file))
+    return external_needs
+
+
+def prefetch_external_needs(app: Sphinx, config: Config):
+    """
+    Start looking up external needs as early as possible,
+    'connect_external_needs' waits for the results.
+    """
+    prefetch(
+        "external_needs_sources",
+        partial(_fetch_external_needs, config.external_needs_source),
+    )
+
+
 def connect_external_needs(app: Sphinx, config: Config):
     extend_needs_json_exporter(config, ["project_url"])
 
-    external_needs = get_external_needs_source(app.config.external_needs_source)
+    external_needs = await_prefetched(
+        "external_needs_sources",
+        partial(get_external_needs_source, app.config.external_needs_source),
+    )
 
     # this sets the default value - required for the needs-config-writer
     # setting 'needscfg_exclude_defaults = True' to see the diff
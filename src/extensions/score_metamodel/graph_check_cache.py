@@ -0,0 +1,180 @@
+# *******************************************************************************
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0
+#
+# SPDX-License-Identifier: Apache-2.0
+# *******************************************************************************
+"""
+Remember the results of graph checks between builds.
+
+Like for local checks, a digest of every need is stored. As the digest covers
+the links of a need, comparing them tells which needs and which links changed.
+Results of a need are only computed again if they could depend on a changed
+need: for parent checks the need itself and its direct parents, for traces
+everything the need can reach. All others are taken from the cache.
+"""
+
+import os
+import pickle
+from collections import deque
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from sphinx.application import Sphinx
+from sphinx_needs import logging
+
+from src.extensions.score_metamodel.check_cache import (
+    code_digest,
+    content_digest,
+    need_digest,
+    save_cache,
+)
+from src.extensions.score_metamodel.log import Finding
+from src.extensions.score_metamodel.need_graph import NeedGraph, link_types
+
+logger = logging.get_logger(__name__)
+
+# Next to Sphinx' own environment.pickle
+CACHE_FILE = "score_metamodel_graph_checks.pickle"
+# Bump when the format of the cache file changes
+_CACHE_VERSION = 1
+
+
+@dataclass(frozen=True)
+class NeedResult:
+    """Selection and parent checks of one graph check for one need."""
+
+    selected: bool
+    # Findings of the selection condition, and of the parent checks
+    selection: list[Finding]
+    parents: list[Finding]
+
+
+@dataclass
+class GraphCheckCache:
+    fingerprint: str
+    # need id -> digest of the need, for all needs
+    digests: dict[str, str] = field(default_factory=dict)
+    # graph check -> need id -> result
+    results: dict[str, dict[str, NeedResult]] = field(default_factory=dict)
+    # graph check -> per trace: need id -> whether it reaches a target
+    reached: dict[str, list[dict[str, bool]]] = field(default_factory=dict)
+
+
+def fingerprint(app: Sphinx, prefix: str) -> str:
+    """Everything besides the needs that the results depend on."""
+    return content_digest(
+        {
+            "version": _CACHE_VERSION,
+            "code": code_digest(),
+            "graph_checks": app.config.graph_checks,
+            "links": link_types(app),
+            # Part of the location of findings, see CheckLogger._location
+            "prefix": prefix,
+            "runfiles": "RUNFILES_DIR" in os.environ
+            or "RUNFILES_MANIFEST_FILE" in os.environ,
+        }
+    )
+
+
+def _load(path: Path, fingerprint: str) -> GraphCheckCache:
+    try:
+        with path.open("rb") as f:
+            cache = pickle.load(f)
+    except FileNotFoundError:
+        return GraphCheckCache(fingerprint)
+    except Exception as e:
+        logger.debug(f"Ignoring unreadable graph check cache {path}: {e}")
+        return GraphCheckCache(fingerprint)
+    if not isinstance(cache, GraphCheckCache) or cache.fingerprint != fingerprint:
+        return GraphCheckCache(fingerprint)
+    return cache
+
+
+class IncrementalGraphChecks:
+    """
+    Results of the last build, and the results of this build as they are
+    computed. Without 'score_metamodel_check_cache' nothing is reused or saved.
+    """
+
+    def __init__(self, app: Sphinx, graph: NeedGraph, prefix: str):
+        self._graph = graph
+        self._enabled: bool = app.config.score_metamodel_check_cache
+        self._path = Path(app.doctreedir) / CACHE_FILE
+        if self._enabled:
+            digests = {i: need_digest(need) for i, need in graph.by_id.items()}
+            old = _load(self._path, fingerprint(app, prefix))
+        else:
+            digests = {}
+            old = GraphCheckCache("")
+        self._old = old
+        self._new = GraphCheckCache(old.fingerprint, digests)
+        self.changed: set[str] = {
+            i for i, d in digests.items() if old.digests.get(i) != d
+        } | (old.digests.keys() - digests.keys())
+        logger.debug(
+            f"Graph checks: {len(self.changed)} of {len(digests)} needs changed"
+        )
+
+    def _children(self, ids: Iterable[str], links: Iterable[str]) -> set[str]:
+        """Needs linking to 'ids' over 'links', i.e. 'links' followed backwards."""
+        return {
+            child
+            for i in ids
+            for link in links
+            for child in (
+                # 'x_back' is followed against 'x', so backwards means along 'x'
+                self._graph.parents(i, link.removesuffix("_back"))
+                if link.endswith("_back")
+                else self._graph.children(i, link)
+            )
+        }
+
+    def _ancestors(self, ids: Iterable[str], links: Iterable[str]) -> set[str]:
+        found = set(ids)
+        queue = deque(found)
+        while queue:
+            for child in self._children([queue.popleft()], links):
+                if child not in found:
+                    found.add(child)
+                    queue.append(child)
+        return found
+
+    def results(self, check: str, links: Iterable[str]) -> Mapping[str, NeedResult]:
+        """
+        Cached results of 'check' (with parent checks over 'links') which are
+        still valid, i.e. of needs which did not change and whose parents did not.
+        """
+        cached = self._old.results.get(check, {})
+        if not cached:
+            return {}
+        affected = self.changed | self._children(self.changed, links)
+        return {i: r for i, r in cached.items() if i not in affected}
+
+    def reached(self, check: str, trace: int, links: Iterable[str]) -> dict[str, bool]:
+        """Cached reachability of a trace, for needs that can not reach changes."""
+        cached = self._old.reached.get(check, [])
+        if trace >= len(cached):
+            return {}
+        affected = self._ancestors(self.changed, links)
+        return {i: r for i, r in cached[trace].items() if i not in affected}
+
+    def store(
+        self,
+        check: str,
+        results: dict[str, NeedResult],
+        reached: list[dict[str, bool]],
+    ) -> None:
+        self._new.results[check] = results
+        self._new.reached[check] = reached
+
+    def save(self) -> None:
+        if self._enabled:
+            save_cache(self._path, self._new)
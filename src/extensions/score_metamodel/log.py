@@ -11,6 +11,7 @@
 # SPDX-License-Identifier: Apache-2.0
 # *******************************************************************************
 import os
+from dataclasses import dataclass
 from typing import Any
 
 from docutils.nodes import Node
@@ -19,41 +20,73 @@ from sphinx_needs.logging import SphinxLoggerAdapter
 from sphinx_needs.need_item import NeedItem
 
 Location = str | tuple[str | None, int | None] | Node | None
-NewCheck = tuple[str, Location]
 logger = logging.get_logger(__name__)
 
 
+@dataclass(frozen=True)
+class Finding:
+    """A message of a check, with what it is about."""
+
+    msg: str
+    location: Location
+    is_new_check: bool = False
+    # Name of the check function
+    check: str = ""
+    need_id: str = ""
+    option: str = ""
+
+    @property
+    def severity(self) -> str:
+        # New checks are reported as info, until they become fatal
+        return "info" if self.is_new_check else "warning"
+
+
 class CheckLogger:
     def __init__(self, log: SphinxLoggerAdapter, prefix: str):
         self._log = log
         self._info_count = 0
         self._warning_count = 0
         self._prefix = prefix
-        self._new_checks: list[NewCheck] = []
+        # All findings, in the order they were reported
+        self._records: list[Finding] = []
+        # Note: passing the location as a string allows us to use
+        # readable relative paths, passing as a tuple results
+        # in absolute paths to ~/.cache/.../bazel-out/..
+        self._file_prefix = (
+            ""
+            if "RUNFILES_DIR" in os.environ or "RUNFILES_MANIFEST_FILE" in os.environ
+            else f"{prefix}/"
+        )
+        # Name of the check that is running, set by whoever runs the checks
+        self.check = ""
+        # Needs the checks looked at, as reported by them, for the statistics
+        self.needs_checked = 0
 
-    @staticmethod
-    def _location(need: NeedItem, prefix: str):
+    def _location(self, need: NeedItem) -> str | None:
         def get(key: str) -> Any:
             return need.get(key, None)
 
         if get("docname") and get("doctype") and get("lineno"):
-            # Note: passing the location as a string allows us to use
-            # readable relative paths, passing as a tuple results
-            # in absolute paths to ~/.cache/.../bazel-out/..
-            if "RUNFILES_DIR" in os.environ or "RUNFILES_MANIFEST_FILE" in os.environ:
-                matching_file = f"{need['docname']}{need['doctype']}"
-            else:
-                matching_file = f"{prefix}/{need['docname']}{need['doctype']}"
-
-            return f"{matching_file}:{need['lineno']}"
+            return (
+                f"{self._file_prefix}{need['docname']}{need['doctype']}:"
+                f"{need['lineno']}"
+            )
         return None
 
     def warning_for_option(
         self, need: NeedItem, option: str, msg: str, is_new_check: bool = False
     ):
         full_msg = f"{need['id']}.{option} ({need.get(option, None)}): {msg}"
-        location = CheckLogger._location(need, self._prefix)
-        self._log_message(full_msg, location, is_new_check)
+        self._log_message(
+            Finding(
+                full_msg,
+                self._location(need),
+                is_new_check,
+                self.check,
+                need["id"],
+                option,
+            )
+        )
 
     def warning_for_link(
         self,
@@ -73,25 +106,37 @@ class CheckLogger:
         # if allowed_regex:
         #     msg += f" (allowed pattern: `{allowed_regex}`)"
 
-        self.warning_for_need(need, msg, is_new_check=is_new_check)
+        full_msg = f"{need['id']}: {msg}"
+        self._log_message(
+            Finding(
+                full_msg,
+                self._location(need),
+                is_new_check,
+                self.check,
+                need["id"],
+                option,
+            )
+        )
 
     def warning_for_need(self, need: NeedItem, msg: str, is_new_check: bool = False):
         full_msg = f"{need['id']}: {msg}"
-        location = CheckLogger._location(need, self._prefix)
-        self._log_message(full_msg, location, is_new_check)
+        self._log_message(
+            Finding(
+                full_msg, self._location(need), is_new_check, self.check, need["id"]
+            )
+        )
 
-    def _log_message(
-        self,
-        msg: str,
-        location: Location,
-        is_new_check: bool = False,
-    ):
-        if is_new_check:
-            self._new_checks.append((msg, location))
+    def _log_message(self, finding: Finding):
+        self._records.append(finding)
+        if finding.is_new_check:
             self._info_count += 1
         else:
-            self.warning(msg, location)
             self._warning_count += 1
+            self.warning(finding.msg, finding.location)
+
+    def checked(self, needs: int) -> None:
+        """Count 'needs' as looked at by the running (graph) check."""
+        self.needs_checked += needs
 
     def info(
         self,
@@ -107,6 +152,19 @@ class CheckLogger:
     ):
         self._log.warning(msg, type="score_metamodel", location=location)
 
+    def add_findings(self, findings: list[Finding]):
+        """Log findings recorded elsewhere, as if they were reported here."""
+        for finding in findings:
+            self._log_message(finding)
+
+    @property
+    def prefix(self) -> str:
+        return self._prefix
+
+    @property
+    def records(self) -> list[Finding]:
+        return self._records
+
     @property
     def warnings(self):
         return self._warning_count
@@ -123,15 +181,29 @@ class CheckLogger:
             text = f" {text} "
             return text.center(width, "=")
 
-        if not self._new_checks:
+        new_checks = [f for f in self._records if f.is_new_check]
+        if not new_checks:
             return
 
         warning_header = make_header_line(
-            f"{len(self._new_checks)} non-fatal warnings "
-            "(will become fatal in the future)"
+            f"{len(new_checks)} non-fatal warnings (will become fatal in the future)"
         )
 
         logger.info(warning_header)
 
-        for msg, location in self._new_checks:
-            self.info(msg, location)
+        for finding in new_checks:
+            self.info(finding.msg, finding.location)
+
+
+class FindingsLogger(CheckLogger):
+    """
+    Records messages of checks instead of logging them, e.g. in worker processes.
+    Pass them to CheckLogger.add_findings afterwards.
+    """
+
+    def __init__(self, prefix: str):
+        super().__init__(logger, prefix)
+        self.findings: list[Finding] = []
+
+    def _log_message(self, finding: Finding):
+        self.findings.append(finding)
@@ -27,10 +27,6 @@ class ProhibitedWordCheck:
     types: list[str] = field(default_factory=list)
 
 
-# links to either regexes (str) or a other need types (list of ScoreNeedType).
-AllowedLinksType = dict[str, list["str | ScoreNeedType"]]
-
-
 class ScoreNeedType(NeedType):
     tags: list[str]
     parts: int
@@ -38,5 +34,7 @@ class ScoreNeedType(NeedType):
     mandatory_options: dict[str, str]
     optional_options: dict[str, str]
 
-    mandatory_links: AllowedLinksType
-    optional_links: AllowedLinksType
+    # Comma separated need types or regexes (starting with '^') per link.
+    # Resolved once in compiled_metamodel.py
+    mandatory_links: dict[str, str]
+    optional_links: dict[str, str]
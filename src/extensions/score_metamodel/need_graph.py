@@ -0,0 +1,282 @@
+# *******************************************************************************
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0
+#
+# SPDX-License-Identifier: Apache-2.0
+# *******************************************************************************
+"""
+An index over all needs and their links, built once per build.
+
+Graph checks (and other extensions) look needs up by id or type and follow links
+in both directions, instead of each of them scanning all needs again.
+
+Transitive questions ("is there a path to ...", "are there cycles") are
+answered for all needs in one pass over the links, see NeedGraph.reaches and
+NeedGraph.cycles.
+"""
+
+from collections import defaultdict, deque
+from collections.abc import Callable, Container, Iterable, Iterator, Mapping, Sequence
+from dataclasses import dataclass
+from typing import cast
+
+from sphinx.application import Sphinx
+from sphinx.environment import BuildEnvironment
+from sphinx_needs.data import NeedsView, SphinxNeedsData
+from sphinx_needs.need_item import NeedItem
+
+
+@dataclass(frozen=True)
+class NeedGraph:
+    by_id: Mapping[str, NeedItem]
+    # Local needs only, i.e. no external ones, in the order of the NeedsView
+    local: tuple[NeedItem, ...]
+    # link type -> need id -> ids of the linked needs, as written (may not exist)
+    outgoing: Mapping[str, Mapping[str, tuple[str, ...]]]
+    # link type -> need id -> ids of the needs linking to it
+    incoming: Mapping[str, Mapping[str, tuple[str, ...]]]
+
+    def local_needs(
+        self, types: Iterable[str], exclude: bool = False
+    ) -> list[NeedItem]:
+        """
+        Local needs of 'types', or with 'exclude' of all other types. In the
+        order of the NeedsView, so findings are reported in document order.
+        """
+        selected = set(types)
+        return [need for need in self.local if (need["type"] in selected) != exclude]
+
+    def parents(self, need_id: str, link: str) -> tuple[str, ...]:
+        return self.outgoing.get(link, {}).get(need_id, ())
+
+    def children(self, need_id: str, link: str) -> tuple[str, ...]:
+        return self.incoming.get(link, {}).get(need_id, ())
+
+    def linked(self, need_id: str, links: Iterable[str]) -> list[str]:
+        """
+        Ids of existing needs linked from 'need_id' over 'links'. Like in
+        sphinx-needs, 'satisfies_back' follows 'satisfies' backwards.
+        """
+        return [
+            target
+            for link in links
+            for target in (
+                self.children(need_id, link.removesuffix("_back"))
+                if link.endswith("_back")
+                else self.parents(need_id, link)
+            )
+            if target in self.by_id
+        ]
+
+    def reachable_from(self, starts: Iterable[str], links: Sequence[str]) -> set[str]:
+        """All needs reachable from 'starts' over 'links', including 'starts'."""
+        found = {start for start in starts if start in self.by_id}
+        queue = deque(found)
+        while queue:
+            for target in self.linked(queue.popleft(), links):
+                if target not in found:
+                    found.add(target)
+                    queue.append(target)
+        return found
+
+    def cycles(self, links: Sequence[str]) -> list[list[str]]:
+        """
+        Groups of needs linking to each other in circles over 'links', i.e.
+        strongly connected components with more than one need, or a need
+        linking to itself.
+        """
+        found: list[list[str]] = []
+
+        def complete(component: list[str]) -> None:
+            first = component[0]
+            if len(component) > 1 or first in tarjan.successors(first):
+                found.append(component)
+
+        tarjan = _Tarjan(self, links, complete)
+        for need_id in self.by_id:
+            tarjan.visit(need_id)
+        return found
+
+    def reaches(
+        self,
+        starts: Iterable[str],
+        links: Sequence[str],
+        is_target: Callable[[NeedItem], bool],
+        known: Mapping[str, bool] | None = None,
+    ) -> dict[str, bool]:
+        """
+        Whether a need for which 'is_target' holds can be reached from each of
+        'starts', over 'links' in one or more hops. The result contains all
+        needs visited on the way, and 'known' results (e.g. from an earlier
+        build) which are not followed any further.
+
+        Every need and link is visited at most once, no matter how many paths
+        there are, and 'is_target' is called at most once per need: all needs
+        of a strongly connected component reach the same needs, and the
+        components a component links to are completed before it.
+        """
+        result = dict(known or {})
+        targets: dict[str, bool] = {}
+
+        def is_target_once(need_id: str) -> bool:
+            if need_id not in targets:
+                targets[need_id] = is_target(self.by_id[need_id])
+            return targets[need_id]
+
+        def complete(component: list[str]) -> None:
+            members = set(component)
+            found = any(
+                is_target_once(target) or (target not in members and result[target])
+                for member in component
+                for target in tarjan.successors(member)
+            )
+            for member in component:
+                result[member] = found
+
+        tarjan = _Tarjan(self, links, complete, done=result)
+        for start in starts:
+            if start in self.by_id:
+                tarjan.visit(start)
+        return result
+
+
+class _Tarjan:
+    """
+    Tarjan's algorithm for the strongly connected components of the needs
+    linked by 'links'. Each component is passed to 'on_component' (starting
+    with the need it was entered by) once all components it links to were.
+    Needs in 'done' are not visited.
+    """
+
+    def __init__(
+        self,
+        graph: NeedGraph,
+        links: Sequence[str],
+        on_component: Callable[[list[str]], None],
+        done: Container[str] = (),
+    ):
+        self.graph = graph
+        self.links = links
+        self.on_component = on_component
+        self.done = done
+        self._successors: dict[str, list[str]] = {}
+        self._index: dict[str, int] = {}
+        self._low: dict[str, int] = {}
+        self._stack: list[str] = []
+        self._on_stack: set[str] = set()
+
+    def successors(self, need_id: str) -> list[str]:
+        if need_id not in self._successors:
+            self._successors[need_id] = self.graph.linked(need_id, self.links)
+        return self._successors[need_id]
+
+    def _enter(self, need_id: str) -> tuple[str, Iterator[str]]:
+        self._index[need_id] = self._low[need_id] = len(self._index)
+        self._stack.append(need_id)
+        self._on_stack.add(need_id)
+        return need_id, iter(self.successors(need_id))
+
+    def visit(self, start: str) -> None:
+        if start in self._index or start in self.done:
+            return
+        # Iterative, link chains can be longer than the recursion limit
+        path = [self._enter(start)]
+        while path:
+            need_id, successors = path[-1]
+            for target in successors:
+                if target in self._on_stack:
+                    self._low[need_id] = min(self._low[need_id], self._index[target])
+                elif target not in self._index and target not in self.done:
+                    path.append(self._enter(target))
+                    break
+            else:
+                _ = path.pop()
+                if path:
+                    parent = path[-1][0]
+                    self._low[parent] = min(self._low[parent], self._low[need_id])
+                if self._low[need_id] == self._index[need_id]:
+                    self._complete(need_id)
+
+    def _complete(self, root: str) -> None:
+        component: list[str] = []
+        while True:
+            member = self._stack.pop()
+            self._on_stack.discard(member)
+            component.append(member)
+            if member == root:
+                break
+        component.reverse()
+        self.on_component(component)
+
+
+def build_need_graph(needs: NeedsView, link_types: Iterable[str]) -> NeedGraph:
+    by_id: dict[str, NeedItem] = {}
+    local: list[NeedItem] = []
+    outgoing: dict[str, dict[str, tuple[str, ...]]] = {}
+    incoming: dict[str, dict[str, list[str]]] = {}
+    link_types = list(dict.fromkeys(link_types))
+    for link in link_types:
+        outgoing[link] = {}
+        incoming[link] = defaultdict(list)
+
+    for need in needs.values():
+        need_id = need["id"]
+        by_id[need_id] = need
+        if not need["is_external"]:
+            local.append(need)
+        for link in link_types:
+            targets = need.get(link)
+            if not isinstance(targets, list) or not targets:
+                continue
+            targets = cast(list[str], targets)
+            outgoing[link][need_id] = tuple(targets)
+            for target in targets:
+                incoming[link][target].append(need_id)
+
+    return NeedGraph(
+        by_id=by_id,
+        local=tuple(local),
+        outgoing=outgoing,
+        incoming={
+            link: {target: tuple(ids) for target, ids in by_target.items()}
+            for link, by_target in incoming.items()
+        },
+    )
+
+
+def link_types(app: Sphinx) -> list[str]:
+    """The sphinx-needs default 'links' and all from metamodel.yaml"""
+    return ["links", *app.config.needs_links]
+
+
+# Attribute of the build environment holding the graph and its NeedsView
+_ENV_ATTR = "score_need_graph"
+
+
+def get_need_graph(app: Sphinx, needs: NeedsView | None = None) -> NeedGraph:
+    """
+    Return the graph of 'needs' (by default all needs of the build). Only built
+    once per NeedsView, which sphinx-needs creates once per build.
+    """
+    if needs is None:
+        needs = SphinxNeedsData(app.env).get_needs_view()
+    cached: tuple[NeedsView, NeedGraph] | None = getattr(app.env, _ENV_ATTR, None)
+    if cached is None or cached[0] is not needs:
+        cached = (needs, build_need_graph(needs, link_types(app)))
+        setattr(app.env, _ENV_ATTR, cached)
+    return cached[1]
+
+
+def forget_need_graph(app: Sphinx, env: BuildEnvironment) -> None:
+    """
+    Drop the graph of the previous build once the needs are read again, so it
+    neither keeps the old needs alive nor ends up in the pickled environment.
+    """
+    if hasattr(env, _ENV_ATTR):
+        delattr(env, _ENV_ATTR)
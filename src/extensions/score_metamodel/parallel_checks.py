@@ -0,0 +1,141 @@
+# *******************************************************************************
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0
+#
+# SPDX-License-Identifier: Apache-2.0
+# *******************************************************************************
+"""
+Run the local checks on several cores.
+
+The needs are split into consecutive shards. Workers record their messages as
+findings per need, which are returned in the order of the needs. Logging them
+in that order gives the same output as running everything in one loop.
+
+Like Sphinx' own parallel build, workers are forked: they inherit the app and
+the needs instead of receiving them pickled. On free-threaded Python threads are
+used instead.
+"""
+
+import math
+import multiprocessing
+import sys
+import time
+from collections.abc import Callable
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+
+from sphinx.application import Sphinx
+from sphinx.util.parallel import parallel_available
+from sphinx_needs.need_item import NeedItem
+
+from src.extensions.score_metamodel.check_stats import CheckStatistics
+from src.extensions.score_metamodel.derived import need_views, release_need_view
+from src.extensions.score_metamodel.log import CheckLogger, Finding, FindingsLogger
+
+LocalCheck = Callable[[Sphinx, NeedItem, CheckLogger], None]
+
+# Fewer needs per worker are faster to check than to fork for
+MIN_SHARD_SIZE = 500
+# More shards than workers, so that slow shards do not hold up the others
+_SHARDS_PER_JOB = 4
+
+# What the workers work on, set for the duration of run_local_checks
+_shared: tuple[Sphinx, list[NeedItem], dict[str, list[LocalCheck]], str] | None = None
+
+
+def _check_needs(
+    app: Sphinx,
+    needs: list[NeedItem],
+    checks_by_type: dict[str, list[LocalCheck]],
+    prefix: str,
+) -> tuple[list[list[Finding]], CheckStatistics]:
+    log = FindingsLogger(prefix)
+    stats = CheckStatistics()
+    findings: list[list[Finding]] = []
+    with need_views():
+        for need in needs:
+            for check in checks_by_type[need["type"]]:
+                log.check = check.__name__
+                found = len(log.findings)
+                start = time.perf_counter()
+                check(app, need, log)
+                stats.record(
+                    "local",
+                    check.__name__,
+                    time.perf_counter() - start,
+                    1,
+                    len(log.findings) - found,
+                )
+            release_need_view(need)
+            findings.append(log.findings)
+            log.findings = []
+    return findings, stats
+
+
+def _check_shard(start: int, stop: int) -> tuple[list[list[Finding]], CheckStatistics]:
+    assert _shared is not None
+    app, needs, checks_by_type, prefix = _shared
+    return _check_needs(app, needs[start:stop], checks_by_type, prefix)
+
+
+def _free_threaded() -> bool:
+    is_gil_enabled: Callable[[], bool] | None = getattr(sys, "_is_gil_enabled", None)
+    return is_gil_enabled is not None and not is_gil_enabled()
+
+
+def _executor(jobs: int) -> Executor | None:
+    if _free_threaded():
+        return ThreadPoolExecutor(max_workers=jobs)
+    if parallel_available and "fork" in multiprocessing.get_all_start_methods():
+        return ProcessPoolExecutor(
+            max_workers=jobs, mp_context=multiprocessing.get_context("fork")
+        )
+    return None
+
+
+def run_local_checks(
+    app: Sphinx,
+    needs: list[NeedItem],
+    checks_by_type: dict[str, list[LocalCheck]],
+    prefix: str,
+    jobs: int,
+    stats: CheckStatistics | None = None,
+) -> list[list[Finding]]:
+    """
+    Run the applicable local checks for all 'needs', on up to 'jobs' workers.
+    Returns the findings of each need, in the order of 'needs'.
+    Falls back to checking in this process for few needs or a single job.
+    Time & counts per check are added to 'stats'.
+    """
+    stats = stats if stats is not None else CheckStatistics()
+    jobs = max(jobs, 1)
+    shard_size = max(MIN_SHARD_SIZE, math.ceil(len(needs) / (jobs * _SHARDS_PER_JOB)))
+    executor = _executor(jobs) if jobs > 1 and len(needs) > shard_size else None
+    if executor is None:
+        findings, shard_stats = _check_needs(app, needs, checks_by_type, prefix)
+        stats.merge(shard_stats)
+        return findings
+
+    global _shared
+    # Workers are forked on the first submit, so they see this
+    _shared = (app, needs, checks_by_type, prefix)
+    try:
+        with executor:
+            shards = [
+                executor.submit(_check_shard, start, start + shard_size)
+                for start in range(0, len(needs), shard_size)
+            ]
+            # Strictly in order of the shards, not as they complete
+            findings: list[list[Finding]] = []
+            for shard in shards:
+                shard_findings, shard_stats = shard.result()
+                findings.extend(shard_findings)
+                stats.merge(shard_stats)
+            return findings
+    finally:
+        _shared = None
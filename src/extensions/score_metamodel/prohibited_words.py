@@ -0,0 +1,108 @@
+# *******************************************************************************
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0
+#
+# SPDX-License-Identifier: Apache-2.0
+# *******************************************************************************
+"""
+All 'prohibited_words_checks' of metamodel.yaml combined into one lookup table.
+
+Each option is split into words only once, and every word is looked up once for
+all checks. Words are compared like before: punctuation stripped, lowercased.
+"""
+
+import string
+from collections import defaultdict
+from collections.abc import Mapping
+from dataclasses import dataclass
+from types import MappingProxyType
+
+from sphinx_needs.need_item import NeedItem
+
+from src.extensions.score_metamodel.metamodel_types import ProhibitedWordCheck
+
+
+@dataclass(frozen=True)
+class ProhibitedWords:
+    checks: tuple[ProhibitedWordCheck, ...]
+    # option -> normalized word -> indices of the checks prohibiting it there
+    words: Mapping[str, Mapping[str, tuple[int, ...]]]
+
+    def _applicable(self, tags: frozenset[str]) -> list[int]:
+        return [
+            i
+            for i, check in enumerate(self.checks)
+            # Checks without types apply to all needs
+            if not check.types or not tags.isdisjoint(check.types)
+        ]
+
+    def _scan(
+        self, need: NeedItem, applicable: set[int]
+    ) -> dict[tuple[int, str], list[str]]:
+        found: dict[tuple[int, str], list[str]] = defaultdict(list)
+        for option, words in self.words.items():
+            value = need.get(option)
+            if not isinstance(value, str):
+                continue
+            for word in value.split():
+                normalized = word.strip(string.punctuation).lower()
+                for i in words.get(normalized, ()):
+                    if i in applicable:
+                        found[(i, option)].append(normalized)
+        return found
+
+    def find(self, need: NeedItem, tags: frozenset[str]) -> list[tuple[str, str]]:
+        """
+        Return (option, word) for all prohibited words in 'need', a need of a type
+        with 'tags'. Ordered by check, then option, then position in the text.
+        """
+        applicable = self._applicable(tags)
+        if not applicable:
+            return []
+        found = self._scan(need, set(applicable))
+        return [
+            (option, word)
+            for i in applicable
+            for option in self.checks[i].option_check
+            if option != "types"
+            for word in found.get((i, option), ())
+        ]
+
+
+def compile_prohibited_words(checks: list[ProhibitedWordCheck]) -> ProhibitedWords:
+    words: dict[str, dict[str, list[int]]] = defaultdict(lambda: defaultdict(list))
+    for i, check in enumerate(checks):
+        for option, forbidden in check.option_check.items():
+            if option == "types":
+                continue
+            for word in dict.fromkeys(forbidden):
+                words[option][word].append(i)
+    return ProhibitedWords(
+        tuple(checks),
+        MappingProxyType(
+            {
+                option: MappingProxyType({w: tuple(c) for w, c in by_word.items()})
+                for option, by_word in words.items()
+            }
+        ),
+    )
+
+
+_compiled: tuple[list[ProhibitedWordCheck], ProhibitedWords] | None = None
+
+
+def get_prohibited_words(checks: list[ProhibitedWordCheck]) -> ProhibitedWords:
+    """
+    Return the compiled form of 'checks' (usually
+    app.config.prohibited_words_checks), compiled only once per list.
+    """
+    global _compiled
+    if _compiled is None or _compiled[0] is not checks:
+        _compiled = (checks, compile_prohibited_words(checks))
+    return _compiled[1]
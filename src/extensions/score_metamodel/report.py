@@ -0,0 +1,105 @@
+# *******************************************************************************
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0
+#
+# SPDX-License-Identifier: Apache-2.0
+# *******************************************************************************
+"""
+All findings of the metamodel checks as files, for CI instead of scraping the log.
+
+- score_metamodel_report.json: one record per finding, in the order of the log
+- score_metamodel_report.sarif: the same as SARIF 2.1.0, e.g. for code scanning
+"""
+
+import json
+from pathlib import Path
+from typing import Any
+
+from src.extensions.score_metamodel.log import Finding, Location
+
+JSON_REPORT = "score_metamodel_report.json"
+SARIF_REPORT = "score_metamodel_report.sarif"
+
+_SARIF_SCHEMA = "https://json.schemastore.org/sarif-2.1.0.json"
+_SARIF_LEVELS = {"warning": "warning", "info": "note"}
+
+
+def _split_location(location: Location) -> tuple[str, int | None]:
+    """'docs/file.rst:42' -> ('docs/file.rst', 42)"""
+    if isinstance(location, str):
+        file, _, line = location.rpartition(":")
+        if file and line.isdigit():
+            return file, int(line)
+        return location, None
+    if isinstance(location, tuple):
+        return location[0] or "", location[1]
+    return "", None
+
+
+def _to_json(finding: Finding) -> dict[str, Any]:
+    file, line = _split_location(finding.location)
+    return {
+        "check": finding.check,
+        "need": finding.need_id,
+        "option": finding.option,
+        "severity": finding.severity,
+        "file": file,
+        "line": line,
+        "message": finding.msg,
+    }
+
+
+def _to_sarif_result(finding: Finding) -> dict[str, Any]:
+    result: dict[str, Any] = {
+        "ruleId": finding.check or "score_metamodel",
+        "level": _SARIF_LEVELS[finding.severity],
+        "message": {"text": finding.msg},
+    }
+    file, line = _split_location(finding.location)
+    if file:
+        physical: dict[str, Any] = {"artifactLocation": {"uri": file}}
+        if line:
+            physical["region"] = {"startLine": line}
+        result["locations"] = [{"physicalLocation": physical}]
+    if finding.need_id:
+        result["partialFingerprints"] = {
+            "need": f"{finding.need_id}.{finding.option}"
+            if finding.option
+            else finding.need_id
+        }
+    return result
+
+
+def to_sarif(findings: list[Finding]) -> dict[str, Any]:
+    rules = sorted({f.check or "score_metamodel" for f in findings})
+    return {
+        "$schema": _SARIF_SCHEMA,
+        "version": "2.1.0",
+        "runs": [
+            {
+                "tool": {
+                    "driver": {
+                        "name": "score_metamodel",
+                        "rules": [{"id": rule} for rule in rules],
+                    }
+                },
+                "results": [_to_sarif_result(f) for f in findings],
+            }
+        ],
+    }
+
+
+def write_reports(outdir: Path, findings: list[Finding]) -> None:
+    outdir.mkdir(parents=True, exist_ok=True)
+    _ = (outdir / JSON_REPORT).write_text(
+        json.dumps([_to_json(f) for f in findings], indent=1), encoding="utf-8"
+    )
+    _ = (outdir / SARIF_REPORT).write_text(
+        json.dumps(to_sarif(findings), indent=1), encoding="utf-8"
+    )
@@ -0,0 +1,71 @@
+# *******************************************************************************
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0
+#
+# SPDX-License-Identifier: Apache-2.0
+# *******************************************************************************
+from pathlib import Path
+from unittest.mock import Mock
+
+from sphinx.application import Sphinx
+from sphinx_needs.need_item import NeedItem
+
+from src.extensions.score_metamodel import CheckLogger
+from src.extensions.score_metamodel.check_cache import run_local_checks_cached
+from src.extensions.score_metamodel.tests import need
+
+checked: list[str] = []
+
+
+def title_check(app: Sphinx, need: NeedItem, log: CheckLogger) -> None:
+    checked.append(need["id"])
+    log.warning_for_option(need, "title", "is not allowed")
+
+
+def make_app(tmp_path: Path) -> Sphinx:
+    app = Mock(spec=Sphinx)
+    app.doctreedir = tmp_path
+    app.config = Mock()
+    app.config.score_metamodel_check_cache = True
+    app.config.needs_types = [{"directive": "feat_req", "title": "Feature"}]
+    app.config.prohibited_words_checks = []
+    return app
+
+
+def run(app: Sphinx, needs: list[NeedItem]) -> list[list[str]]:
+    checked.clear()
+    findings = run_local_checks_cached(
+        app, needs, {"feat_req": [title_check]}, "docs", jobs=1
+    )
+    return [[f.msg for f in need_findings] for need_findings in findings]
+
+
+def test_only_changed_needs_are_checked_again(tmp_path: Path):
+    app = make_app(tmp_path)
+    needs = [need(id=f"feat_req__{i}", type="feat_req", title="a") for i in range(3)]
+    first = run(app, needs)
+    assert checked == ["feat_req__0", "feat_req__1", "feat_req__2"]
+
+    assert run(app, needs) == first
+    assert checked == []
+
+    needs[1] = need(id="feat_req__1", type="feat_req", title="b")
+    second = run(app, needs)
+    assert checked == ["feat_req__1"]
+    assert second == [first[0], ["feat_req__1.title (b): is not allowed"], first[2]]
+
+
+def test_metamodel_change_checks_everything_again(tmp_path: Path):
+    app = make_app(tmp_path)
+    needs = [need(id=f"feat_req__{i}", type="feat_req") for i in range(2)]
+    _ = run(app, needs)
+
+    app.config.needs_types = [{"directive": "feat_req", "title": "Feature Req"}]
+    _ = run(app, needs)
+    assert checked == ["feat_req__0", "feat_req__1"]
@@ -0,0 +1,128 @@
+# *******************************************************************************
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0
+#
+# SPDX-License-Identifier: Apache-2.0
+# *******************************************************************************
+import pytest
+
+from src.extensions.score_metamodel.compiled_graph_checks import (
+    compile_condition,
+    compile_graph_check,
+)
+from src.extensions.score_metamodel.tests import fake_check_logger, need
+
+
+def test_conditions_are_evaluated_like_written():
+    log = fake_check_logger()
+    valid = need(status="valid", title="x")
+    draft = need(status="draft", title="x")
+    condition = compile_condition(
+        {"and": ["status != draft", {"not": ["title == y"]}, {"xor": ["title == x"]}]}
+    )
+
+    assert condition(valid, log)
+    assert not condition(draft, log)
+    log.assert_no_warnings()
+
+
+def test_all_operands_report_missing_attributes():
+    log = fake_check_logger()
+    condition = compile_condition({"or": ["status == valid", "unknown == 1"]})
+
+    assert condition(need(status="valid"), log)
+    log.assert_warning("Attribute not defined: unknown", expect_location=False)
+
+
+@pytest.mark.parametrize(
+    ("condition", "error"),
+    [
+        ("status==valid", "Invalid check defined"),
+        ("status ~ valid", "Binary Operator not defined: ~"),
+        ({"not": ["a == b", "c == d"]}, "'not' requires exactly one operand"),
+        ({"and": []}, "'and' requires at least one operand"),
+        ({"nand": ["a == b"]}, "Unsupported condition operator: nand"),
+        (42, "Invalid condition type"),
+    ],
+)
+def test_invalid_conditions_fail_when_compiled(condition: object, error: str):
+    with pytest.raises(ValueError, match=error):
+        _ = compile_condition(condition)  # type: ignore[arg-type]
+
+
+def test_graph_check_selects_by_type_and_condition():
+    log = fake_check_logger()
+    check = compile_graph_check(
+        "check",
+        {
+            "needs": {"exclude": "process, tool_req", "condition": "status == valid"},
+            "check": {"satisfies": "status == valid"},
+            "explanation": "Explained.",
+        },
+    )
+
+    assert check.needs.types == ("process", "tool_req")
+    assert check.needs.selects(need(type="requirement", status="valid"), log)
+    assert not check.needs.selects(need(type="process", status="valid"), log)
+    assert not check.needs.selects(need(type="requirement", status="draft"), log)
+    assert [p.link for p in check.parents] == ["satisfies"]
+    assert check.traces == ()
+    log.assert_no_warnings()
+
+
+def test_graph_check_without_condition_fails_when_compiled():
+    with pytest.raises(ValueError, match="Invalid selection"):
+        _ = compile_graph_check(
+            "check",
+            {"needs": {"include": "process"}, "check": {}, "explanation": "Why."},
+        )
+
+
+def test_graph_check_with_trace():
+    check = compile_graph_check(
+        "check",
+        {
+            "needs": {"include": "comp_req", "condition": "safety != QM"},
+            "trace": {
+                "links": "satisfies, fulfils",
+                "to": {"include": "stkh_req", "condition": "safety != QM"},
+            },
+            "explanation": "Why.",
+        },
+    )
+
+    assert check.parents == ()
+    (trace,) = check.traces
+    assert trace.links == ("satisfies", "fulfils")
+    assert trace.to.types == ("stkh_req",)
+    assert trace.message == (
+        "No trace over `satisfies, fulfils` to a need of type `stkh_req` "
+        "with condition `safety != QM`."
+    )
+
+
+@pytest.mark.parametrize(
+    "config",
+    [
+        {"trace": {"links": "satisfies"}},
+        {"trace": {"links": "", "to": {"include": "a", "condition": "a == b"}}},
+        {"trace": {"links": "satisfies", "to": {"include": "a"}}},
+        {},
+    ],
+)
+def test_invalid_traces_fail_when_compiled(config: dict[str, object]):
+    with pytest.raises(ValueError):
+        _ = compile_graph_check(
+            "check",
+            {
+                "needs": {"include": "process", "condition": "a == b"},
+                "explanation": "Why.",
+                **config,
+            },
+        )
@@ -0,0 +1,105 @@
+# *******************************************************************************
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0
+#
+# SPDX-License-Identifier: Apache-2.0
+# *******************************************************************************
+import dataclasses
+
+import pytest
+from score_metamodel import ScoreNeedType, compiled_metamodel, get_compiled_metamodel
+from score_metamodel.compiled_metamodel import compile_metamodel
+
+
+def need_type(directive: str, **kwargs: object) -> ScoreNeedType:
+    t: ScoreNeedType = {
+        "directive": directive,
+        "title": directive.title(),
+        "prefix": f"{directive}__",
+        "tags": [],
+        "parts": 3,
+        "mandatory_options": {"id": f"^{directive}__[0-9a-z_]+$"},
+        "optional_options": {},
+        "mandatory_links": {},
+        "optional_links": {},
+    }
+    t.update(kwargs)  # type: ignore[typeddict-item]
+    return t
+
+
+def test_link_targets_are_resolved():
+    needs_types = [
+        need_type("feat_req"),
+        need_type(
+            "comp_req",
+            mandatory_links={"satisfies": "feat_req, ^std_req__.*$"},
+        ),
+    ]
+    (rule,) = compile_metamodel(needs_types).need_type("comp_req").mandatory_links
+
+    assert rule.name == "satisfies"
+    assert rule.allowed == ("Feat_Req (feat_req)", "^std_req__.*$")
+    assert rule.pattern.match("feat_req__abc")
+    assert rule.pattern.match("std_req__iso__1")
+    assert not rule.pattern.match("comp_req__abc")
+
+
+def test_allowed_options_contain_defaults_and_rules():
+    needs_types = [
+        need_type(
+            "tool_req",
+            optional_options={"safety": "^(QM|ASIL_B)$"},
+            optional_links={"satisfies": "^.*$"},
+        )
+    ]
+    compiled = compile_metamodel(needs_types).need_type("tool_req")
+
+    assert {"id", "safety", "satisfies", "docname"} <= compiled.allowed_options
+    assert "security" not in compiled.allowed_options
+
+
+def test_invalid_pattern_fails_when_compiling():
+    needs_types = [need_type("tool_req", optional_options={"safety": "^(QM$"})]
+    with pytest.raises(TypeError, match="tool_req->safety"):
+        _ = compile_metamodel(needs_types)
+
+
+def test_compiled_metamodel_is_immutable_and_reused():
+    needs_types = [need_type("tool_req")]
+    compiled = get_compiled_metamodel(needs_types)
+
+    assert get_compiled_metamodel(needs_types) is compiled
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        compiled.need_type("tool_req").parts = 2  # type: ignore[misc]
+
+    # Extending the list of need types compiles it again
+    needs_types.append(need_type("feat_req"))
+    assert get_compiled_metamodel(needs_types).need_type("feat_req")
+
+
+def test_rules_match_each_value_once():
+    needs_types = [need_type("tool_req", optional_options={"safety": "^(QM|ASIL_B)$"})]
+    (rule,) = compile_metamodel(needs_types).need_type("tool_req").optional_options
+
+    assert rule.matches("QM")
+    assert not rule.matches("ASIL_D")
+    # Remembered results are used, the pattern is not matched again
+    object.__setattr__(rule, "pattern", None)
+    assert rule.matches("QM")
+    assert not rule.matches("ASIL_D")
+
+
+def test_remembered_results_are_bounded(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(compiled_metamodel, "_MAX_REMEMBERED_VALUES", 3)
+    needs_types = [need_type("tool_req", optional_options={"version": "^[0-9]+$"})]
+    (rule,) = compile_metamodel(needs_types).need_type("tool_req").optional_options
+
+    for version in range(10):
+        assert rule.matches(str(version))
+        assert len(rule._results) <= 3  # pyright: ignore[reportPrivateUsage]
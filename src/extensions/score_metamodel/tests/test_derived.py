@@ -0,0 +1,52 @@
+# *******************************************************************************
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0
+#
+# SPDX-License-Identifier: Apache-2.0
+# *******************************************************************************
+from src.extensions.score_metamodel import need_view
+from src.extensions.score_metamodel.derived import need_views, release_need_view
+from src.extensions.score_metamodel.tests import need
+
+
+def test_derived_values_are_shared_until_released():
+    n = need(
+        id="feat_req__some-feature__title",
+        docname="features/some_feature/index",
+        satisfies=["EXT_stkh_req__a", "stkh_req__b"],
+    )
+    with need_views():
+        view = need_view(n)
+
+        assert need_view(n) is view
+        assert view.id_parts == ["feat_req", "some-feature", "title"]
+        assert view.feature_parts == ["some", "feature"]
+        assert view.docname_dir == "features/some_feature"
+        assert view.values("satisfies", remove_prefix=True) == [
+            "stkh_req__a",
+            "stkh_req__b",
+        ]
+        assert view.values("satisfies", True) is view.values("satisfies", True)
+
+        release_need_view(n)
+        assert need_view(n) is not view
+
+
+def test_views_are_only_shared_within_a_check_run():
+    n = need(id="feat_req__a__b")
+    with need_views():
+        view = need_view(n)
+    with need_views():
+        assert need_view(n) is not view
+    assert need_view(n) is not need_view(n)
+
+
+def test_docname_dir_of_documents_at_the_root():
+    assert need_view(need(docname="index")).docname_dir == "index"
+    assert need_view(need(docname=None)).docname_dir == ""
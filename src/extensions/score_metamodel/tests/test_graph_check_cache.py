@@ -0,0 +1,177 @@
+# *******************************************************************************
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0
+#
+# SPDX-License-Identifier: Apache-2.0
+# *******************************************************************************
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock, Mock
+
+import pytest
+from score_metamodel import CheckLogger
+from score_metamodel.checks import graph_checks
+from score_metamodel.tests import need
+from sphinx.application import Sphinx
+from sphinx.environment import BuildEnvironment
+from sphinx_needs.data import NeedsView
+from sphinx_needs.need_item import NeedItem
+
+GRAPH_CHECKS: dict[str, Any] = {
+    "asil_chain": {
+        "needs": {"include": "comp_req", "condition": "safety != QM"},
+        "check": {"satisfies": "safety != QM"},
+        "trace": {
+            "links": "satisfies",
+            "to": {"include": "stkh_req", "condition": "safety != QM"},
+        },
+        "explanation": "Trace to ASIL.",
+    }
+}
+
+
+def make_app(tmp_path: Path, graph_checks: dict[str, Any] = GRAPH_CHECKS) -> Sphinx:
+    app = Mock(spec=Sphinx)
+    app.env = Mock(spec=BuildEnvironment)
+    app.doctreedir = tmp_path
+    app.config = Mock()
+    app.config.score_metamodel_check_cache = True
+    app.config.graph_checks = graph_checks
+    app.config.needs_links = {"satisfies": {}}
+    app.config.needs_types = [
+        {"directive": d} for d in ("stkh_req", "feat_req", "comp_req")
+    ]
+    return app
+
+
+def needs(stkh_safety: str = "ASIL_B", comp_safety: str = "ASIL_B") -> list[NeedItem]:
+    return [
+        need(id="stkh_1", type="stkh_req", safety=stkh_safety, satisfies=[]),
+        need(id="feat_1", type="feat_req", safety="ASIL_B", satisfies=["stkh_1"]),
+        need(id="feat_2", type="feat_req", safety="ASIL_B", satisfies=[]),
+        need(id="comp_1", type="comp_req", safety=comp_safety, satisfies=["feat_1"]),
+        need(id="comp_2", type="comp_req", safety="ASIL_B", satisfies=["feat_2"]),
+    ]
+
+
+@pytest.fixture
+def evaluated(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    evaluated: list[str] = []
+    evaluate = graph_checks._evaluate  # pyright: ignore[reportPrivateUsage]
+
+    def counting(graph: object, check: object, need: NeedItem, log: object):
+        evaluated.append(need["id"])
+        return evaluate(graph, check, need, log)  # type: ignore[arg-type]
+
+    monkeypatch.setattr(graph_checks, "_evaluate", counting)
+    monkeypatch.delenv("RUNFILES_DIR", raising=False)
+    monkeypatch.delenv("RUNFILES_MANIFEST_FILE", raising=False)
+    return evaluated
+
+
+def run(app: Sphinx, needs: list[NeedItem]) -> list[str]:
+    log = CheckLogger(MagicMock(), "docs")
+    view = NeedsView._from_needs({n["id"]: n for n in needs})  # pyright: ignore[reportPrivateUsage]
+    graph_checks.check_metamodel_graph(app, view, log)
+    return [f.msg for f in log.records]
+
+
+def test_unchanged_needs_are_not_checked_again(tmp_path: Path, evaluated: list[str]):
+    app = make_app(tmp_path)
+    first = run(app, needs())
+    assert evaluated == ["comp_1", "comp_2"]
+    assert first == [
+        "comp_2: No trace over `satisfies` to a need of type `stkh_req` "
+        "with condition `safety != QM`. Explanation: Trace to ASIL."
+    ]
+
+    evaluated.clear()
+    assert run(app, needs()) == first
+    assert evaluated == []
+
+
+def test_changes_are_checked_for_all_needs_tracing_to_them(
+    tmp_path: Path, evaluated: list[str]
+):
+    app = make_app(tmp_path)
+    _ = run(app, needs())
+    evaluated.clear()
+
+    # Two hops away from comp_1, which is no direct parent
+    findings = run(app, needs(stkh_safety="QM"))
+
+    assert evaluated == []
+    assert findings == [
+        f"{comp}: No trace over `satisfies` to a need of type `stkh_req` "
+        "with condition `safety != QM`. Explanation: Trace to ASIL."
+        for comp in ("comp_1", "comp_2")
+    ]
+
+
+def test_changed_parent_checks_its_children_again(tmp_path: Path, evaluated: list[str]):
+    app = make_app(tmp_path)
+    _ = run(app, needs())
+    evaluated.clear()
+
+    changed = needs()
+    changed[1] = need(id="feat_1", type="feat_req", safety="QM", satisfies=["stkh_1"])
+    findings = run(app, changed)
+
+    assert evaluated == ["comp_1"]
+    assert findings[0] == (
+        "comp_1: Parent need `feat_1` does not fulfill condition `safety != QM`."
+        " Explanation: Trace to ASIL."
+    )
+
+
+def test_changes_are_found_for_traces_over_back_links(tmp_path: Path):
+    app = make_app(
+        tmp_path,
+        {
+            "implemented": {
+                "needs": {"include": "stkh_req", "condition": "safety != QM"},
+                "trace": {
+                    "links": "satisfies_back",
+                    "to": {"include": "comp_req", "condition": "safety != QM"},
+                },
+                "explanation": "Implement it.",
+            }
+        },
+    )
+    assert run(app, needs()) == []
+
+    # Two hops below stkh_1, against the direction of 'satisfies'
+    assert run(app, needs(comp_safety="QM")) == [
+        "stkh_1: No trace over `satisfies_back` to a need of type `comp_req` "
+        "with condition `safety != QM`. Explanation: Implement it."
+    ]
+
+
+def test_findings_are_reported_in_document_order(tmp_path: Path):
+    app = make_app(
+        tmp_path,
+        {
+            "asil_parents": {
+                "needs": {"include": "comp_req, feat_req", "condition": "safety != QM"},
+                "check": {"satisfies": "safety != QM"},
+                "explanation": "Parents must be ASIL.",
+            }
+        },
+    )
+    # Types interleaved, as in a document
+    qm_parents = [
+        need(id="stkh_qm", type="stkh_req", safety="QM", satisfies=[]),
+        need(id="comp_a", type="comp_req", safety="ASIL_B", satisfies=["stkh_qm"]),
+        need(id="feat_b", type="feat_req", safety="ASIL_B", satisfies=["stkh_qm"]),
+        need(id="comp_c", type="comp_req", safety="ASIL_B", satisfies=["stkh_qm"]),
+    ]
+
+    findings = run(app, qm_parents)
+
+    assert [f.partition(":")[0] for f in findings] == ["comp_a", "feat_b", "comp_c"]
@@ -0,0 +1,117 @@
+# *******************************************************************************
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0
+#
+# SPDX-License-Identifier: Apache-2.0
+# *******************************************************************************
+from unittest.mock import MagicMock, Mock
+
+import pytest
+from score_metamodel import CheckLogger, compile_orphan_checks
+from score_metamodel.checks.link_structure import check_link_cycles, check_orphans
+from score_metamodel.tests import need
+from sphinx.application import Sphinx
+from sphinx.environment import BuildEnvironment
+from sphinx_needs.data import NeedsView
+from sphinx_needs.need_item import NeedItem
+
+from src.extensions.score_metamodel.need_graph import build_need_graph
+
+
+def _view(*needs: NeedItem) -> NeedsView:
+    return NeedsView._from_needs({n["id"]: n for n in needs})  # pyright: ignore[reportPrivateUsage]
+
+
+NEEDS = _view(
+    need(id="mod_1", type="mod", includes=["comp_1"]),
+    need(id="comp_1", type="comp", consists_of=["comp_2"]),
+    need(id="comp_2", type="comp", consists_of=["comp_3"]),
+    need(id="comp_3", type="comp", consists_of=["comp_1"]),
+    need(id="comp_4", type="comp", consists_of=["comp_4"]),
+    need(id="comp_5", type="comp", consists_of=["comp_2"]),
+)
+
+
+def make_app() -> Sphinx:
+    app = Mock(spec=Sphinx)
+    app.env = Mock(spec=BuildEnvironment)
+    app.config = Mock()
+    app.config.needs_links = {"includes": {}, "consists_of": {}}
+    app.config.cycle_checks = {
+        "cycles": {"links": "includes, consists_of", "explanation": "No circles."}
+    }
+    app.config.orphan_checks = {
+        "orphans": {
+            "include": "comp",
+            "roots": "mod",
+            "links": "includes, consists_of",
+            "explanation": "Part of a module.",
+        }
+    }
+    return app
+
+
+def run(check: object) -> list[str]:
+    log = CheckLogger(MagicMock(), "docs")
+    check(make_app(), NEEDS, log)  # type: ignore[operator]
+    assert log.warnings == 0
+    return [f.msg for f in log.records]
+
+
+def test_cycles_are_found_once_each():
+    graph = build_need_graph(NEEDS, ["includes", "consists_of"])
+
+    assert graph.cycles(["consists_of"]) == [
+        ["comp_1", "comp_2", "comp_3"],
+        ["comp_4"],
+    ]
+    assert graph.cycles(["includes"]) == []
+    assert run(check_link_cycles) == [
+        "comp_1: Circular `includes, consists_of` links between `comp_1`, `comp_2`, "
+        "`comp_3`. Explanation: No circles.",
+        "comp_4: Circular `includes, consists_of` links between `comp_4`. "
+        "Explanation: No circles.",
+    ]
+
+
+def test_links_can_be_followed_backwards():
+    graph = build_need_graph(NEEDS, ["includes", "consists_of"])
+
+    assert graph.reachable_from(["comp_3"], ["includes_back"]) == {"comp_3"}
+    assert graph.reachable_from(["comp_1"], ["includes_back"]) == {"comp_1", "mod_1"}
+    assert graph.reachable_from(["comp_5"], ["consists_of"]) == {
+        "comp_1",
+        "comp_2",
+        "comp_3",
+        "comp_5",
+    }
+
+
+def test_needs_not_reachable_from_roots_are_orphans():
+    assert run(check_orphans) == [
+        f"{comp}: Not reachable from any `mod` over `includes, consists_of`. "
+        "Explanation: Part of a module."
+        for comp in ("comp_4", "comp_5")
+    ]
+
+
+def test_checks_count_the_needs_they_look_at():
+    cycles, orphans = CheckLogger(MagicMock(), "docs"), CheckLogger(MagicMock(), "")
+    check_link_cycles(make_app(), NEEDS, cycles)
+    check_orphans(make_app(), NEEDS, orphans)
+
+    # All needs are searched for cycles, only components can be orphans
+    assert (cycles.needs_checked, orphans.needs_checked) == (6, 5)
+
+
+def test_incomplete_orphan_check_fails_when_compiled():
+    with pytest.raises(ValueError, match="needs `include`, `roots` and `links`"):
+        _ = compile_orphan_checks(
+            {"orphans": {"include": "comp", "links": "includes", "explanation": "."}}
+        )
@@ -10,6 +10,8 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 # *******************************************************************************
+from unittest.mock import Mock
+
 import pytest
 from attribute_plugin import add_test_properties  # type: ignore[import-untyped]
 from sphinx.application import Sphinx
@@ -18,7 +20,10 @@ from sphinx_needs.need_item import NeedItem
 
 from src.extensions.score_metamodel import CheckLogger
 from src.extensions.score_metamodel.__init__ import (
+    _local_checks_by_type,  # pyright: ignore[reportPrivateUsage]
     graph_checks,
+    local_check,
+    local_check_scopes,
     local_checks,
     parse_checks_filter,
 )
@@ -37,6 +42,7 @@ def dummy_graph_check(app: Sphinx, needs_view: NeedsView, log: CheckLogger) -> N
 def setup_checks():
     """Reset and set test-only local and graph checks before each test."""
     local_checks.clear()
+    local_check_scopes.clear()
     graph_checks.clear()
     local_checks.append(dummy_local_check)
     graph_checks.append(dummy_graph_check)
@@ -87,6 +93,36 @@ def test_raises_assertion_for_invalid_check():
     assert "not one of the defined local or graph checks" in str(exc_info.value)
 
 
+def test_local_checks_are_dispatched_by_type_and_tag():
+    """Scoped checks only run for needs of matching types or tags."""
+
+    @local_check(types=["feat_req"])
+    def feat_only(app: Sphinx, need: NeedItem, log: CheckLogger) -> None:
+        pass
+
+    @local_check(tags=["requirement"])
+    def requirements_only(app: Sphinx, need: NeedItem, log: CheckLogger) -> None:
+        pass
+
+    app = Mock(spec=Sphinx)
+    app.config = Mock()
+    app.config.needs_types = [
+        {"directive": "feat_req", "title": "Feature Requirement", "tags": []},
+        {"directive": "comp_req", "title": "Component Req", "tags": ["requirement"]},
+        {"directive": "document", "title": "Document", "tags": []},
+    ]
+    needs = [need(type=t) for t in ("feat_req", "comp_req", "document", "unknown")]
+
+    checks_by_type = _local_checks_by_type(app, local_checks, needs)
+
+    assert checks_by_type == {
+        "feat_req": [dummy_local_check, feat_only],
+        "comp_req": [dummy_local_check, requirements_only],
+        "document": [dummy_local_check],
+        "unknown": [dummy_local_check],
+    }
+
+
 # =============================================================================
 # Tests for the need() helper function
 # =============================================================================
@@ -13,7 +13,7 @@
 from pathlib import Path
 from unittest.mock import mock_open, patch
 
-from score_metamodel import ProhibitedWordCheck, load_metamodel_data
+from score_metamodel import ProhibitedWordCheck, load_metamodel_data, yaml_parser
 
 MODEL_DIR = Path(__file__).absolute().parent / "model"
 
@@ -83,3 +83,24 @@ def test_load_metamodel_data():
     assert defined_graph_check["check"] == {
         "link1": "opt1 == test",
     }
+
+
+def test_parsed_metamodel_is_cached(tmp_path: Path):
+    model_data: str = load_model_data("simple_model.yaml")
+
+    with patch("builtins.open", mock_open(read_data=model_data)):
+        parsed = load_metamodel_data(cache_dir=tmp_path)
+
+    # Unchanged metamodel.yaml: ruamel is not used at all
+    with (
+        patch("builtins.open", mock_open(read_data=model_data)),
+        patch.object(yaml_parser, "_parse_metamodel", side_effect=AssertionError),
+    ):
+        cached = load_metamodel_data(cache_dir=tmp_path)
+    assert cached == parsed
+
+    # Changed metamodel.yaml: parsed again
+    changed = model_data.replace("Type 1", "Type One")
+    with patch("builtins.open", mock_open(read_data=changed)):
+        reparsed = load_metamodel_data(cache_dir=tmp_path)
+    assert reparsed.needs_types[0]["title"] == "Type One"
@@ -0,0 +1,109 @@
+# *******************************************************************************
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0
+#
+# SPDX-License-Identifier: Apache-2.0
+# *******************************************************************************
+from unittest.mock import Mock
+
+from sphinx.application import Sphinx
+from sphinx.environment import BuildEnvironment
+from sphinx_needs.data import NeedsView
+from sphinx_needs.need_item import NeedItem
+
+from src.extensions.score_metamodel.need_graph import (
+    build_need_graph,
+    forget_need_graph,
+    get_need_graph,
+)
+from src.extensions.score_metamodel.tests import need
+
+
+def _view(*needs: object) -> NeedsView:
+    return NeedsView._from_needs({n["id"]: n for n in needs})  # type: ignore[index]
+
+
+NEEDS = _view(
+    need(id="stkh_1", type="stkh_req"),
+    need(id="feat_1", type="feat_req", satisfies=["stkh_1"]),
+    need(id="feat_2", type="feat_req", satisfies=["stkh_1", "missing"]),
+    need(id="comp_1", type="comp_req", satisfies=["feat_1"], links=["feat_2"]),
+)
+
+
+def test_needs_are_indexed_by_id_and_type():
+    graph = build_need_graph(NEEDS, ["links", "satisfies"])
+
+    assert set(graph.by_id) == {"stkh_1", "feat_1", "feat_2", "comp_1"}
+    assert [n["id"] for n in graph.local_needs(["feat_req"])] == ["feat_1", "feat_2"]
+    assert [n["id"] for n in graph.local_needs(["feat_req"], exclude=True)] == [
+        "stkh_1",
+        "comp_1",
+    ]
+
+
+def test_links_are_indexed_in_both_directions():
+    graph = build_need_graph(NEEDS, ["links", "satisfies"])
+
+    assert graph.parents("feat_2", "satisfies") == ("stkh_1", "missing")
+    assert graph.children("stkh_1", "satisfies") == ("feat_1", "feat_2")
+    assert graph.children("feat_2", "links") == ("comp_1",)
+    assert graph.children("missing", "satisfies") == ("feat_2",)
+    assert graph.parents("stkh_1", "satisfies") == ()
+    assert graph.parents("feat_1", "unknown_link") == ()
+
+
+def test_graph_is_built_once_per_needs_view():
+    app = Mock(spec=Sphinx)
+    app.env = Mock(spec=BuildEnvironment)
+    app.config = Mock()
+    app.config.needs_links = {"satisfies": {}}
+
+    graph = get_need_graph(app, NEEDS)
+
+    assert get_need_graph(app, NEEDS) is graph
+    assert get_need_graph(app, _view(*NEEDS.values())) is not graph
+
+    # Once the needs are read again, nothing of the last build is kept
+    forget_need_graph(app, app.env)
+    assert not hasattr(app.env, "score_need_graph")
+    assert get_need_graph(app, NEEDS) is not graph
+
+
+def test_reachability_over_cycles_and_multiple_links():
+    needs = _view(
+        need(id="stkh_asil", type="stkh_req", safety="ASIL_B"),
+        need(id="stkh_qm", type="stkh_req", safety="QM"),
+        # feat_a and feat_b satisfy each other, and only feat_b traces further
+        need(id="feat_a", type="feat_req", satisfies=["feat_b"]),
+        need(id="feat_b", type="feat_req", satisfies=["feat_a", "stkh_asil"]),
+        need(id="feat_qm", type="feat_req", satisfies=["stkh_qm", "missing"]),
+        need(id="comp_1", type="comp_req", fulfils=["feat_a"]),
+        need(id="comp_2", type="comp_req", fulfils=["feat_qm"]),
+        need(id="comp_3", type="comp_req", satisfies=["comp_3"]),
+    )
+    graph = build_need_graph(needs, ["satisfies", "fulfils"])
+    checked: list[str] = []
+
+    def is_target(n: NeedItem) -> bool:
+        checked.append(n["id"])
+        return n["type"] == "stkh_req" and n["safety"] != "QM"
+
+    reached = graph.reaches(
+        ["comp_1", "comp_2", "comp_3", "stkh_asil"],
+        ["satisfies", "fulfils"],
+        is_target,
+    )
+
+    assert reached["comp_1"] and reached["feat_a"] and reached["feat_b"]
+    assert not reached["comp_2"] and not reached["feat_qm"]
+    assert not reached["comp_3"]
+    # The target itself does not count, only needs reached over links
+    assert not reached["stkh_asil"]
+    assert len(checked) == len(set(checked))
@@ -0,0 +1,63 @@
+# *******************************************************************************
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0
+#
+# SPDX-License-Identifier: Apache-2.0
+# *******************************************************************************
+import os
+from unittest.mock import Mock
+
+import pytest
+from sphinx.application import Sphinx
+from sphinx_needs.need_item import NeedItem
+
+from src.extensions.score_metamodel import CheckLogger, parallel_checks
+from src.extensions.score_metamodel.check_stats import CheckStatistics
+from src.extensions.score_metamodel.parallel_checks import run_local_checks
+from src.extensions.score_metamodel.tests import fake_check_logger, need
+
+
+def odd_ids(app: Sphinx, need: NeedItem, log: CheckLogger) -> None:
+    if int(need["id"].rpartition("_")[2]) % 2:
+        log.warning_for_option(need, "id", f"is odd (pid {os.getpid()})")
+
+
+def every_feat(app: Sphinx, need: NeedItem, log: CheckLogger) -> None:
+    log.warning_for_need(need, "new check", is_new_check=True)
+
+
+@pytest.mark.parametrize("jobs", [1, 3])
+def test_parallel_checks_log_like_serial(jobs: int, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(parallel_checks, "MIN_SHARD_SIZE", 2)
+    needs = [need(id=f"feat_req__x_{i}", type="feat_req") for i in range(20)]
+    log = fake_check_logger()
+
+    stats = CheckStatistics()
+    findings = run_local_checks(
+        Mock(spec=Sphinx), needs, {"feat_req": [odd_ids, every_feat]}, "", jobs, stats
+    )
+    assert len(findings) == len(needs)
+    for need_findings in findings:
+        log.add_findings(need_findings)
+    assert {f.check for f in log.records} == {"odd_ids", "every_feat"}
+
+    messages = [c.args[0] for c in log._mock_logger.warning.call_args_list]  # pyright: ignore[reportPrivateUsage]
+    assert [m.partition(" (pid")[0] for m in messages] == [
+        f"feat_req__x_{i}.id (feat_req__x_{i}): is odd" for i in range(1, 20, 2)
+    ]
+    pids = {m.partition("(pid ")[2] for m in messages}
+    assert (len(pids) > 1) == (jobs > 1)
+    assert log.warnings == 10
+    assert log.infos == 20
+
+    # Statistics of all workers are added up
+    assert [
+        (name, s.kind, s.needs, s.findings) for name, s in sorted(stats.checks.items())
+    ] == [("every_feat", "local", 20, 20), ("odd_ids", "local", 20, 10)]
+    assert "odd_ids" in stats.summary()
@@ -0,0 +1,46 @@
+# *******************************************************************************
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0
+#
+# SPDX-License-Identifier: Apache-2.0
+# *******************************************************************************
+from src.extensions.score_metamodel import ProhibitedWordCheck
+from src.extensions.score_metamodel.prohibited_words import compile_prohibited_words
+from src.extensions.score_metamodel.tests import need
+
+CHECKS = [
+    ProhibitedWordCheck("title_check", {"title": ["shall", "must"]}),
+    ProhibitedWordCheck(
+        "content_check",
+        {"content": ["really"], "title": ["really", "must"]},
+        types=["requirement"],
+    ),
+]
+
+
+def test_words_are_found_in_check_and_text_order():
+    prohibited = compile_prohibited_words(CHECKS)
+    n = need(title="It MUST, really, shall-be must.", content="Really? really")
+
+    assert prohibited.find(n, frozenset({"requirement"})) == [
+        ("title", "must"),
+        ("title", "must"),
+        ("content", "really"),
+        ("content", "really"),
+        ("title", "must"),
+        ("title", "really"),
+        ("title", "must"),
+    ]
+
+
+def test_checks_restricted_to_other_types_are_skipped():
+    prohibited = compile_prohibited_words(CHECKS)
+    n = need(title="It must really", content="really")
+
+    assert prohibited.find(n, frozenset({"process"})) == [("title", "must")]
@@ -0,0 +1,75 @@
+# *******************************************************************************
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0
+#
+# SPDX-License-Identifier: Apache-2.0
+# *******************************************************************************
+import json
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.extensions.score_metamodel import CheckLogger
+from src.extensions.score_metamodel.report import (
+    JSON_REPORT,
+    SARIF_REPORT,
+    write_reports,
+)
+from src.extensions.score_metamodel.tests import need
+
+
+def test_findings_are_written_as_json_and_sarif(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.delenv("RUNFILES_DIR", raising=False)
+    monkeypatch.delenv("RUNFILES_MANIFEST_FILE", raising=False)
+    log = CheckLogger(MagicMock(), "docs")
+    n = need(id="feat_req__a", status="wrong")
+    log.check = "check_options"
+    log.warning_for_option(n, "status", "does not follow pattern.")
+    log.check = "check_new"
+    log.warning_for_need(n, "is new.", is_new_check=True)
+
+    write_reports(tmp_path, log.records)
+
+    assert json.loads((tmp_path / JSON_REPORT).read_text()) == [
+        {
+            "check": "check_options",
+            "need": "feat_req__a",
+            "option": "status",
+            "severity": "warning",
+            "file": "docs/docname.rst",
+            "line": 42,
+            "message": "feat_req__a.status (wrong): does not follow pattern.",
+        },
+        {
+            "check": "check_new",
+            "need": "feat_req__a",
+            "option": "",
+            "severity": "info",
+            "file": "docs/docname.rst",
+            "line": 42,
+            "message": "feat_req__a: is new.",
+        },
+    ]
+
+    (run,) = json.loads((tmp_path / SARIF_REPORT).read_text())["runs"]
+    assert [r["id"] for r in run["tool"]["driver"]["rules"]] == [
+        "check_new",
+        "check_options",
+    ]
+    assert [(r["ruleId"], r["level"]) for r in run["results"]] == [
+        ("check_options", "warning"),
+        ("check_new", "note"),
+    ]
+    assert run["results"][0]["locations"][0]["physicalLocation"] == {
+        "artifactLocation": {"uri": "docs/docname.rst"},
+        "region": {"startLine": 42},
+    }
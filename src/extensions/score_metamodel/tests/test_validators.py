@@ -0,0 +1,114 @@
+# *******************************************************************************
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0
+#
+# SPDX-License-Identifier: Apache-2.0
+# *******************************************************************************
+import copy
+from pathlib import Path
+from unittest.mock import patch
+
+from score_metamodel import ScoreNeedType
+from score_metamodel.compiled_metamodel import compile_metamodel
+from score_metamodel.tests import fake_check_logger, need
+from score_metamodel.validators import CACHE_DIR, load_validators
+
+NEEDS_TYPES: list[ScoreNeedType] = [
+    {
+        "directive": "feat_req",
+        "title": "Feature Requirement",
+        "prefix": "feat_req__",
+        "tags": [],
+        "parts": 3,
+        "mandatory_options": {"id": "^feat_req__[a-z_]+$", "status": "^valid$"},
+        "optional_options": {},
+        "mandatory_links": {},
+        "optional_links": {},
+    },
+    {
+        "directive": "comp_req",
+        "title": "Component Requirement",
+        "prefix": "comp_req__",
+        "tags": [],
+        "parts": 3,
+        "mandatory_options": {"id": "^comp_req__[a-z_]+$"},
+        "optional_options": {"safety": "^(QM|ASIL_B)$"},
+        "mandatory_links": {"satisfies": "feat_req"},
+        "optional_links": {"belongs_to": "^comp__.*$"},
+    },
+]
+
+
+def test_generated_validators_check_options_and_links():
+    validators = load_validators(compile_metamodel(NEEDS_TYPES))
+
+    log = fake_check_logger()
+    validators["feat_req"](need(id="feat_req__a", type="feat_req"), log)
+    log.assert_warning(
+        "is missing required attribute: `status`.", expect_location=False
+    )
+
+    log = fake_check_logger()
+    n = need(
+        id="comp_req__a",
+        type="comp_req",
+        safety="ASIL_D",
+        satisfies=["EXT_feat_req__a"],
+    )
+    validators["comp_req"](n, log)
+    log.assert_warning(
+        "comp_req__a.safety (ASIL_D): does not follow pattern", expect_location=False
+    )
+
+    log = fake_check_logger()
+    n = need(id="comp_req__a", type="comp_req", belongs_to=["feat_req__a"])
+    validators["comp_req"](n, log)
+    log.assert_warning("is missing required link: `satisfies`.", expect_location=False)
+    # Wrong optional links are only reported as info
+    assert log.infos == 1
+
+
+def test_generated_validators_are_cached_on_disk(tmp_path: Path):
+    metamodel = compile_metamodel(NEEDS_TYPES)
+    _ = load_validators(metamodel, cache_dir=tmp_path)
+    (generated,) = (tmp_path / CACHE_DIR).glob("*.py")
+
+    with patch(
+        "score_metamodel.validators.generate_source", side_effect=AssertionError
+    ):
+        validators = load_validators(compile_metamodel(NEEDS_TYPES), tmp_path)
+
+    log = fake_check_logger()
+    validators["feat_req"](need(id="feat_req__a", type="feat_req", status="x"), log)
+    log.assert_warning(
+        "feat_req__a.status (x): does not follow pattern `^valid$`.",
+        expect_location=False,
+    )
+    assert list((tmp_path / CACHE_DIR).glob("*.py")) == [generated]
+
+
+def test_outdated_validators_are_removed(tmp_path: Path):
+    _ = load_validators(compile_metamodel(NEEDS_TYPES), cache_dir=tmp_path)
+    (outdated,) = (tmp_path / CACHE_DIR).glob("*.py")
+
+    # Patterns longer than any repr would show
+    changed = copy.deepcopy(NEEDS_TYPES)
+    changed[0]["mandatory_options"] = {
+        "id": "^feat_req__[a-z_]+$",
+        "status": "^(" + "|".join(["valid"] * 100) + "|invalid)$",
+    }
+    validators = load_validators(compile_metamodel(changed), cache_dir=tmp_path)
+
+    log = fake_check_logger()
+    validators["feat_req"](
+        need(id="feat_req__a", type="feat_req", status="invalid"), log
+    )
+    log.assert_no_warnings()
+    (generated,) = (tmp_path / CACHE_DIR).glob("*.py")
+    assert generated != outdated
@@ -0,0 +1,232 @@
+# *******************************************************************************
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0
+#
+# SPDX-License-Identifier: Apache-2.0
+# *******************************************************************************
+"""
+Option & link validators, generated from the compiled metamodel.
+
+Instead of looping over the rules of a need type for every need, one Python
+function per need type is generated, which checks its options and links one
+after the other. The compiled rules (patterns, allowed link targets) are bound
+to the generated code, and the generated module is stored on disk, keyed by a
+digest of the metamodel. So it is only generated again when the metamodel
+changes, and Python caches its bytecode like for any other module.
+"""
+
+import hashlib
+import importlib.util
+import json
+from collections.abc import Callable, Mapping
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, cast
+
+from sphinx_needs import logging
+from sphinx_needs.need_item import NeedItem
+
+from src.extensions.score_metamodel.compiled_metamodel import (
+    CompiledMetamodel,
+    CompiledNeedType,
+    LinkRule,
+    OptionRule,
+    get_compiled_metamodel,
+)
+from src.extensions.score_metamodel.derived import need_view
+from src.extensions.score_metamodel.log import CheckLogger
+from src.extensions.score_metamodel.metamodel_types import ScoreNeedType
+
+logger = logging.get_logger(__name__)
+
+Validator = Callable[[NeedItem, CheckLogger], None]
+
+# Generated modules, in the doctree dir
+CACHE_DIR = "score_metamodel_validators"
+
+
+def _shared_values(need: NeedItem, key: str, remove_prefix: bool = False):
+    return need_view(need).values(key, remove_prefix)
+
+
+def _rules(need_type: CompiledNeedType) -> tuple[OptionRule, ...]:
+    # In the order they are checked
+    return (
+        need_type.mandatory_options
+        + need_type.optional_options
+        + need_type.mandatory_links
+        + need_type.optional_links
+    )
+
+
+def _all_rules(metamodel: CompiledMetamodel) -> list[OptionRule]:
+    """All rules, their index is how generated code refers to them."""
+    return [rule for t in metamodel.types.values() for rule in _rules(t)]
+
+
+def _option_lines(index: int, rule: OptionRule, mandatory: bool) -> list[str]:
+    lines = [f"    values = normalized_values(need, {rule.name!r})"]
+    if mandatory:
+        msg = f"is missing required attribute: `{rule.name}`."
+        lines += ["    if not values:", f"        log.warning_for_need(need, {msg!r})"]
+    msg = f"does not follow pattern `{rule.pattern.pattern}`."
+    return lines + [
+        "    for value in values:",
+        f"        if not R[{index}].matches(value):",
+        f"            log.warning_for_option(need, {rule.name!r}, {msg!r})",
+    ]
+
+
+def _link_lines(
+    index: int, rule: LinkRule, mandatory: bool, treat_as_info: bool
+) -> list[str]:
+    lines = [f"    values = normalized_values(need, {rule.name!r}, True)"]
+    if mandatory:
+        msg = f"is missing required link: `{rule.name}`."
+        lines += ["    if not values:", f"        log.warning_for_need(need, {msg!r})"]
+    return lines + [
+        "    for value in values:",
+        f"        if not R[{index}].matches(value):",
+        "            log.warning_for_link(",
+        f"                need, {rule.name!r}, value, {list(rule.allowed)!r},",
+        f"                {rule.pattern.pattern!r}, is_new_check={treat_as_info},",
+        "            )",
+    ]
+
+
+def _function_lines(name: str, need_type: CompiledNeedType, first: int) -> list[str]:
+    lines = [f"def {name}(need, log):", f"    # {need_type.directive}"]
+    index = first
+    for rule in need_type.mandatory_options:
+        lines += _option_lines(index, rule, mandatory=True)
+        index += 1
+    for rule in need_type.optional_options:
+        lines += _option_lines(index, rule, mandatory=False)
+        index += 1
+    for rule in need_type.mandatory_links:
+        lines += _link_lines(index, rule, mandatory=True, treat_as_info=False)
+        index += 1
+    for rule in need_type.optional_links:
+        # Optional links are only reported as info for now
+        lines += _link_lines(index, rule, mandatory=False, treat_as_info=True)
+        index += 1
+    return [*lines, "    return", "", ""]
+
+
+def generate_source(metamodel: CompiledMetamodel, digest: str = "") -> str:
+    """
+    Python source with one 'validate_<n>(need, log)' per need type, and
+    VALIDATORS mapping directives to them. 'R' (the rules, see _all_rules) and
+    'normalized_values' are bound when loading it.
+    """
+    lines = [
+        "# Generated by score_metamodel/validators.py, do not edit.",
+        f"# digest: {digest}",
+        "",
+        "",
+    ]
+    functions: dict[str, str] = {}
+    first = 0
+    for n, need_type in enumerate(metamodel.types.values()):
+        name = f"validate_{n}"
+        lines += _function_lines(name, need_type, first)
+        functions[need_type.directive] = name
+        first += len(_rules(need_type))
+    lines.append("VALIDATORS = {")
+    lines += [f"    {d!r}: {name}," for d, name in functions.items()]
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+
+def _rule_data(rule: OptionRule) -> dict[str, object]:
+    data: dict[str, object] = {"name": rule.name, "pattern": rule.pattern.pattern}
+    if isinstance(rule, LinkRule):
+        data["allowed"] = list(rule.allowed)
+    return data
+
+
+def _digest(metamodel: CompiledMetamodel) -> str:
+    """Everything generate_source() depends on, in the order it is generated."""
+    rules: list[dict[str, object]] = [
+        {
+            "directive": t.directive,
+            "mandatory_options": [_rule_data(r) for r in t.mandatory_options],
+            "optional_options": [_rule_data(r) for r in t.optional_options],
+            "mandatory_links": [_rule_data(r) for r in t.mandatory_links],
+            "optional_links": [_rule_data(r) for r in t.optional_links],
+        }
+        for t in metamodel.types.values()
+    ]
+    sha = hashlib.sha256(Path(__file__).read_bytes())
+    sha.update(json.dumps(rules).encode())
+    return sha.hexdigest()
+
+
+def _load_module(source_file: Path, digest: str) -> dict[str, Any]:
+    spec = importlib.util.spec_from_file_location(
+        f"score_metamodel_validators_{digest[:16]}", source_file
+    )
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return vars(module)
+
+
+def _remove_outdated(directory: Path, digest: str) -> None:
+    """Modules (and their bytecode) generated for earlier metamodels."""
+    for path in [*directory.glob("*.py"), *directory.glob("__pycache__/*.pyc")]:
+        if not path.name.startswith(digest):
+            path.unlink(missing_ok=True)
+
+
+def _load_cached(cache_dir: Path, metamodel: CompiledMetamodel, digest: str):
+    source_file = cache_dir / CACHE_DIR / f"{digest}.py"
+    if not source_file.exists():
+        source_file.parent.mkdir(parents=True, exist_ok=True)
+        _remove_outdated(source_file.parent, digest)
+        tmp = source_file.with_suffix(".tmp")
+        _ = tmp.write_text(generate_source(metamodel, digest), encoding="utf-8")
+        _ = tmp.replace(source_file)
+    return _load_module(source_file, digest)
+
+
+def load_validators(
+    metamodel: CompiledMetamodel, cache_dir: Path | None = None
+) -> Mapping[str, Validator]:
+    """
+    Generate (or with 'cache_dir': load the previously generated) validators.
+    """
+    digest = _digest(metamodel)
+    if cache_dir is None:
+        namespace: dict[str, Any] = {}
+        code = compile(generate_source(metamodel, digest), "<validators>", "exec")
+        exec(code, namespace)
+    else:
+        namespace = _load_cached(cache_dir, metamodel, digest)
+    # The generated functions look these up as globals when they are called
+    namespace["R"] = tuple(_all_rules(metamodel))
+    namespace["normalized_values"] = _shared_values
+    return MappingProxyType(cast(dict[str, Validator], namespace["VALIDATORS"]))
+
+
+_validators: tuple[CompiledMetamodel, Mapping[str, Validator]] | None = None
+
+
+def get_validators(
+    needs_types: list[ScoreNeedType], cache_dir: Path | None = None
+) -> Mapping[str, Validator]:
+    """
+    Return the validators of 'needs_types' (usually app.config.needs_types),
+    per directive. Only loaded again when the compiled metamodel changes.
+    """
+    global _validators
+    metamodel = get_compiled_metamodel(needs_types)
+    if _validators is None or _validators[0] is not metamodel:
+        _validators = (metamodel, load_validators(metamodel, cache_dir))
+    return _validators[1]
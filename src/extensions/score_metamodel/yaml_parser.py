@@ -12,13 +12,15 @@
 # *******************************************************************************
 """Functionality related to reading in the SCORE metamodel.yaml"""
 
+import hashlib
+import pickle
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, cast
 
-from ruamel.yaml import YAML
 from sphinx_needs import logging
 
+from src.extensions.score_metamodel import metamodel_types
 from src.extensions.score_metamodel.metamodel_types import (
     ProhibitedWordCheck,
     ScoreNeedType,
@@ -26,6 +28,11 @@ from src.extensions.score_metamodel.metamodel_types import (
 
 logger = logging.get_logger(__name__)
 
+# Same as the version of the extension, see setup()
+METAMODEL_VERSION = "0.1"
+# Parsed metamodel.yaml, in the doctree dir
+CACHE_FILE = "score_metamodel_data.pickle"
+
 
 @dataclass
 class MetaModelData:
@@ -34,6 +41,8 @@ class MetaModelData:
     needs_fields: dict[str, dict[str, Any]]
     prohibited_words_checks: list[ProhibitedWordCheck]
     needs_graph_check: dict[str, object]
+    cycle_checks: dict[str, object]
+    orphan_checks: dict[str, object]
 
 
 def _parse_prohibited_words(
@@ -182,14 +191,30 @@ def _collect_all_custom_options(
     }
 
 
-def load_metamodel_data() -> MetaModelData:
-    """
-    Load metamodel.yaml and prepare data fields as needed for sphinx-needs.
-    """
-    yaml_path = Path(__file__).resolve().parent / "metamodel.yaml"
+def _plain(value: Any) -> Any:
+    """ruamel's Commented*/Scalar* types to builtins, so they pickle cheaply."""
+    if isinstance(value, dict):
+        return {k: _plain(v) for k, v in cast(dict[Any, Any], value).items()}
+    if isinstance(value, list):
+        return [_plain(v) for v in cast(list[Any], value)]
+    if isinstance(value, bool) or value is None:
+        return value
+    if isinstance(value, int) and type(value) is not int:
+        from ruamel.yaml.scalarbool import ScalarBoolean
 
-    with open(yaml_path, encoding="utf-8") as f:
-        data = cast(dict[str, Any], YAML().load(f))
+        if isinstance(value, ScalarBoolean):
+            return bool(value)
+    for t in (str, int, float):
+        if isinstance(value, t):
+            return t(value)
+    return value
+
+
+def _parse_metamodel(text: str) -> MetaModelData:
+    # Imported here, as it is not needed at all when the cache is used
+    from ruamel.yaml import YAML
+
+    data = cast(dict[str, Any], _plain(YAML().load(text)))
 
     # Some options are globally enabled for all types
     global_base_options_optional_opts = data.get("needs_types_base_options", {}).get(
@@ -213,4 +238,66 @@ def load_metamodel_data() -> MetaModelData:
         needs_fields=_collect_all_custom_options(needs_types),
         prohibited_words_checks=prohibited_words_checks,
         needs_graph_check=data.get("graph_checks", {}),
+        cycle_checks=data.get("cycle_checks", {}),
+        orphan_checks=data.get("orphan_checks", {}),
     )
+
+
+def _cache_key(text: str) -> str:
+    sha = hashlib.sha256(text.encode())
+    # The parsed result also depends on how it is parsed, and on the classes
+    # it is pickled as
+    sha.update(Path(__file__).read_bytes())
+    sha.update(Path(metamodel_types.__file__).read_bytes())
+    sha.update(METAMODEL_VERSION.encode())
+    return sha.hexdigest()
+
+
+def _load_cached(cache_file: Path, key: str) -> MetaModelData | None:
+    try:
+        with cache_file.open("rb") as f:
+            cached_key, metamodel = pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.debug(f"Ignoring unreadable metamodel cache {cache_file}: {e}")
+        return None
+    if cached_key != key or not isinstance(metamodel, MetaModelData):
+        return None
+    return metamodel
+
+
+def _save_cached(cache_file: Path, key: str, metamodel: MetaModelData) -> None:
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp = cache_file.with_suffix(".tmp")
+        with tmp.open("wb") as f:
+            pickle.dump((key, metamodel), f, pickle.HIGHEST_PROTOCOL)
+        _ = tmp.replace(cache_file)
+    except OSError as e:
+        # Read-only build dirs etc. are fine, it is only a cache
+        logger.debug(f"Could not write metamodel cache {cache_file}: {e}")
+
+
+def load_metamodel_data(cache_dir: Path | None = None) -> MetaModelData:
+    """
+    Load metamodel.yaml and prepare data fields as needed for sphinx-needs.
+
+    With 'cache_dir', the result is stored there and reused as long as
+    metamodel.yaml (and this parser) did not change.
+    """
+    yaml_path = Path(__file__).resolve().parent / "metamodel.yaml"
+
+    with open(yaml_path, encoding="utf-8") as f:
+        text = f.read()
+
+    if cache_dir is None:
+        return _parse_metamodel(text)
+
+    cache_file = cache_dir / CACHE_FILE
+    key = _cache_key(text)
+    metamodel = _load_cached(cache_file, key)
+    if metamodel is None:
+        metamodel = _parse_metamodel(text)
+        _save_cached(cache_file, key, metamodel)
+    return metamodel
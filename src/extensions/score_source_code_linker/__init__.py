@@ -21,11 +21,12 @@ source code links from a JSON file and add them to the needs.
 # This whole directory implements the above mentioned tool requirements
 
 import os
-from copy import deepcopy
+from collections import defaultdict
 from pathlib import Path
 from typing import cast
 
 from sphinx.application import Sphinx
+from sphinx.config import Config
 from sphinx.environment import BuildEnvironment
 from sphinx_needs.data import NeedsMutable, SphinxNeedsData
 from sphinx_needs.logging import get_logger
@@ -34,8 +35,19 @@ from sphinx_needs.need_item import NeedItem
 from src.extensions.score_source_code_linker.generate_source_code_links_json import (
     generate_source_code_links_json,
 )
-from src.extensions.score_source_code_linker.helpers import get_github_link
+from src.extensions.score_source_code_linker.helpers import (
+    get_repo_context,
+    prefetch_known_good_json,
+    reset_repo_contexts,
+)
+from src.extensions.score_source_code_linker.link_fields import (
+    LinkRecord,
+    render_link_fields,
+    store_link_records,
+    to_field_string,
+)
 from src.extensions.score_source_code_linker.need_source_links import (
+    SourceCodeLinks,
     group_by_need,
     load_source_code_links_combined_json,
     store_source_code_links_combined_json,
@@ -45,10 +57,12 @@ from src.extensions.score_source_code_linker.needlinks import (
     load_source_code_links_with_metadata_json,
 )
 from src.extensions.score_source_code_linker.repo_source_links import (
+    RepoSourceLinks,
     group_needs_by_repo,
     load_repo_source_links_json,
     store_repo_source_links_json,
 )
+from src.extensions.score_source_code_linker.suggestions import TrigramIndex
 from src.extensions.score_source_code_linker.testlink import (
     load_data_of_test_case_json,
     load_test_xml_parsed_json,
@@ -57,10 +71,8 @@ from src.extensions.score_source_code_linker.xml_parser import (
     construct_and_add_need,
     run_xml_parser,
 )
-from src.helper_lib import (
-    find_git_root,
-    find_ws_root,
-)
+from src.helper_lib import get_env_context
+from src.helper_lib.prefetch import reset_prefetches, wait_for_prefetches
 
 LOGGER = get_logger(__name__)
 # Uncomment this to enable more verbose logging
@@ -130,17 +142,15 @@ def setup_source_code_linker(app: Sphinx, ws_root: Path):
         types=bool,
         description="Skip rescanning source code files via the source code linker.",
     )
-
-    # Define need_string_links here to not have it in conf.py
-    # source_code_link and testlinks have the same schema
-    app.config.needs_string_links.setdefault(
-        "source_code_linker",
-        {
-            "regex": r"(?P<url>.+)<>(?P<name>.+)",
-            "link_url": "{{url}}",
-            "link_name": "{{name}}",
-            "options": ["source_code_link", "testlink"],
-        },
+    app.add_config_value(
+        "source_code_linker_summary_threshold",
+        100,
+        rebuild="html",
+        types=int,
+        description=(
+            "Needs with more source code or test links than this only show counts, "
+            "with the full list in a separate JSON file. 0 disables summaries."
+        ),
     )
 
     score_sourcelinks_json = os.environ.get("SCORE_SOURCELINKS")
@@ -179,7 +189,7 @@ def setup_test_code_linker(app: Sphinx, env: BuildEnvironment):
         not tl_cache_json.exists()
         or not app.config.skip_rescanning_via_source_code_linker
     ):
-        ws_root = find_ws_root()
+        ws_root = get_env_context().ws_root
         if not ws_root:
             return
         LOGGER.debug(
@@ -267,24 +277,44 @@ def setup_repo_linker(app: Sphinx, _: BuildEnvironment):
         build_and_save_repo_scl_file(app.outdir)
 
 
+def prefetch_repo_metadata(_: Sphinx, __: Config):
+    # Git metadata (remote url & commit) is resolved at most once per build,
+    # in the background while Sphinx starts up.
+    # Whatever is resolved afterwards is reused by every link of this build.
+    reset_repo_contexts()
+    known_good_json = os.environ.get("KNOWN_GOOD_JSON")
+    if known_good_json:
+        prefetch_known_good_json(Path(known_good_json))
+
+
+def finish_prefetching(_: Sphinx):
+    # Do not let parallel read workers fork while lookups are still running
+    wait_for_prefetches()
+
+
 def setup_once(app: Sphinx):
     # might be the only way to solve this?
     if "skip_rescanning_via_source_code_linker" in app.config:
         return
-    LOGGER.debug(f"DEBUG: Workspace root is {find_ws_root()}")
+    env_context = get_env_context()
+    LOGGER.debug(f"DEBUG: Workspace root is {env_context.ws_root}")
     LOGGER.debug(
         f"DEBUG: Current working directory is {Path('.')} = {Path('.').resolve()}"
     )
-    LOGGER.debug(f"DEBUG: Git root is {find_git_root()}")
+    LOGGER.debug(f"DEBUG: Git root is {env_context.git_root}")
 
     # Run only for local files!
     # ws_root is not set when running on external repositories (dependencies).
-    ws_root = find_ws_root()
+    ws_root = env_context.ws_root
     if not ws_root:
         return
 
     # When BUILD_WORKSPACE_DIRECTORY is set, we are inside a git repository.
-    assert find_git_root()
+    assert env_context.git_root
+
+    app.connect("config-inited", reset_prefetches, priority=50)
+    app.connect("config-inited", prefetch_repo_metadata, priority=100)
+    app.connect("builder-inited", finish_prefetching)
 
     # Register & Run (if needed) parsing & saving of JSON caches
     setup_source_code_linker(app, ws_root)
@@ -294,6 +324,8 @@ def setup_once(app: Sphinx):
 
     # Priority=515 to ensure it's called after the test linker & combined connection
     app.connect("env-updated", inject_links_into_needs, priority=525)
+    # After sphinx-needs rendered needs & needtables (default priority 500)
+    app.connect("doctree-resolved", render_link_fields, priority=600)
 
 
 def setup(app: Sphinx) -> dict[str, str | bool]:
@@ -327,14 +359,11 @@ def inject_links_into_needs(app: Sphinx, env: BuildEnvironment) -> None:
         env: Buildenvironment, this is filled automatically
         app: Sphinx app application, this is filled automatically
     """
-    ws_root = find_ws_root()
-    assert ws_root
+    assert get_env_context().ws_root
 
     Needs_Data = SphinxNeedsData(env)
+    # Needs are looked up by ID, only the ones that get links are touched.
     needs = Needs_Data.get_needs_mutable()
-    needs_copy = deepcopy(
-        needs
-    )  # TODO: why do we create a copy? Can we also needs_copy = needs[:]? copy(needs)?
 
     # Enabled automatically for DEBUGGING
     if LOGGER.getEffectiveLevel() >= 10:
@@ -352,40 +381,104 @@ def inject_links_into_needs(app: Sphinx, env: BuildEnvironment) -> None:
     scl_by_module = load_repo_source_links_json(
         get_cache_filename(app.outdir, "score_repo_grouped_scl_cache.json")
     )
+    updates = compute_link_updates(needs, scl_by_module)
+    apply_link_updates(needs, updates)
+    store_link_records(env, updates)
+
+
+def _warn_needs_not_found(
+    needs: NeedsMutable, not_found: dict[str, list[SourceCodeLinks]]
+) -> None:
+    """
+    One warning per missing need ID (not per link), with the closest
+    existing IDs as suggestions.
+    """
+    if not not_found:
+        return
+    index = TrigramIndex(needs.keys())
+    for need_id, source_code_links in not_found.items():
+        references = [
+            (f"{n.file}:{n.line}", "CODE LINK")
+            for scl in source_code_links
+            for n in scl.links.CodeLinks
+        ] + [
+            (f"{n.file}:{n.line}", "TEST LINK")
+            for scl in source_code_links
+            for n in scl.links.TestLinks
+        ]
+        if not references:
+            continue
+        location, kind = references[0]
+        message = f"{location}: Could not find {need_id} in documentation [{kind}]"
+        if len(references) > 1:
+            others = ", ".join(f"{loc} [{k}]" for loc, k in references[1:])
+            message += f", also referenced by {others}"
+        if suggestions := index.suggest(need_id):
+            message += f". Did you mean: {', '.join(suggestions)}?"
+        # TODO: print github annotations as in https://github.com/eclipse-score/bazel_registry/blob/7423b9996a45dd0a9ec868e06a970330ee71cf4f/tools/verify_semver_compatibility_level.py#L126-L129
+        LOGGER.warning(message, type="score_source_code_linker")
+
+
+def compute_link_updates(
+    needs: NeedsMutable, scl_by_module: list[RepoSourceLinks]
+) -> dict[str, dict[str, list[LinkRecord]]]:
+    """
+    Build the new 'source_code_link' & 'testlink' records of all linked needs.
+    Nothing is modified here, links to unknown needs are reported.
+    Returns {need id: {option: records}}.
+    """
+    updates: dict[str, dict[str, list[LinkRecord]]] = {}
+    not_found: dict[str, list[SourceCodeLinks]] = defaultdict(list)
     for module_grouped_needs in scl_by_module:
+        # One RepoContext per repository, so rendering links never calls git
+        repo = module_grouped_needs.repo
+        repo_context = get_repo_context(repo)
         for source_code_links in module_grouped_needs.needs:
-            need = find_need(needs_copy, source_code_links.need)
-            if need is None:
-                # TODO: print github annotations as in https://github.com/eclipse-score/bazel_registry/blob/7423b9996a45dd0a9ec868e06a970330ee71cf4f/tools/verify_semver_compatibility_level.py#L126-L129
-                for n in source_code_links.links.CodeLinks:
-                    LOGGER.warning(
-                        f"{n.file}:{n.line}: Could not find {source_code_links.need} "
-                        "in documentation [CODE LINK]",
-                        type="score_source_code_linker",
+            if find_need(needs, source_code_links.need) is None:
+                not_found[source_code_links.need].append(source_code_links)
+                continue
+            updates[source_code_links.need] = {
+                "source_code_link": [
+                    LinkRecord(
+                        repo_context.link(n),
+                        f"{n.file}:{n.line}",
+                        repo=repo.name,
+                        file=str(n.file),
                     )
-                for n in source_code_links.links.TestLinks:
-                    LOGGER.warning(
-                        f"{n.file}:{n.line}: Could not find {source_code_links.need} "
-                        "in documentation [TEST LINK]",
-                        type="score_source_code_linker",
+                    for n in source_code_links.links.CodeLinks
+                ],
+                "testlink": [
+                    LinkRecord(
+                        repo_context.link(n),
+                        n.name,
+                        repo=repo.name,
+                        file=str(n.file),
+                        result=n.result,
                     )
-                continue
+                    for n in source_code_links.links.TestLinks
+                ],
+            }
+    _warn_needs_not_found(needs, not_found)
+    return updates
 
-            need_as_dict = cast(dict[str, object], need)
-            metadata = module_grouped_needs.repo
-            need_as_dict["source_code_link"] = ", ".join(
-                f"{get_github_link(metadata, n)}<>{n.file}:{n.line}"
-                for n in source_code_links.links.CodeLinks
-            )
-            need_as_dict["testlink"] = ", ".join(
-                f"{get_github_link(metadata, n)}<>{n.name}"
-                for n in source_code_links.links.TestLinks
-            )
 
-            # NOTE: Removing & adding the need is important to make sure
-            # the needs gets 're-evaluated'.
-            Needs_Data.remove_need(need["id"])
-            Needs_Data.add_need(need)
+def apply_link_updates(
+    needs: NeedsMutable, updates: dict[str, dict[str, list[LinkRecord]]]
+) -> None:
+    """
+    Apply all values computed by 'compute_link_updates' in one pass.
+    The needs get the string form of the records (see link_fields.py).
+
+    Setting an option on a NeedItem only stores the value of that extra option,
+    nothing computed from it is evaluated again. None of the computed fields
+    depend on these options, so the needs stay where they are. (Removing &
+    re-adding each need did not re-evaluate anything either, it only dropped
+    its doctree node, which needextract relies on.)
+    """
+    for need_id, values in updates.items():
+        need_as_dict = cast(dict[str, object], needs[need_id])
+        for option, records in values.items():
+            need_as_dict[option] = to_field_string(records)
 
 
 #          ╭──────────────────────────────────────╮
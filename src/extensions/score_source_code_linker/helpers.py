@@ -11,7 +11,10 @@
 # SPDX-License-Identifier: Apache-2.0
 # *******************************************************************************
 import json
+from dataclasses import dataclass
+from functools import lru_cache, partial
 from pathlib import Path
+from typing import Any
 
 # Import types that depend on score_source_code_linker
 from src.extensions.score_source_code_linker.needlinks import DefaultNeedLink, NeedLink
@@ -21,10 +24,71 @@ from src.extensions.score_source_code_linker.testlink import (
     DataOfTestCase,
 )
 from src.helper_lib import (
-    find_git_root,
     get_current_git_hash,
-    get_github_base_url,
+    get_env_context,
+    get_github_repo_info,
 )
+from src.helper_lib.prefetch import await_prefetched, prefetch
+
+
+@dataclass(frozen=True)
+class RepoContext:
+    """
+    Everything needed to render a GitHub link for one repository.
+
+    Resolved once per build (see 'resolve_local_repo_context'), so rendering a
+    link is a pure string format and never has to ask git for anything.
+    """
+
+    base_url: str
+    commit: str
+
+    def link(self, link: NeedLink | DataForTestLink | DataOfTestCase) -> str:
+        return f"{self.base_url}/blob/{self.commit}/{link.file}#L{link.line}"
+
+
+@lru_cache
+def _local_repo_context(git_root: Path) -> RepoContext:
+    return RepoContext(
+        base_url=f"https://github.com/{get_github_repo_info(git_root)}",
+        commit=get_current_git_hash(git_root),
+    )
+
+
+def resolve_local_repo_context() -> RepoContext:
+    """
+    Return the RepoContext of the local repository (//:docs).
+
+    The git lookups only run the first time this is called for a git root.
+    """
+    git_root = _local_git_root()
+    return await_prefetched(
+        f"repo_context:{git_root}", partial(_local_repo_context, git_root)
+    )
+
+
+def _local_git_root() -> Path:
+    git_root = get_env_context().git_root
+    return git_root if git_root is not None else Path()
+
+
+def reset_repo_contexts() -> None:
+    """
+    Forget all resolved RepoContexts and start resolving the local one in the
+    background. Called at the start of every build, so e.g. live_preview
+    picks up new commits.
+    """
+    _local_repo_context.cache_clear()
+    git_root = _local_git_root()
+    prefetch(f"repo_context:{git_root}", partial(_local_repo_context, git_root))
+
+
+def get_repo_context(metadata: RepoInfo) -> RepoContext:
+    if not metadata.hash:
+        # Local path (//:docs)
+        return resolve_local_repo_context()
+    # Ref-Integration path (//:docs_combo..)
+    return RepoContext(base_url=metadata.url, commit=metadata.hash)
 
 
 def get_github_link(
@@ -33,11 +97,7 @@ def get_github_link(
 ) -> str:
     if link is None:
         link = DefaultNeedLink()
-    if not metadata.hash:
-        # Local path (//:docs)
-        return get_github_link_from_git(link)
-    # Ref-Integration path (//:docs_combo..)
-    return get_github_link_from_json(metadata, link)
+    return get_repo_context(metadata).link(link)
 
 
 def get_github_link_from_git(
@@ -45,12 +105,7 @@ def get_github_link_from_git(
 ) -> str:
     if link is None:
         link = DefaultNeedLink()
-    passed_git_root = find_git_root()
-    if passed_git_root is None:
-        passed_git_root = Path()
-    base_url = get_github_base_url()
-    current_hash = get_current_git_hash(passed_git_root)
-    return f"{base_url}/blob/{current_hash}/{link.file}#L{link.line}"
+    return resolve_local_repo_context().link(link)
 
 
 def get_github_link_from_json(
@@ -59,9 +114,7 @@ def get_github_link_from_json(
 ) -> str:
     if link is None:
         link = DefaultNeedLink()
-    base_url = metadata.url
-    current_hash = metadata.hash
-    return f"{base_url}/blob/{current_hash}/{link.file}#L{link.line}"
+    return RepoContext(base_url=metadata.url, commit=metadata.hash).link(link)
 
 
 def parse_repo_name_from_path(path: Path) -> str:
@@ -87,11 +140,26 @@ def parse_repo_name_from_path(path: Path) -> str:
     return "local_repo"
 
 
+def load_known_good_json(known_good_json: Path) -> dict[str, Any]:
+    with open(known_good_json) as f:
+        return json.load(f)
+
+
+def prefetch_known_good_json(known_good_json: Path) -> None:
+    prefetch(
+        f"known_good:{known_good_json}",
+        partial(load_known_good_json, known_good_json),
+    )
+
+
 def parse_info_from_known_good(
     known_good_json: Path, repo_name: str
 ) -> tuple[str, str]:
-    with open(known_good_json) as f:
-        kg_json = json.load(f)
+    # Parsed only once per build if it was prefetched, instead of once per test.xml
+    kg_json = await_prefetched(
+        f"known_good:{known_good_json}",
+        partial(load_known_good_json, known_good_json),
+    )
 
     #   ───────[ Assert our worldview that has to exist here ]─────
     assert kg_json, (
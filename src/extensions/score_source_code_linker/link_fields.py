@@ -0,0 +1,196 @@
+# *******************************************************************************
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0
+#
+# SPDX-License-Identifier: Apache-2.0
+# *******************************************************************************
+
+"""
+Structured 'source_code_link' & 'testlink' fields.
+
+The need options keep the "url<>name, url<>name" string form, because that is
+what ends up in needs.json and what filters like `testlink != ''` work on.
+For rendering, the link records are stored next to it in the environment, so the
+write phase turns them into references directly instead of sphinx-needs parsing
+every single link via 'needs_string_links' regex & templates.
+
+Needs with very many links (see 'source_code_linker_summary_threshold') only
+show counts per repo & file (and per result for tests). The full list is written
+to a JSON file that is only loaded when following its link.
+"""
+
+import hashlib
+import json
+from collections import Counter, defaultdict
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from urllib.parse import unquote
+
+from docutils import nodes
+from sphinx.application import Sphinx
+from sphinx.environment import BuildEnvironment
+from sphinx.util.osutil import relative_uri
+
+LINK_FIELDS = ("source_code_link", "testlink")
+_FIELD_CLASSES = {f"needs_{field}" for field in LINK_FIELDS}
+
+# Full link lists of summarised fields, relative to the output directory
+FRAGMENT_DIR = "_source_links"
+
+# Separators of the string form
+_LINK_SEPARATOR = ", "
+_URL_NAME_SEPARATOR = "<>"
+
+
+@dataclass(frozen=True)
+class LinkRecord:
+    url: str
+    name: str
+    # Only used for summaries, not part of the string form
+    repo: str = ""
+    file: str = ""
+    result: str = ""
+
+
+def _escape_url(url: str) -> str:
+    # Percent-encoding a comma does not change where the url points to
+    return url.replace(",", "%2C")
+
+
+def _escape_name(name: str) -> str:
+    return name.replace("%", "%25").replace(",", "%2C")
+
+
+def to_field_string(records: list[LinkRecord]) -> str:
+    """
+    The needs.json compatible string form of a link field. Commas within urls
+    and names are percent-encoded, as they separate the links.
+    """
+    return _LINK_SEPARATOR.join(
+        f"{_escape_url(r.url)}{_URL_NAME_SEPARATOR}{_escape_name(r.name)}"
+        for r in records
+    )
+
+
+def parse_field_string(value: str) -> list[LinkRecord] | None:
+    """
+    Reverse of 'to_field_string', for values that were not injected by this build
+    (e.g. external needs). Returns None if the value is not in the string form.
+    """
+    records: list[LinkRecord] = []
+    for link in value.split(","):
+        url, sep, name = link.strip().partition(_URL_NAME_SEPARATOR)
+        if not sep or not url or not name:
+            return None
+        url, name = url.replace("%2C", ","), unquote(name)
+        # Links point to '<repo url>/blob/<hash>/<file>#L<line>'
+        repo, _, path = url.partition("/blob/")
+        file = path.partition("/")[2].partition("#")[0]
+        records.append(LinkRecord(url, name, repo=repo, file=file))
+    return records
+
+
+def store_link_records(
+    env: BuildEnvironment, updates: dict[str, dict[str, list[LinkRecord]]]
+) -> None:
+    """
+    Remember the records of all injected link fields, keyed by their string form.
+    That is what the rendered need (layout & needtable) contains.
+    """
+    env.score_link_records = {  # pyright: ignore[reportAttributeAccessIssue]
+        to_field_string(records): records
+        for fields in updates.values()
+        for records in fields.values()
+        if records
+    }
+
+
+def _render_records(records: list[LinkRecord]) -> list[nodes.Node]:
+    rendered: list[nodes.Node] = []
+    for record in records:
+        if rendered:
+            # Same separator sphinx-needs uses between string_links
+            rendered.append(nodes.emphasis("; ", "; "))
+        rendered.append(nodes.reference(record.name, record.name, refuri=record.url))
+    return rendered
+
+
+def _is_link_field(node: nodes.Element) -> bool:
+    return not _FIELD_CLASSES.isdisjoint(node["classes"])
+
+
+def _format_counts(counts: Counter[str]) -> str:
+    return ", ".join(f"{key}: {count}" for key, count in sorted(counts.items()))
+
+
+def _write_fragment(app: Sphinx, records: list[LinkRecord]) -> str | None:
+    """
+    Write the full list of links to a JSON file next to the html output, so it
+    is only downloaded on demand. Returns its path relative to the output dir.
+    """
+    if app.builder.format != "html":
+        return None
+    content = json.dumps([asdict(r) for r in records], indent=0)
+    # Named by content, the same links (e.g. one test verifying several needs)
+    # are only written once, also from parallel writers.
+    digest = hashlib.sha256(content.encode()).hexdigest()[:16]
+    fragment = f"{FRAGMENT_DIR}/{digest}.json"
+    path = Path(app.outdir) / fragment
+    if not path.exists():
+        path.parent.mkdir(parents=True, exist_ok=True)
+        _ = path.write_text(content, encoding="utf-8")
+    return fragment
+
+
+def _render_summary(
+    app: Sphinx, docname: str, field_node: nodes.Element, records: list[LinkRecord]
+) -> list[nodes.Node]:
+    rendered: list[nodes.Node] = [nodes.Text(f"{len(records)} links")]
+    if "needs_testlink" in field_node["classes"]:
+        results = Counter(r.result or "unknown" for r in records)
+        rendered.append(nodes.Text(f" ({_format_counts(results)})"))
+    rendered.append(nodes.Text(": "))
+
+    by_repo: dict[str, Counter[str]] = defaultdict(Counter)
+    for r in records:
+        by_repo[r.repo][r.file or r.name] += 1
+    for index, (repo, files) in enumerate(sorted(by_repo.items())):
+        if index:
+            rendered.append(nodes.emphasis("; ", "; "))
+        rendered.append(nodes.strong(repo, repo or "local"))
+        rendered.append(nodes.Text(f" {_format_counts(files)}"))
+
+    if fragment := _write_fragment(app, records):
+        uri = relative_uri(app.builder.get_target_uri(docname), fragment)
+        rendered.append(nodes.Text(" "))
+        rendered.append(nodes.reference("", "(all links)", refuri=uri))
+    return rendered
+
+
+def render_link_fields(app: Sphinx, doctree: nodes.document, docname: str) -> None:
+    """
+    Replace the string form of link fields in rendered needs & needtables
+    with references. Runs after sphinx-needs has rendered them.
+    Fields with more links than 'source_code_linker_summary_threshold'
+    only show counts, plus a link to the full list.
+    """
+    known: dict[str, list[LinkRecord]] = getattr(app.env, "score_link_records", {})
+    threshold: int = app.config.source_code_linker_summary_threshold
+    fields = [n for n in doctree.findall(nodes.Element) if _is_link_field(n)]
+    for field_node in fields:
+        for text in list(field_node.findall(nodes.Text)):
+            value = text.astext()
+            records = known.get(value) or parse_field_string(value)
+            if not records:
+                continue
+            if 0 < threshold < len(records):
+                rendered = _render_summary(app, docname, field_node, records)
+            else:
+                rendered = _render_records(records)
+            text.parent.replace(text, rendered)
@@ -0,0 +1,76 @@
+# *******************************************************************************
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0
+#
+# SPDX-License-Identifier: Apache-2.0
+# *******************************************************************************
+
+"""
+"Did you mean ...?" suggestions for need IDs that could not be found.
+
+All need IDs are indexed once by their trigrams (3 character substrings).
+A lookup only scores IDs that share a *rare* trigram with the query, so it does
+not get slower with thousands of IDs that all start with e.g. 'tool_req__'.
+"""
+
+from collections import Counter, defaultdict
+from collections.abc import Iterable
+
+# Trigrams found in more than this share of all IDs are not used to find
+# candidates, they match (almost) everything anyway.
+_MAX_TRIGRAM_SHARE = 0.05
+# Below this many IDs every trigram is used
+_MIN_IDS_FOR_RARE_TRIGRAMS = 200
+# How many IDs with the most shared trigrams are scored per requested result
+_CANDIDATES_PER_RESULT = 10
+
+
+def _trigrams(text: str) -> frozenset[str]:
+    # Padding makes the start & end of an ID count more than its middle
+    padded = f"  {text.lower()} "
+    return frozenset(padded[i : i + 3] for i in range(len(padded) - 2))
+
+
+class TrigramIndex:
+    def __init__(self, ids: Iterable[str]):
+        self._ids: list[str] = list(ids)
+        self._trigrams: list[frozenset[str]] = [_trigrams(i) for i in self._ids]
+        self._postings: dict[str, list[int]] = defaultdict(list)
+        for index, trigrams in enumerate(self._trigrams):
+            for trigram in trigrams:
+                self._postings[trigram].append(index)
+
+        max_postings = len(self._ids) * _MAX_TRIGRAM_SHARE
+        self._frequent: set[str] = (
+            {t for t, p in self._postings.items() if len(p) > max_postings}
+            if len(self._ids) >= _MIN_IDS_FOR_RARE_TRIGRAMS
+            else set()
+        )
+
+    def suggest(
+        self, query: str, limit: int = 3, min_similarity: float = 0.4
+    ) -> list[str]:
+        """
+        Return up to 'limit' IDs most similar to 'query' (Jaccard similarity of
+        their trigrams), best match first.
+        """
+        query_trigrams = _trigrams(query)
+        # Count shared (rare) trigrams first, only the best of those get scored
+        shared: Counter[int] = Counter()
+        for trigram in query_trigrams - self._frequent or query_trigrams:
+            shared.update(self._postings.get(trigram, ()))
+
+        scored: list[tuple[float, str]] = []
+        for index, _ in shared.most_common(limit * _CANDIDATES_PER_RESULT):
+            trigrams = self._trigrams[index]
+            common = len(query_trigrams & trigrams)
+            similarity = common / (len(query_trigrams) + len(trigrams) - common)
+            if similarity >= min_similarity:
+                scored.append((-similarity, self._ids[index]))
+        return [need_id for _, need_id in sorted(scored)[:limit]]
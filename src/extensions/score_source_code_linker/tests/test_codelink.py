@@ -36,6 +36,8 @@ from sphinx_needs.need_item import (
 )
 
 from src.extensions.score_source_code_linker import (
+    apply_link_updates,
+    compute_link_updates,
     find_need,
     get_cache_filename,
     group_by_need,
@@ -43,6 +45,15 @@ from src.extensions.score_source_code_linker import (
 from src.extensions.score_source_code_linker.helpers import (
     get_github_link,
 )
+from src.extensions.score_source_code_linker.link_fields import (
+    LinkRecord,
+    parse_field_string,
+    to_field_string,
+)
+from src.extensions.score_source_code_linker.need_source_links import (
+    NeedSourceLinks,
+    SourceCodeLinks,
+)
 from src.extensions.score_source_code_linker.needlinks import (
     MetaData,
     NeedLink,
@@ -54,7 +65,11 @@ from src.extensions.score_source_code_linker.needlinks import (
     store_source_code_links_json,
     store_source_code_links_with_metadata_json,
 )
-from src.extensions.score_source_code_linker.repo_source_links import RepoInfo
+from src.extensions.score_source_code_linker.repo_source_links import (
+    RepoInfo,
+    RepoSourceLinks,
+)
+from src.extensions.score_source_code_linker.testlink import DataForTestLink
 from src.helper_lib import (
     get_current_git_hash,
 )
@@ -63,6 +78,7 @@ from src.helper_lib import (
 def test_need(**kwargs: Any) -> NeedItem:
     """Convenience function to create a NeedItem object with some defaults."""
 
+    extras = kwargs.pop("extras", {})
     kwargs.setdefault("id", "test_need")
     kwargs.setdefault("type", "requirement")
     kwargs.setdefault("title", "")
@@ -102,7 +118,7 @@ def test_need(**kwargs: Any) -> NeedItem:
         source=source,
         content=content,
         core=NeedsInfoType(**kwargs),
-        extras={},
+        extras=extras,
         links={},
     )
 
@@ -307,6 +323,107 @@ def test_find_need_not_found():
     assert result is None
 
 
+def test_link_updates_are_computed_then_applied(
+    sample_needlinks: list[NeedLink],
+) -> None:
+    """All values are rendered first, unknown needs are skipped."""
+    unset = {"source_code_link": "", "testlink": ""}
+    all_needs = make_needs(
+        {
+            "TREQ_ID_1": {"id": "TREQ_ID_1", "extras": dict(unset)},
+            "TREQ_ID_3": {"id": "TREQ_ID_3", "extras": dict(unset)},
+        }
+    )
+    testlink = DataForTestLink(
+        name="test_feature",
+        file=Path("src/tests/test_feature.py"),
+        line=10,
+        need="TREQ_ID_1",
+        verify_type="fully",
+        result="passed",
+    )
+    repo = RepoInfo(name="local_repo", hash="abc123", url="https://github.com/o/r")
+    scl_by_module = [
+        RepoSourceLinks(
+            repo=repo,
+            needs=[
+                SourceCodeLinks(
+                    need="TREQ_ID_1",
+                    links=NeedSourceLinks(
+                        CodeLinks=[sample_needlinks[0]], TestLinks=[testlink]
+                    ),
+                ),
+                SourceCodeLinks(
+                    need="UNKNOWN_NEED",
+                    links=NeedSourceLinks(CodeLinks=[sample_needlinks[0]]),
+                ),
+            ],
+        )
+    ]
+
+    updates = compute_link_updates(all_needs, scl_by_module)
+    assert updates == {
+        "TREQ_ID_1": {
+            "source_code_link": [
+                LinkRecord(
+                    "https://github.com/o/r/blob/abc123/src/implementation1.py#L3",
+                    "src/implementation1.py:3",
+                    repo="local_repo",
+                    file="src/implementation1.py",
+                )
+            ],
+            "testlink": [
+                LinkRecord(
+                    "https://github.com/o/r/blob/abc123/src/tests/test_feature.py#L10",
+                    "test_feature",
+                    repo="local_repo",
+                    file="src/tests/test_feature.py",
+                    result="passed",
+                )
+            ],
+        }
+    }
+    # Nothing is modified before the updates are applied
+    assert all_needs["TREQ_ID_1"]["source_code_link"] == ""
+
+    need_before = all_needs["TREQ_ID_1"]
+    apply_link_updates(all_needs, updates)
+    assert all_needs["TREQ_ID_1"] is need_before
+    # The needs (and therefore needs.json) keep the "url<>name" string form
+    assert all_needs["TREQ_ID_1"]["testlink"] == (
+        "https://github.com/o/r/blob/abc123/src/tests/test_feature.py#L10<>test_feature"
+    )
+    assert all_needs["TREQ_ID_3"]["source_code_link"] == ""
+
+
+def test_link_field_string_roundtrip() -> None:
+    records = [
+        LinkRecord("https://github.com/o/r/blob/abc/a.py#L1", "a.py:1"),
+        LinkRecord("https://github.com/o/r/blob/abc/b.py#L2", "b.py:2"),
+    ]
+    parsed = parse_field_string(to_field_string(records))
+    assert parsed is not None
+    assert [(r.url, r.name) for r in parsed] == [(r.url, r.name) for r in records]
+    # repo & file are taken from the url, for summaries
+    assert (parsed[1].repo, parsed[1].file) == ("https://github.com/o/r", "b.py")
+    # Anything else is left alone when rendering
+    assert parse_field_string("source_code_link: ") is None
+
+
+def test_link_field_string_with_commas_in_paths() -> None:
+    records = [
+        LinkRecord("https://github.com/o/r/blob/abc/a,b.py#L1", "a,b.py:1"),
+        LinkRecord("https://github.com/o/r/blob/abc/c.py#L2", "100%2C.py:2"),
+    ]
+    field = to_field_string(records)
+    assert field.count(",") == 1
+
+    parsed = parse_field_string(field)
+    assert parsed is not None
+    assert [(r.url, r.name) for r in parsed] == [(r.url, r.name) for r in records]
+    assert parsed[0].file == "a,b.py"
+
+
 def test_group_by_need(sample_needlinks: list[NeedLink]) -> None:
     """Test grouping source code links by need ID."""
     result = group_by_need(sample_needlinks)
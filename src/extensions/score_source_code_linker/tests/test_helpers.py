@@ -19,11 +19,16 @@ from pathlib import Path
 
 import pytest
 
+from src.extensions.score_source_code_linker import helpers
 from src.extensions.score_source_code_linker.helpers import (
+    RepoContext,
     get_github_link,
     get_github_link_from_json,
+    get_repo_context,
     parse_info_from_known_good,
     parse_repo_name_from_path,
+    reset_repo_contexts,
+    resolve_local_repo_context,
 )
 from src.extensions.score_source_code_linker.needlinks import DefaultNeedLink
 from src.extensions.score_source_code_linker.repo_source_links import RepoInfo
@@ -393,6 +398,62 @@ def test_get_github_link_with_real_repo(git_repo: Path) -> None:
     assert hash_from_link == actual_hash
 
 
+#              ╭──────────────────────────────────────────────────────────╮
+#              │                       REPO CONTEXT                       │
+#              ╰──────────────────────────────────────────────────────────╯
+
+
+def test_repo_context_link():
+    """Rendering a link is a plain string format of the precomputed values."""
+    ctx = RepoContext(base_url="https://github.com/org/repo", commit="abc123")
+
+    link = DefaultNeedLink()
+    link.file = Path("src/example.py")
+    link.line = 7
+
+    assert ctx.link(link) == "https://github.com/org/repo/blob/abc123/src/example.py#L7"
+
+
+def test_get_repo_context_from_metadata():
+    """Combo builds take base url & commit straight from the metadata."""
+    metadata = RepoInfo(name="repo", url="https://github.com/org/repo", hash="h1")
+
+    assert get_repo_context(metadata) == RepoContext(
+        base_url="https://github.com/org/repo", commit="h1"
+    )
+
+
+def test_local_repo_context_resolved_once(
+    git_repo: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Git is only asked once per build, not once per link."""
+    os.chdir(Path(git_repo).absolute())
+    reset_repo_contexts()
+
+    calls: list[Path] = []
+    original = helpers.get_current_git_hash
+
+    def counting_git_hash(git_root: Path) -> str:
+        calls.append(git_root)
+        return original(git_root)
+
+    monkeypatch.setattr(helpers, "get_current_git_hash", counting_git_hash)
+
+    metadata = RepoInfo(name="local_repo", url="", hash="")
+    links = [get_github_link(metadata, DefaultNeedLink()) for _ in range(5)]
+
+    assert len(calls) == 1
+    assert len(set(links)) == 1
+    assert resolve_local_repo_context().base_url == (
+        "https://github.com/test-user/test-repo"
+    )
+
+    # A new build starts from scratch
+    reset_repo_contexts()
+    _ = get_github_link(metadata, DefaultNeedLink())
+    assert len(calls) == 2
+
+
 def test_complete_workflow(known_good_json: Path):
     """Test complete workflow from path to GitHub link."""
 
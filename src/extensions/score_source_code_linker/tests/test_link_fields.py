@@ -0,0 +1,83 @@
+# *******************************************************************************
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0
+#
+# SPDX-License-Identifier: Apache-2.0
+# *******************************************************************************
+import json
+from pathlib import Path
+from unittest.mock import Mock
+
+from docutils import nodes
+from docutils.utils import new_document
+
+from src.extensions.score_source_code_linker.link_fields import (
+    FRAGMENT_DIR,
+    LinkRecord,
+    render_link_fields,
+    to_field_string,
+)
+
+
+def make_app(outdir: Path, threshold: int) -> Mock:
+    app = Mock()
+    app.outdir = outdir
+    app.builder.format = "html"
+    app.builder.get_target_uri.return_value = "requirements/index.html"
+    app.config.source_code_linker_summary_threshold = threshold
+    app.env.score_link_records = {}
+    return app
+
+
+def render(app: Mock, field: str, records: list[LinkRecord]) -> nodes.inline:
+    doctree = new_document("test")
+    field_node = nodes.inline(classes=[f"needs_{field}"])
+    field_node += nodes.Text(to_field_string(records))
+    doctree += field_node
+    app.env.score_link_records[to_field_string(records)] = records
+    render_link_fields(app, doctree, "requirements/index")
+    return field_node
+
+
+def test_links_below_threshold_are_rendered_as_references(tmp_path: Path):
+    records = [
+        LinkRecord("https://github.com/o/r/blob/abc/a.py#L1", "a.py:1"),
+        LinkRecord("https://github.com/o/r/blob/abc/b.py#L2", "b.py:2"),
+    ]
+    field_node = render(make_app(tmp_path, threshold=2), "source_code_link", records)
+
+    references = list(field_node.findall(nodes.reference))
+    assert [r["refuri"] for r in references] == [r.url for r in records]
+    assert not (tmp_path / FRAGMENT_DIR).exists()
+
+
+def test_links_above_threshold_are_summarised(tmp_path: Path):
+    records = [
+        LinkRecord(
+            f"https://github.com/o/r/blob/abc/test_{i % 2}.py#L{i}",
+            f"test_{i}",
+            repo="local_repo",
+            file=f"test_{i % 2}.py",
+            result="failed" if i == 0 else "passed",
+        )
+        for i in range(5)
+    ]
+    field_node = render(make_app(tmp_path, threshold=2), "testlink", records)
+
+    text = field_node.astext()
+    assert text.startswith("5 links (failed: 1, passed: 4): ")
+    assert "local_repo test_0.py: 3, test_1.py: 2" in text
+
+    # Only the link to the full list is rendered
+    (reference,) = field_node.findall(nodes.reference)
+    assert reference["refuri"].startswith(f"../{FRAGMENT_DIR}/")
+    fragment = tmp_path / reference["refuri"].removeprefix("../")
+    assert [r["name"] for r in json.loads(fragment.read_text())] == [
+        r.name for r in records
+    ]
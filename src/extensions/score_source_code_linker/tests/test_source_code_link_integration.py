@@ -569,6 +569,12 @@ def test_source_link_integration_ok(
             expected_test_link = make_test_link(example_test_link_text_all_ok[treq_id])
             actual_test_code_link = treq_info.get("testlink", "no test link")
             assert expected_test_link == actual_test_code_link, treq_id
+
+        # Links are rendered as references, not as their "url<>name" string form
+        html = (app.outdir / "index.html").read_text()
+        assert "&lt;&gt;" not in html
+        for link in example_source_link_text_all_ok["TREQ_ID_1"]:
+            assert f">{link.file}:{link.line}</a>" in html
     finally:
         app.cleanup()
 
@@ -589,5 +595,6 @@ def test_source_link_integration_non_existent_id(
             "src/bad_implementation.py:2: Could not find TREQ_ID_200 in documentation"
             in warnings
         )
+        assert "Did you mean: TREQ_ID_2" in warnings
     finally:
         app.cleanup()
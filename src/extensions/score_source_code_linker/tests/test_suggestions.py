@@ -0,0 +1,46 @@
+# *******************************************************************************
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0
+#
+# SPDX-License-Identifier: Apache-2.0
+# *******************************************************************************
+from src.extensions.score_source_code_linker.suggestions import TrigramIndex
+
+
+def test_suggest_renamed_need():
+    index = TrigramIndex(
+        [
+            "tool_req__docs_dd_link_source_code_link",
+            "tool_req__docs_test_link_testcase",
+            "tool_req__docs_common_attr_id",
+        ]
+    )
+    assert index.suggest("tool_req__docs_dd_link_source_code")[0] == (
+        "tool_req__docs_dd_link_source_code_link"
+    )
+
+
+def test_suggest_nothing_similar():
+    index = TrigramIndex(["tool_req__docs_test_link_testcase"])
+    assert index.suggest("feat_arc_sta__abc") == []
+
+
+def test_suggest_limit_and_order():
+    index = TrigramIndex(["REQ_ID_1", "REQ_ID_2", "REQ_ID_20", "OTHER"])
+    assert index.suggest("REQ_ID_200", limit=2) == ["REQ_ID_20", "REQ_ID_2"]
+
+
+def test_suggest_with_many_ids_sharing_a_prefix():
+    # Trigrams of the common prefix are not used to find candidates
+    ids = [f"tool_req__docs_generated_{i}" for i in range(1000)]
+    ids.append("tool_req__docs_metamodel_checks")
+    index = TrigramIndex(ids)
+    assert index.suggest("tool_req__docs_metamodel_check") == [
+        "tool_req__docs_metamodel_checks"
+    ]
@@ -48,7 +48,7 @@ from src.extensions.score_source_code_linker.testlink import (
     store_data_of_test_case_json,
     store_test_xml_parsed_json,
 )
-from src.helper_lib import find_ws_root
+from src.helper_lib import get_env_context
 
 logger = logging.get_logger(__name__)
 logger.setLevel("DEBUG")
@@ -264,7 +264,7 @@ def find_xml_files(search_path: Path) -> list[Path]:
 
 
 def find_test_folder(base_path: Path | None = None) -> Path | None:
-    ws_root = base_path if base_path is not None else find_ws_root()
+    ws_root = base_path if base_path is not None else get_env_context().ws_root
     assert ws_root is not None
     if os.path.isdir(ws_root / "tests-report"):
         return ws_root / "tests-report"
@@ -14,6 +14,8 @@
 import os
 import subprocess
 import sys
+from dataclasses import dataclass
+from functools import cached_property, lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -21,6 +23,8 @@ from python.runfiles import Runfiles
 from sphinx.config import Config
 from sphinx_needs.logging import get_logger
 
+from src.helper_lib.git_metadata import read_head_commit, read_remote_urls
+
 LOGGER = get_logger(__name__)
 
 
@@ -67,6 +71,54 @@ def find_git_root() -> Path | None:
     return git_root
 
 
+@dataclass(frozen=True)
+class EnvContext:
+    """
+    Everything extensions need to know about the environment they run in.
+
+    Computed once per process (see 'get_env_context'), so extensions do not
+    have to re-probe environment variables and the filesystem over and over.
+    """
+
+    ws_root: Path | None
+    git_root: Path | None
+
+    @cached_property
+    def runfiles_dir(self) -> Path:
+        # Lazy, as this exits the process if there are no runfiles at all.
+        # Not every consumer of the context needs them.
+        return get_runfiles_dir()
+
+
+@lru_cache
+def _env_context(
+    ws_dir: str | None, runfiles_dir: str | None, manifest: str | None, cwd: str
+) -> EnvContext:
+    # Arguments are only used as cache key. Within one build they never change,
+    # but tests (and tools embedding Sphinx) do switch directories & environments.
+    return EnvContext(
+        ws_root=find_ws_root(),
+        git_root=find_git_root(),
+    )
+
+
+def get_env_context() -> EnvContext:
+    """
+    Return the (cached) EnvContext of the current process.
+
+    Use this instead of calling 'find_ws_root', 'find_git_root' or
+    'get_runfiles_dir' directly.
+    """
+    ws_dir = os.environ.get("BUILD_WORKSPACE_DIRECTORY")
+    return _env_context(
+        ws_dir,
+        os.environ.get("RUNFILES_DIR"),
+        os.environ.get("RUNFILES_MANIFEST_FILE"),
+        # The working directory only matters when there is no workspace
+        "" if ws_dir else str(Path.cwd()),
+    )
+
+
 def parse_remote_git_output(str_line: str) -> str:
     """
     Parse git remote output and extract <user/org>/<repository> format.
@@ -85,8 +137,17 @@ def parse_remote_git_output(str_line: str) -> str:
         )
         return ""
 
-    url = parts[1]  # Get the URL part
+    return parse_remote_url(parts[1])
 
+
+def parse_remote_url(url: str) -> str:
+    """
+    Extract <user/org>/<repository> from a remote url.
+
+    Example:
+        Input:  'https://github.com/eclipse-score/docs-as-code.git'
+        Output: 'eclipse-score/docs-as-code'
+    """
     # Handle SSH vs HTTPS formats directly
     if url.startswith("git@"):
         path = url.split(":", 1)[-1]
@@ -100,6 +161,9 @@ def get_github_repo_info(git_root_cwd: Path) -> str:
     """
     Query git for the github remote repository (based on heuristic).
 
+    The remotes are read from '.git/config' directly, the git CLI is only used
+    for configs that can not be interpreted without it.
+
     Execution context behavior:
     - Works consistently across all contexts when given valid git directory
     - Fails only when input path has no git repository
@@ -110,21 +174,17 @@ def get_github_repo_info(git_root_cwd: Path) -> str:
     Returns:
         Repository in format 'user/repo' or 'org/repo'
     """
-    process = subprocess.run(
-        ["git", "remote", "-v"], capture_output=True, text=True, cwd=git_root_cwd
-    )
-    repo = ""
-    for line in process.stdout.split("\n"):
-        if "origin" in line and "(fetch)" in line:
-            repo = parse_remote_git_output(line)
-            break
+    remotes = read_remote_urls(git_root_cwd)
+    if remotes is None:
+        repo = _get_github_repo_info_from_cli(git_root_cwd)
+    elif "origin" in remotes:
+        repo = parse_remote_url(remotes["origin"])
+    elif remotes:
+        # Same as the CLI path: 'git remote -v' lists remotes sorted by name
+        LOGGER.info("Did not find origin remote name. Will now take the first one.")
+        repo = parse_remote_url(remotes[sorted(remotes)[0]])
     else:
-        # If we do not find 'origin' we just take the first line
-        LOGGER.info(
-            "Did not find origin remote name. Will now take first result from:"
-            + "'git remote -v'"
-        )
-        repo = parse_remote_git_output(process.stdout.split("\n")[0])
+        repo = ""
     assert repo != "", (
         "Remote repository is not defined. Make sure you have a remote set. "
         + "Check this via 'git remote -v'"
@@ -132,6 +192,21 @@ def get_github_repo_info(git_root_cwd: Path) -> str:
     return repo
 
 
+def _get_github_repo_info_from_cli(git_root_cwd: Path) -> str:
+    process = subprocess.run(
+        ["git", "remote", "-v"], capture_output=True, text=True, cwd=git_root_cwd
+    )
+    for line in process.stdout.split("\n"):
+        if "origin" in line and "(fetch)" in line:
+            return parse_remote_git_output(line)
+    # If we do not find 'origin' we just take the first line
+    LOGGER.info(
+        "Did not find origin remote name. Will now take first result from:"
+        + "'git remote -v'"
+    )
+    return parse_remote_git_output(process.stdout.split("\n")[0])
+
+
 def get_github_base_url() -> str:
     """
     Generate GitHub base URL for the current repository.
@@ -144,7 +219,7 @@ def get_github_base_url() -> str:
     Returns:
         GitHub URL in format 'https://github.com/user/repo'
     """
-    passed_git_root = find_git_root()
+    passed_git_root = get_env_context().git_root
     if passed_git_root is None:
         passed_git_root = Path()
     repo_info = get_github_repo_info(passed_git_root)
@@ -155,6 +230,9 @@ def get_current_git_hash(git_root: Path) -> str:
     """
     Get the current git commit hash.
 
+    HEAD is resolved from the '.git' directory directly (loose & packed refs,
+    worktrees). The git CLI is only used if that is not possible.
+
     Execution context behavior:
     - Works consistently across all contexts when given valid git directory
     - Fails only when input path has no git repository
@@ -165,6 +243,9 @@ def get_current_git_hash(git_root: Path) -> str:
     Returns:
         Full commit hash (40 character hex string)
     """
+    commit = read_head_commit(git_root)
+    if commit is not None:
+        return commit
     try:
         result = subprocess.run(
             ["git", "log", "-n", "1", "--pretty=format:%H"],
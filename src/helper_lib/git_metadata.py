@@ -0,0 +1,170 @@
+# *******************************************************************************
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0
+#
+# SPDX-License-Identifier: Apache-2.0
+# *******************************************************************************
+"""
+Read git metadata (current commit, remotes) straight from the '.git' directory.
+
+This avoids a fork/exec of the git binary per lookup and works in containers
+that do not ship git at all.
+Everything that is not understood here (e.g. config includes, url rewrites,
+reftable repositories) returns None, so callers can fall back to the git CLI.
+"""
+
+import re
+from pathlib import Path
+
+_SHA_RE = re.compile(r"^[0-9a-f]{40}$")
+_SECTION_RE = re.compile(r'^\[\s*([A-Za-z0-9.-]+)(?:\s+"((?:[^"\\]|\\.)*)")?\s*\]')
+
+# Symbolic refs can point to other symbolic refs. Git itself gives up at 5.
+_MAX_SYMREF_DEPTH = 5
+
+
+def _read_text(path: Path) -> str | None:
+    try:
+        return path.read_text(encoding="utf-8")
+    except (OSError, UnicodeDecodeError):
+        return None
+
+
+def resolve_git_dir(git_root: Path) -> Path | None:
+    """
+    Find the git directory belonging to a working tree.
+
+    Handles both normal checkouts ('.git' is a directory) and worktrees or
+    submodules ('.git' is a file containing 'gitdir: <path>').
+    """
+    dot_git = git_root / ".git"
+    if dot_git.is_dir():
+        return dot_git
+    content = _read_text(dot_git)
+    if content is None or not content.startswith("gitdir:"):
+        return None
+    git_dir = Path(content.removeprefix("gitdir:").strip())
+    if not git_dir.is_absolute():
+        git_dir = git_root / git_dir
+    return git_dir if git_dir.is_dir() else None
+
+
+def _common_dir(git_dir: Path) -> Path:
+    """Worktrees share refs, packed-refs and config with the main repository."""
+    content = _read_text(git_dir / "commondir")
+    if content is None:
+        return git_dir
+    common_dir = Path(content.strip())
+    if not common_dir.is_absolute():
+        common_dir = git_dir / common_dir
+    return common_dir
+
+
+def _read_packed_ref(common_dir: Path, ref: str) -> str | None:
+    content = _read_text(common_dir / "packed-refs")
+    if content is None:
+        return None
+    for line in content.splitlines():
+        # '#' starts the header, '^' marks the peeled value of an annotated tag
+        if not line or line.startswith(("#", "^")):
+            continue
+        sha, _, name = line.partition(" ")
+        if name == ref:
+            return sha
+    return None
+
+
+def _resolve_ref(git_dir: Path, ref: str) -> str | None:
+    common_dir = _common_dir(git_dir)
+    for _ in range(_MAX_SYMREF_DEPTH):
+        # Per-worktree refs (e.g. HEAD, refs/bisect) live in git_dir,
+        # everything else in the common dir. Loose refs win over packed ones.
+        content = _read_text(git_dir / ref) or _read_text(common_dir / ref)
+        value = content.strip() if content else _read_packed_ref(common_dir, ref)
+        if value is None:
+            # Unborn branch (no commits yet) or unknown ref storage
+            return None
+        if not value.startswith("ref:"):
+            return value if _SHA_RE.match(value) else None
+        ref = value.removeprefix("ref:").strip()
+    return None
+
+
+def read_head_commit(git_root: Path) -> str | None:
+    """
+    Return the commit hash HEAD points to, or None if it can not be determined
+    without the git binary.
+    """
+    git_dir = resolve_git_dir(git_root)
+    if git_dir is None:
+        return None
+    return _resolve_ref(git_dir, "HEAD")
+
+
+def _unquote(value: str) -> str:
+    """Strip inline comments and resolve the quoting rules of git config values."""
+    result: list[str] = []
+    in_quotes = False
+    i = 0
+    while i < len(value):
+        c = value[i]
+        if c == '"':
+            in_quotes = not in_quotes
+        elif c == "\\" and i + 1 < len(value):
+            i += 1
+            result.append({"n": "\n", "t": "\t", "b": "\b"}.get(value[i], value[i]))
+        elif c in "#;" and not in_quotes:
+            break
+        else:
+            result.append(c)
+        i += 1
+    return "".join(result).strip()
+
+
+def read_remote_urls(git_root: Path) -> dict[str, str] | None:
+    """
+    Return {remote name: url} as configured in '.git/config'.
+
+    Returns None for configs that need the git binary to be interpreted
+    correctly (includes and url rewrites), so the caller can fall back.
+    """
+    git_dir = resolve_git_dir(git_root)
+    if git_dir is None:
+        return None
+    content = _read_text(_common_dir(git_dir) / "config")
+    if content is None:
+        return None
+    return _parse_remotes(content)
+
+
+def _parse_remotes(config: str) -> dict[str, str] | None:
+    remotes: dict[str, str] = {}
+    section = ""
+    subsection: str | None = None
+    for raw_line in config.splitlines():
+        line = raw_line.strip()
+        if not line or line.startswith(("#", ";")):
+            continue
+        if line.startswith("["):
+            match = _SECTION_RE.match(line)
+            if match is None:
+                return None
+            section = match.group(1).lower()
+            subsection = match.group(2)
+            if section in ("include", "includeif", "url"):
+                return None
+            # A key/value pair may follow the section header on the same line
+            line = line[match.end() :].strip()
+        if section != "remote" or subsection is None:
+            continue
+        key, sep, value = line.partition("=")
+        if sep and key.strip().lower() == "url":
+            # Git uses the first url of a remote for fetching
+            remotes.setdefault(subsection, _unquote(value))
+    return remotes
@@ -0,0 +1,84 @@
+# *******************************************************************************
+# Copyright (c) 2025 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0
+#
+# SPDX-License-Identifier: Apache-2.0
+# *******************************************************************************
+"""
+Start independent, slow lookups (bazel query, git, JSON files) in the
+background during Sphinx startup, and wait for them only where they are used.
+
+Usage:
+    # at 'config-inited', after reset_prefetches()
+    prefetch("known_good", lambda: load(path))
+    ...
+    # where the value is needed
+    data = await_prefetched("known_good", lambda: load(path))
+
+'await_prefetched' falls back to calling the function directly, so consumers
+work the same whether or not something was prefetched.
+"""
+
+import threading
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Any
+
+_lock = threading.Lock()
+_executor: ThreadPoolExecutor | None = None
+_futures: dict[str, Future[Any]] = {}
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="prefetch")
+    return _executor
+
+
+def reset_prefetches(*_: object) -> None:
+    """
+    Forget the results of the previous build, e.g. in esbonio, so keys that are
+    not prefetched again are looked up afresh. Connect it to 'config-inited'
+    before any prefetch.
+    """
+    with _lock:
+        _futures.clear()
+
+
+def prefetch[T](key: str, fn: Callable[[], T]) -> None:
+    """
+    Start 'fn' in a background thread and remember its result under 'key'.
+    Prefetching the same key again (e.g. on the next esbonio build) restarts it.
+    """
+    with _lock:
+        _futures[key] = _get_executor().submit(fn)
+
+
+def await_prefetched[T](key: str, fn: Callable[[], T]) -> T:
+    """
+    Return the prefetched result of 'key', waiting for it if necessary.
+    If 'key' was never prefetched, 'fn' is called directly instead.
+    Exceptions of the background call are raised here.
+    """
+    with _lock:
+        future = _futures.get(key)
+    if future is None:
+        return fn()
+    return future.result()
+
+
+def wait_for_prefetches() -> None:
+    """
+    Block until all background lookups are done (successful or not).
+    Call this before Sphinx forks its parallel workers.
+    """
+    with _lock:
+        futures = list(_futures.values())
+    _ = wait(futures)
@@ -13,6 +13,7 @@
 import os
 import subprocess
 import tempfile
+import threading
 from pathlib import Path
 from typing import Any
 
@@ -21,10 +22,18 @@ import pytest
 from src.helper_lib import (
     config_setdefault,
     get_current_git_hash,
+    get_env_context,
     get_github_repo_info,
     get_runfiles_dir,
     parse_remote_git_output,
 )
+from src.helper_lib.git_metadata import read_head_commit, read_remote_urls
+from src.helper_lib.prefetch import (
+    await_prefetched,
+    prefetch,
+    reset_prefetches,
+    wait_for_prefetches,
+)
 
 
 class _FakeConfig:
@@ -314,3 +323,157 @@ def test_git_root_search_not_found(tmp_path: Path, monkeypatch: pytest.MonkeyPat
         get_runfiles_dir()
     assert "Could not find git root" in str(excinfo.value)
     os.environ.pop("RUNFILES_DIR", None)
+
+
+# Tests for the subprocess free git metadata reader
+def _git_rev_parse_head(git_dir: Path) -> str:
+    return subprocess.run(
+        ["git", "rev-parse", "HEAD"],
+        cwd=git_dir,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout.strip()
+
+
+def _no_git_binary(monkeypatch: pytest.MonkeyPatch):
+    """Make sure nothing falls back to the git CLI."""
+
+    def fail(*args: Any, **kwargs: Any):
+        raise AssertionError(f"git CLI must not be called: {args}")
+
+    monkeypatch.setattr(subprocess, "run", fail)
+
+
+def test_read_head_commit_loose_ref(git_repo: Path, monkeypatch: pytest.MonkeyPatch):
+    expected = _git_rev_parse_head(git_repo)
+    _no_git_binary(monkeypatch)
+    assert read_head_commit(git_repo) == expected
+    assert get_current_git_hash(git_repo) == expected
+
+
+def test_read_head_commit_packed_ref(git_repo: Path):
+    subprocess.run(["git", "pack-refs", "--all"], cwd=git_repo, check=True)
+    assert not any((git_repo / ".git" / "refs" / "heads").iterdir())
+    assert read_head_commit(git_repo) == _git_rev_parse_head(git_repo)
+
+
+def test_read_head_commit_detached_head(git_repo: Path):
+    expected = _git_rev_parse_head(git_repo)
+    subprocess.run(["git", "checkout", "--detach", "-q"], cwd=git_repo, check=True)
+    assert (git_repo / ".git" / "HEAD").read_text().strip() == expected
+    assert read_head_commit(git_repo) == expected
+
+
+def test_read_git_metadata_in_worktree(git_repo: Path, temp_dir: Path):
+    worktree = temp_dir / "worktree"
+    subprocess.run(
+        ["git", "worktree", "add", "-q", "-b", "wt", str(worktree)],
+        cwd=git_repo,
+        check=True,
+    )
+    assert (worktree / ".git").is_file()
+    assert read_head_commit(worktree) == _git_rev_parse_head(worktree)
+    assert read_remote_urls(worktree) == {
+        "origin": "git@github.com:test-user/test-repo.git"
+    }
+
+
+def test_read_head_commit_no_commits(temp_dir: Path):
+    subprocess.run(["git", "init", "-q"], cwd=temp_dir, check=True)
+    assert read_head_commit(temp_dir) is None
+
+
+def test_read_remote_urls_multiple_remotes(
+    git_repo_multiple_remotes: Path, monkeypatch: pytest.MonkeyPatch
+):
+    _no_git_binary(monkeypatch)
+    assert read_remote_urls(git_repo_multiple_remotes) == {
+        "upstream": "git@github.com:upstream/test-repo.git",
+        "origin": "git@github.com:test-user/test-repo.git",
+    }
+    assert get_github_repo_info(git_repo_multiple_remotes) == "test-user/test-repo"
+
+
+def test_read_remote_urls_falls_back_for_includes(git_repo: Path):
+    config = git_repo / ".git" / "config"
+    config.write_text(config.read_text() + '[include]\n\tpath = "other.cfg"\n')
+    assert read_remote_urls(git_repo) is None
+    # The CLI fallback still works
+    assert get_github_repo_info(git_repo) == "test-user/test-repo"
+
+
+def test_read_git_metadata_outside_repo(temp_dir: Path):
+    assert read_head_commit(temp_dir) is None
+    assert read_remote_urls(temp_dir) is None
+
+
+# Tests for the process wide environment context
+def test_env_context_ide_support(git_repo: Path, monkeypatch: pytest.MonkeyPatch):
+    for var in ("BUILD_WORKSPACE_DIRECTORY", "RUNFILES_DIR", "RUNFILES_MANIFEST_FILE"):
+        monkeypatch.delenv(var, raising=False)
+    docs_dir = git_repo / "docs"
+    docs_dir.mkdir()
+    os.chdir(docs_dir)
+
+    ctx = get_env_context()
+    assert ctx.ws_root is None
+    assert ctx.git_root == git_repo.resolve()
+
+
+def test_env_context_bazel_run(git_repo: Path, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("BUILD_WORKSPACE_DIRECTORY", str(git_repo))
+    ctx = get_env_context()
+    assert ctx.ws_root == git_repo
+    assert ctx.git_root == git_repo.resolve()
+
+
+def test_env_context_bazel_build(temp_dir: Path, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.delenv("BUILD_WORKSPACE_DIRECTORY", raising=False)
+    monkeypatch.setenv("RUNFILES_DIR", str(temp_dir))
+    os.chdir(temp_dir)
+    ctx = get_env_context()
+    assert ctx.runfiles_dir == temp_dir
+
+
+def test_env_context_is_computed_once(git_repo: Path, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("BUILD_WORKSPACE_DIRECTORY", str(git_repo))
+    first = get_env_context()
+    # The filesystem is not probed again for the same environment
+    (git_repo / ".git").rename(git_repo / ".git_moved")
+    assert get_env_context() is first
+
+
+def test_await_prefetched_returns_background_result():
+    started = threading.Event()
+
+    def slow_lookup() -> str:
+        started.set()
+        return "prefetched"
+
+    prefetch("test:result", slow_lookup)
+    assert started.wait(timeout=5)
+    # The fallback is not used once a prefetch was started
+    assert await_prefetched("test:result", lambda: "fallback") == "prefetched"
+
+
+def test_await_prefetched_without_prefetch_calls_function():
+    assert await_prefetched("test:never_prefetched", lambda: 42) == 42
+
+
+def test_prefetches_of_an_earlier_build_are_forgotten():
+    prefetch("test:earlier_build", lambda: "earlier")
+    wait_for_prefetches()
+
+    reset_prefetches()
+    assert await_prefetched("test:earlier_build", lambda: "fresh") == "fresh"
+
+
+def test_await_prefetched_reraises_errors():
+    def failing_lookup() -> str:
+        raise FileNotFoundError("missing.json")
+
+    prefetch("test:error", failing_lookup)
+    wait_for_prefetches()
+    with pytest.raises(FileNotFoundError):
+        _ = await_prefetched("test:error", lambda: "fallback")